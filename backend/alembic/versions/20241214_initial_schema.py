@@ -105,7 +105,7 @@ def upgrade() -> None:
     op.execute("""
         CREATE INDEX idx_chunks_embedding ON chunks 
         USING hnsw (embedding vector_cosine_ops)
-        WITH (m = 16, ef_construction = 64)
+        WITH (m = 24, ef_construction = 128)
     """)
 
     # Create full-text search index (tsvector)
@@ -0,0 +1,44 @@
+"""Rebuild chunk embedding HNSW index with denser graph parameters.
+
+Revision ID: 005_tune_hnsw_index
+Revises: 004_add_agent_executions
+Create Date: 2024-12-18
+
+Search transactions should widen the query-time candidate list with
+`SET LOCAL hnsw.ef_search = 100` (see src.utils.vector_index).
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005_tune_hnsw_index"
+down_revision: Union[str, None] = "004_add_agent_executions"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rebuild_embedding_index(m: int, ef_construction: int) -> None:
+    """Apply HNSW build parameters and rebuild the index without blocking writes."""
+    # REINDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute("SET maintenance_work_mem = '2GB'")
+        op.execute("SET max_parallel_maintenance_workers = 7")
+        op.execute(
+            f"ALTER INDEX idx_chunks_embedding SET (m = {m}, ef_construction = {ef_construction})"
+        )
+        op.execute("REINDEX INDEX CONCURRENTLY idx_chunks_embedding")
+        op.execute("RESET max_parallel_maintenance_workers")
+        op.execute("RESET maintenance_work_mem")
+
+
+def upgrade() -> None:
+    """Rebuild idx_chunks_embedding with m=24, ef_construction=128."""
+    _rebuild_embedding_index(m=24, ef_construction=128)
+
+
+def downgrade() -> None:
+    """Rebuild idx_chunks_embedding with m=16, ef_construction=64."""
+    _rebuild_embedding_index(m=16, ef_construction=64)
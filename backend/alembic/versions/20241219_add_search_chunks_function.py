@@ -0,0 +1,47 @@
+"""Add search_chunks SQL function with per-call hnsw.ef_search.
+
+Revision ID: 006_add_search_chunks_function
+Revises: 005_tune_hnsw_index
+Create Date: 2024-12-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006_add_search_chunks_function"
+down_revision: Union[str, None] = "005_tune_hnsw_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create search_chunks(query_embedding, k, ef) ANN function."""
+
+    # set_config(..., true) is SET LOCAL: the override ends with the caller's transaction
+    op.execute("""
+        CREATE OR REPLACE FUNCTION search_chunks(
+            query_embedding vector(1024),
+            k integer DEFAULT 10,
+            ef integer DEFAULT 100
+        )
+        RETURNS TABLE (chunk_id uuid, paper_id uuid, distance double precision)
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            PERFORM set_config('hnsw.ef_search', ef::text, true);
+            RETURN QUERY
+                SELECT c.id, c.paper_id, c.embedding <=> query_embedding
+                FROM chunks c
+                ORDER BY c.embedding <=> query_embedding
+                LIMIT k;
+        END;
+        $$
+    """)
+
+
+def downgrade() -> None:
+    """Drop search_chunks function."""
+    op.execute("DROP FUNCTION IF EXISTS search_chunks(vector, integer, integer)")
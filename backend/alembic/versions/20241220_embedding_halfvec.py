@@ -0,0 +1,86 @@
+"""Store chunk embeddings as halfvec(1024).
+
+Revision ID: 007_embedding_halfvec
+Revises: 006_add_search_chunks_function
+Create Date: 2024-12-20
+
+Half-precision embeddings halve table and HNSW index size, and the bytes
+read per distance computation, with negligible recall loss. The column
+rewrite locks the table, but the HNSW rebuild runs CONCURRENTLY afterwards
+so writes resume while the graph is built.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007_embedding_halfvec"
+down_revision: Union[str, None] = "006_add_search_chunks_function"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_search_chunks(vector_type: str) -> None:
+    """(Re)create search_chunks for the given embedding column type."""
+    op.execute(f"""
+        CREATE FUNCTION search_chunks(
+            query_embedding {vector_type}(1024),
+            k integer DEFAULT 10,
+            ef integer DEFAULT 100
+        )
+        RETURNS TABLE (chunk_id uuid, paper_id uuid, distance double precision)
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            PERFORM set_config('hnsw.ef_search', ef::text, true);
+            RETURN QUERY
+                SELECT c.id, c.paper_id, c.embedding <=> query_embedding
+                FROM chunks c
+                ORDER BY c.embedding <=> query_embedding
+                LIMIT k;
+        END;
+        $$
+    """)
+
+
+def _create_embedding_index(opclass: str) -> None:
+    """Build idx_chunks_embedding without blocking writes."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(f"""
+            CREATE INDEX CONCURRENTLY idx_chunks_embedding ON chunks
+            USING hnsw (embedding {opclass})
+            WITH (m = 24, ef_construction = 128)
+        """)
+
+
+def upgrade() -> None:
+    """Convert embedding column and HNSW index to halfvec."""
+    op.execute("DROP FUNCTION IF EXISTS search_chunks(vector, integer, integer)")
+    op.execute("DROP INDEX IF EXISTS idx_chunks_embedding")
+
+    op.execute("""
+        ALTER TABLE chunks
+        ALTER COLUMN embedding TYPE halfvec(1024)
+        USING embedding::halfvec(1024)
+    """)
+
+    _create_search_chunks("halfvec")
+    _create_embedding_index("halfvec_cosine_ops")
+
+
+def downgrade() -> None:
+    """Convert embedding column and HNSW index back to full-precision vector."""
+    op.execute("DROP FUNCTION IF EXISTS search_chunks(halfvec, integer, integer)")
+    op.execute("DROP INDEX IF EXISTS idx_chunks_embedding")
+
+    op.execute("""
+        ALTER TABLE chunks
+        ALTER COLUMN embedding TYPE vector(1024)
+        USING embedding::vector(1024)
+    """)
+
+    _create_search_chunks("vector")
+    _create_embedding_index("vector_cosine_ops")
@@ -0,0 +1,38 @@
+"""Add binary-quantized HNSW index on chunk embeddings.
+
+Revision ID: 008_add_binary_quantized_index
+Revises: 007_embedding_halfvec
+Create Date: 2024-12-21
+
+The expression index stores 1 bit per dimension (128 bytes per 1024-dim
+vector) and is searched with Hamming distance; results are re-ranked by
+exact cosine distance on the halfvec column.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008_add_binary_quantized_index"
+down_revision: Union[str, None] = "007_embedding_halfvec"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create idx_chunks_embedding_bq without blocking writes."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY idx_chunks_embedding_bq ON chunks
+            USING hnsw ((binary_quantize(embedding)::bit(1024)) bit_hamming_ops)
+            WITH (m = 24, ef_construction = 128)
+        """)
+
+
+def downgrade() -> None:
+    """Drop idx_chunks_embedding_bq."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_chunks_embedding_bq")
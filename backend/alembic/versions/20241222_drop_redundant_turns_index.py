@@ -0,0 +1,41 @@
+"""Drop the redundant conversation_id index on conversation_turns.
+
+Revision ID: 009_drop_redundant_turns_index
+Revises: 008_add_binary_quantized_index
+Create Date: 2024-12-22
+
+The unique (conversation_id, turn_number) index already serves lookups by
+conversation_id through its leading column, and answers the max/count turn
+probes with index-only scans. user_query and agent_response are not added as
+INCLUDE columns: btree entries are capped at roughly 2.7 KB, so long agent
+responses would make inserts fail.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009_drop_redundant_turns_index"
+down_revision: Union[str, None] = "008_add_binary_quantized_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop idx_conversation_turns_conversation_id without blocking writes."""
+    # DROP INDEX CONCURRENTLY and VACUUM cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_conversation_turns_conversation_id")
+        # Refresh the visibility map so turn probes stay index-only
+        op.execute("VACUUM ANALYZE conversation_turns")
+
+
+def downgrade() -> None:
+    """Recreate idx_conversation_turns_conversation_id."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_conversation_turns_conversation_id "
+            "ON conversation_turns (conversation_id)"
+        )
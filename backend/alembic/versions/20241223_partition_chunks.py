@@ -0,0 +1,106 @@
+"""Hash-partition chunks by paper_id.
+
+Revision ID: 010_partition_chunks
+Revises: 009_drop_redundant_turns_index
+Create Date: 2024-12-23
+
+Each partition gets its own local HNSW graphs, small enough to be built
+within maintenance_work_mem; cross-paper searches merge the per-partition
+index scans and paper_id filters prune to a single partition.
+
+The table is rewritten under an exclusive lock, so run this revision in a
+maintenance window.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010_partition_chunks"
+down_revision: Union[str, None] = "009_drop_redundant_turns_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONS = 16
+
+# Columns copied between table layouts; search_vector is generated
+COLUMNS = (
+    "id, paper_id, arxiv_id, chunk_text, chunk_index, section_name, "
+    "page_number, word_count, embedding, created_at"
+)
+
+
+def _create_table(name: str, partition_by: str = "") -> None:
+    """Create a chunks table with the current column layout."""
+    op.execute(f"""
+        CREATE TABLE {name} (
+            id uuid NOT NULL,
+            paper_id uuid NOT NULL,
+            arxiv_id varchar(50) NOT NULL,
+            chunk_text text NOT NULL,
+            chunk_index integer NOT NULL,
+            section_name varchar(255),
+            page_number integer,
+            word_count integer,
+            embedding halfvec(1024) NOT NULL,
+            created_at timestamptz DEFAULT now(),
+            search_vector tsvector
+                GENERATED ALWAYS AS (to_tsvector('english', chunk_text)) STORED
+        ) {partition_by}
+    """)
+
+
+def _swap_tables(new_table: str, primary_key: str) -> None:
+    """Copy rows into new_table, replace chunks with it and rebuild indexes."""
+    op.execute(f"INSERT INTO {new_table} ({COLUMNS}) SELECT {COLUMNS} FROM chunks")
+    op.execute("DROP TABLE chunks")
+    op.execute(f"ALTER TABLE {new_table} RENAME TO chunks")
+
+    op.execute(f"ALTER TABLE chunks ADD CONSTRAINT chunks_pkey PRIMARY KEY ({primary_key})")
+    op.execute("""
+        ALTER TABLE chunks ADD CONSTRAINT chunks_paper_id_fkey
+        FOREIGN KEY (paper_id) REFERENCES papers (id) ON DELETE CASCADE
+    """)
+
+    op.execute("CREATE INDEX idx_chunks_paper_id ON chunks (paper_id)")
+    op.execute("CREATE INDEX idx_chunks_arxiv_id ON chunks (arxiv_id)")
+    op.execute(
+        "CREATE UNIQUE INDEX idx_chunks_paper_chunk_unique ON chunks (paper_id, chunk_index)"
+    )
+    op.execute("CREATE INDEX idx_chunks_search_vector ON chunks USING gin (search_vector)")
+
+    op.execute("SET LOCAL maintenance_work_mem = '2GB'")
+    op.execute("SET LOCAL max_parallel_maintenance_workers = 7")
+    op.execute("""
+        CREATE INDEX idx_chunks_embedding ON chunks
+        USING hnsw (embedding halfvec_cosine_ops)
+        WITH (m = 24, ef_construction = 128)
+    """)
+    op.execute("""
+        CREATE INDEX idx_chunks_embedding_bq ON chunks
+        USING hnsw ((binary_quantize(embedding)::bit(1024)) bit_hamming_ops)
+        WITH (m = 24, ef_construction = 128)
+    """)
+    op.execute("ANALYZE chunks")
+
+
+def upgrade() -> None:
+    """Rebuild chunks as a hash-partitioned table."""
+    _create_table("chunks_partitioned", partition_by="PARTITION BY HASH (paper_id)")
+    for remainder in range(PARTITIONS):
+        op.execute(f"""
+            CREATE TABLE chunks_p{remainder} PARTITION OF chunks_partitioned
+            FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})
+        """)
+
+    # Indexes created on the parent cascade to a local index per partition;
+    # the primary key must include the partition key
+    _swap_tables("chunks_partitioned", primary_key="id, paper_id")
+
+
+def downgrade() -> None:
+    """Rebuild chunks as a single unpartitioned table."""
+    _create_table("chunks_unpartitioned")
+    _swap_tables("chunks_unpartitioned", primary_key="id")
@@ -0,0 +1,56 @@
+"""Disable the GIN pending list on the chunk full-text index.
+
+Revision ID: 011_gin_fastupdate_off
+Revises: 010_partition_chunks
+Create Date: 2024-12-24
+
+With fastupdate on, new entries collect in an unsorted pending list that
+every search must scan until it is merged, which causes latency spikes.
+With it off, inserts update the index directly and searches never hit the
+pending list. For large COPY backfills, turn it back on for the load window
+and off again afterwards.
+
+Storage parameters cannot be set on a partitioned index, so each
+partition's index is altered and its pending list flushed.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011_gin_fastupdate_off"
+down_revision: Union[str, None] = "010_partition_chunks"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _set_fastupdate(value: str) -> None:
+    """Set fastupdate on every partition of idx_chunks_search_vector."""
+    flush = "PERFORM gin_clean_pending_list(idx);" if value == "off" else ""
+    op.execute(f"""
+        DO $$
+        DECLARE
+            idx regclass;
+        BEGIN
+            FOR idx IN
+                SELECT inhrelid::regclass FROM pg_inherits
+                WHERE inhparent = 'idx_chunks_search_vector'::regclass
+            LOOP
+                EXECUTE format('ALTER INDEX %s SET (fastupdate = {value})', idx);
+                {flush}
+            END LOOP;
+        END
+        $$
+    """)
+
+
+def upgrade() -> None:
+    """Turn fastupdate off and merge pending entries into the index."""
+    _set_fastupdate("off")
+
+
+def downgrade() -> None:
+    """Restore the default fastupdate = on."""
+    _set_fastupdate("on")
@@ -0,0 +1,45 @@
+"""Cover chunk metadata in the (paper_id, chunk_index) unique index.
+
+Revision ID: 012_covering_paper_chunk_index
+Revises: 011_gin_fastupdate_off
+Create Date: 2024-12-25
+
+INCLUDE stores section_name, page_number and word_count in the index leaf
+tuples, so per-paper chunk outlines are answered by an index-only scan
+without heap visits. chunk_text is left out: a ~600-word chunk exceeds the
+B-tree tuple size limit (about 2.7 kB) and would make inserts fail.
+
+Index-only scans rely on the visibility map, so run VACUUM ANALYZE chunks
+after upgrading (VACUUM cannot run inside the migration's transaction).
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012_covering_paper_chunk_index"
+down_revision: Union[str, None] = "011_gin_fastupdate_off"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _recreate_index(include: str = "") -> None:
+    """Rebuild idx_chunks_paper_chunk_unique, optionally with INCLUDE columns."""
+    op.execute("DROP INDEX IF EXISTS idx_chunks_paper_chunk_unique")
+    op.execute(f"""
+        CREATE UNIQUE INDEX idx_chunks_paper_chunk_unique
+        ON chunks (paper_id, chunk_index) {include}
+    """)
+    op.execute("ANALYZE chunks")
+
+
+def upgrade() -> None:
+    """Add the metadata columns to the unique index."""
+    _recreate_index("INCLUDE (section_name, page_number, word_count)")
+
+
+def downgrade() -> None:
+    """Restore the key-only unique index."""
+    _recreate_index()
@@ -0,0 +1,36 @@
+"""Generate primary key UUIDs in the database.
+
+Revision ID: 013_server_generated_uuids
+Revises: 012_covering_paper_chunk_index
+Create Date: 2024-12-26
+
+Primary keys default to gen_random_uuid() (built in since PostgreSQL 13),
+so inserts and COPY loads no longer build a UUID per row in Python and
+send it with the row. The ORM reads generated ids back through RETURNING.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "013_server_generated_uuids"
+down_revision: Union[str, None] = "012_covering_paper_chunk_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Setting the default on partitioned chunks applies it to every partition
+TABLES = ("papers", "chunks", "conversations", "conversation_turns", "agent_executions")
+
+
+def upgrade() -> None:
+    """Default each primary key to gen_random_uuid()."""
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+
+def downgrade() -> None:
+    """Go back to ids supplied by the application."""
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
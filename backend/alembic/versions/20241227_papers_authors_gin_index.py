@@ -0,0 +1,37 @@
+"""Add a GIN index for author containment filters.
+
+Revision ID: 014_papers_authors_gin_index
+Revises: 013_server_generated_uuids
+Create Date: 2024-12-27
+
+Paper listing filters categories and authors with jsonb @> containment.
+idx_papers_categories already serves categories; this adds the matching
+jsonb_path_ops index on authors.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "014_papers_authors_gin_index"
+down_revision: Union[str, None] = "013_server_generated_uuids"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the authors GIN index."""
+    op.create_index(
+        "idx_papers_authors",
+        "papers",
+        ["authors"],
+        postgresql_using="gin",
+        postgresql_ops={"authors": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Drop the authors GIN index."""
+    op.drop_index("idx_papers_authors", table_name="papers")
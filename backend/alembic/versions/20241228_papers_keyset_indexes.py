@@ -0,0 +1,35 @@
+"""Add composite indexes for keyset pagination of papers.
+
+Revision ID: 015_papers_keyset_indexes
+Revises: 014_papers_authors_gin_index
+Create Date: 2024-12-28
+
+Paper listing pages with WHERE (sort_column, id) < (:value, :id) ORDER BY
+sort_column, id. A btree on (sort_column, id) serves both the seek and the
+ordering in either direction, for each column the listing can sort by.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "015_papers_keyset_indexes"
+down_revision: Union[str, None] = "014_papers_authors_gin_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SORT_COLUMNS = ("created_at", "updated_at", "published_date")
+
+
+def upgrade() -> None:
+    """Create a (sort column, id) index per sortable column."""
+    for column in SORT_COLUMNS:
+        op.create_index(f"idx_papers_{column}_id", "papers", [column, "id"])
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination indexes."""
+    for column in SORT_COLUMNS:
+        op.drop_index(f"idx_papers_{column}_id", table_name="papers")
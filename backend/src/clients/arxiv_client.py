@@ -1,9 +1,12 @@
 """arXiv API client for fetching papers and PDFs."""
 
 import asyncio
-from typing import List, Optional
+import re
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterator, List, Optional, Sequence, Tuple, cast
 from datetime import datetime, timezone
-import arxiv
 import httpx
 from pathlib import Path
 
@@ -11,12 +14,71 @@ from src.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# Bytes read per chunk when streaming PDFs to disk
+PDF_CHUNK_SIZE = 64 * 1024
+
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+
+# Last segment of an entry URL, without the version suffix
+_ARXIV_ID_RE = re.compile(r"/([^/]+?)(?:v\d+)?$")
+
+
+@dataclass
+class AtomAuthor:
+    """Author of an arXiv Atom entry."""
+
+    name: str
+
+
+@dataclass
+class AtomEntry:
+    """arXiv Atom entry exposing the arxiv.Result fields used by ArxivPaper."""
+
+    entry_id: str
+    title: str
+    authors: List[AtomAuthor]
+    summary: str
+    categories: List[str]
+    published: datetime
+    updated: datetime
+    pdf_url: Optional[str]
+
+    @classmethod
+    def from_element(cls, element: ET.Element) -> "AtomEntry":
+        """Build an entry from a parsed <entry> element."""
+        pdf_url = None
+        for link in element.iterfind(f"{_ATOM}link"):
+            if link.get("title") == "pdf":
+                pdf_url = link.get("href")
+                break
+
+        return cls(
+            entry_id=element.findtext(f"{_ATOM}id", ""),
+            title=" ".join(element.findtext(f"{_ATOM}title", "").split()),
+            authors=[
+                AtomAuthor(name=author.findtext(f"{_ATOM}name", ""))
+                for author in element.iterfind(f"{_ATOM}author")
+            ],
+            summary=element.findtext(f"{_ATOM}summary", ""),
+            categories=[
+                term
+                for category in element.iterfind(f"{_ATOM}category")
+                if (term := category.get("term"))
+            ],
+            published=datetime.fromisoformat(element.findtext(f"{_ATOM}published", "")),
+            updated=datetime.fromisoformat(element.findtext(f"{_ATOM}updated", "")),
+            pdf_url=pdf_url,
+        )
+
 
 class ArxivPaper:
     """arXiv paper metadata."""
 
-    def __init__(self, entry: arxiv.Result):
-        self.arxiv_id = entry.entry_id.split("/")[-1].split("v")[0]
+    def __init__(self, entry: AtomEntry):
+        match = _ARXIV_ID_RE.search(entry.entry_id)
+        self.arxiv_id = match.group(1) if match else entry.entry_id
         self.title = entry.title
         self.authors = [author.name for author in entry.authors]
         self.abstract = entry.summary
@@ -29,15 +91,74 @@ class ArxivPaper:
 class ArxivClient:
     """Client for interacting with arXiv API."""
 
-    def __init__(self, rate_limit_delay: float = 3.0):
+    def __init__(self, rate_limit_delay: float = 3.0, max_concurrent_downloads: int = 8):
         """
         Initialize arXiv client.
 
         Args:
             rate_limit_delay: Seconds to wait between requests (arXiv guideline: 3s)
+            max_concurrent_downloads: Maximum PDF downloads in flight at once
         """
         self.rate_limit_delay = rate_limit_delay
-        self.client = arxiv.Client()
+        self.max_concurrent_downloads = max_concurrent_downloads
+
+        # Shared pool so API queries and PDF downloads reuse TCP/TLS connections
+        self.http_client = httpx.AsyncClient(
+            timeout=60.0,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_concurrent_downloads,
+                max_keepalive_connections=max_concurrent_downloads,
+            ),
+        )
+
+        # Earliest monotonic time the next request may start
+        self._next_request_at = 0.0
+        self._throttle_lock = asyncio.Lock()
+
+    async def _throttle(self) -> None:
+        """Space request starts at least rate_limit_delay seconds apart."""
+        async with self._throttle_lock:
+            wait = self._next_request_at - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_request_at = time.monotonic() + self.rate_limit_delay
+
+    async def _query(self, params: dict) -> AsyncIterator[AtomEntry]:
+        """
+        Query the arXiv API, yielding entries as the Atom feed streams in.
+
+        Args:
+            params: Query string parameters for the API endpoint
+
+        Yields:
+            AtomEntry for each <entry> in the response
+        """
+        await self._throttle()
+        parser = ET.XMLPullParser(events=("end",))
+
+        async with self.http_client.stream("GET", ARXIV_API_URL, params=params) as response:
+            response.raise_for_status()
+
+            async for chunk in response.aiter_bytes():
+                parser.feed(chunk)
+                # Only "end" events were requested, so every event carries an Element
+                events = cast(Iterator[Tuple[str, ET.Element]], parser.read_events())
+                for _, element in events:
+                    if element.tag != f"{_ATOM}entry":
+                        continue
+                    # API errors come back as an entry without a publication date
+                    if element.find(f"{_ATOM}published") is None:
+                        log.warning("arxiv api error", detail=element.findtext(f"{_ATOM}summary"))
+                    else:
+                        yield AtomEntry.from_element(element)
+                    element.clear()
+
+        parser.close()
+
+    async def close(self) -> None:
+        """Close the shared HTTP connection pool."""
+        await self.http_client.aclose()
 
     async def search_papers(
         self,
@@ -68,32 +189,24 @@ class ArxivClient:
 
         log.debug("arxiv search", query=full_query, max_results=max_results)
 
-        search = arxiv.Search(
-            query=full_query,
-            max_results=max_results,
-            sort_by=arxiv.SortCriterion.Relevance,
+        params = {"search_query": full_query, "max_results": max_results, "sortBy": "relevance"}
+        start_dt = (
+            datetime.fromisoformat(start_date).replace(tzinfo=timezone.utc) if start_date else None
         )
-
+        end_dt = datetime.fromisoformat(end_date).replace(tzinfo=timezone.utc) if end_date else None
         results = []
-        loop = asyncio.get_event_loop()
 
-        for result in await loop.run_in_executor(None, lambda: list(self.client.results(search))):
-            paper = ArxivPaper(result)
+        async for entry in self._query(params):
+            paper = ArxivPaper(entry)
 
-            if start_date:
-                start_dt = datetime.fromisoformat(start_date).replace(tzinfo=timezone.utc)
-                if paper.published_date < start_dt:
-                    continue
-            if end_date:
-                end_dt = datetime.fromisoformat(end_date).replace(tzinfo=timezone.utc)
-                if paper.published_date > end_dt:
-                    continue
+            if start_dt and paper.published_date < start_dt:
+                continue
+            if end_dt and paper.published_date > end_dt:
+                continue
 
             results.append(paper)
             log.debug("arxiv paper found", arxiv_id=paper.arxiv_id, title=paper.title[:60])
 
-            await asyncio.sleep(self.rate_limit_delay)
-
         log.info("arxiv search complete", query=query[:50], results=len(results))
         return results
 
@@ -112,16 +225,47 @@ class ArxivClient:
 
         log.debug("downloading pdf", url=pdf_url)
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(pdf_url, follow_redirects=True)
+        await self._throttle()
+        size = 0
+
+        # Stream to disk so memory per download stays at one chunk, not the whole PDF
+        async with self.http_client.stream("GET", pdf_url) as response:
             response.raise_for_status()
 
             with open(save_path, "wb") as f:
-                f.write(response.content)
+                async for chunk in response.aiter_bytes(PDF_CHUNK_SIZE):
+                    f.write(chunk)
+                    size += len(chunk)
 
-        log.debug("pdf downloaded", path=save_path, size_kb=len(response.content) // 1024)
+        log.debug("pdf downloaded", path=save_path, size_kb=size // 1024)
         return save_path
 
+    async def download_pdfs_bulk(
+        self, downloads: Sequence[Tuple[str, str]]
+    ) -> List[str | BaseException]:
+        """
+        Download several PDFs concurrently over the shared connection pool.
+
+        Request starts stay rate limited; at most max_concurrent_downloads
+        transfers overlap.
+
+        Args:
+            downloads: (pdf_url, save_path) pairs
+
+        Returns:
+            Saved path or the raised exception for each download, in input order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_downloads)
+
+        async def download(pdf_url: str, save_path: str) -> str:
+            async with semaphore:
+                return await self.download_pdf(pdf_url, save_path)
+
+        log.debug("bulk pdf download", count=len(downloads))
+        return await asyncio.gather(
+            *(download(url, path) for url, path in downloads), return_exceptions=True
+        )
+
     async def get_papers_by_ids(self, arxiv_ids: List[str]) -> List[ArxivPaper]:
         """
         Fetch papers by arXiv IDs.
@@ -134,15 +278,14 @@ class ArxivClient:
         """
         log.debug("arxiv fetch by ids", count=len(arxiv_ids))
 
-        search = arxiv.Search(id_list=arxiv_ids)
+        # The API returns 10 results unless max_results is given, even for id_list
+        params = {"id_list": ",".join(arxiv_ids), "max_results": len(arxiv_ids)}
         results = []
-        loop = asyncio.get_event_loop()
 
-        for result in await loop.run_in_executor(None, lambda: list(self.client.results(search))):
-            paper = ArxivPaper(result)
+        async for entry in self._query(params):
+            paper = ArxivPaper(entry)
             results.append(paper)
             log.debug("arxiv paper fetched", arxiv_id=paper.arxiv_id)
-            await asyncio.sleep(self.rate_limit_delay)
 
         log.info("arxiv id fetch complete", requested=len(arxiv_ids), found=len(results))
         return results
@@ -1,13 +1,64 @@
 """Abstract base class for LLM providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, AsyncIterator, Type, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, AsyncIterator, Tuple, Type, Optional, cast
+from openai import pydantic_function_tool
 from pydantic import BaseModel
 
+from src.utils.llm_cache import LLMResponseCache, SemanticCache
+from src.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+@lru_cache(maxsize=64)
+def structured_response_format(response_format: Type[BaseModel]) -> dict:
+    """
+    Build a strict json_schema response_format for a Pydantic model.
+
+    Schema generation walks the whole model, so the result is cached per class.
+
+    Args:
+        response_format: Pydantic model class for response schema
+
+    Returns:
+        response_format parameter for chat.completions.create
+    """
+    # The SDK's public helper for function tools builds the same strict schema
+    # that json_schema response formats take
+    function = pydantic_function_tool(response_format)["function"]
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": function["name"],
+            "schema": function.get("parameters"),
+            "strict": True,
+        },
+    }
+
 
 class BaseLLMClient(ABC):
     """Abstract base class for LLM providers."""
 
+    def __init__(
+        self,
+        cache: Optional[LLMResponseCache] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+    ):
+        """
+        Initialize the response caches shared by every provider.
+
+        Args:
+            cache: Response cache for deterministic requests (disabled if None)
+            semantic_cache: Similarity cache for completions (disabled if None)
+        """
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        # Deterministic requests currently awaiting the API, by cache key
+        self._inflight: Dict[str, asyncio.Future[str]] = {}
+
     @property
     @abstractmethod
     def provider_name(self) -> str:
@@ -50,6 +101,7 @@ class BaseLLMClient(ABC):
         messages: List[dict],
         response_format: Type[BaseModel],
         model: Optional[str] = None,
+        temperature: Optional[float] = None,
     ) -> BaseModel:
         """
         Generate structured output using provider's structured outputs API.
@@ -58,8 +110,205 @@ class BaseLLMClient(ABC):
             messages: List of message dicts
             response_format: Pydantic model class for response schema
             model: Model to use (overrides default)
+            temperature: Sampling temperature (provider default if None)
+
+        Returns:
+            Instance of response_format Pydantic model
+        """
+        pass
+
+    @abstractmethod
+    async def _create_completion(
+        self,
+        messages: List[Any],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """Call the provider's API for one non-streaming completion."""
+        pass
+
+    @abstractmethod
+    async def _create_structured(
+        self,
+        messages: List[Any],
+        model: str,
+        response_format: Dict[str, Any],
+        temperature: Optional[float],
+    ) -> Optional[str]:
+        """Call the provider's API for one structured completion, returning the raw JSON."""
+        pass
+
+    async def _cached_completion(
+        self,
+        messages: List[Any],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """
+        Generate a non-streaming completion through the response caches.
+
+        Args:
+            messages: List of message dicts
+            model: Model to use
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Completion text
+        """
+        # Only temperature 0 requests are deterministic enough to replay or share
+        if temperature != 0:
+            return await self._fill_caches(messages, model, temperature, max_tokens)
+
+        cache_key = LLMResponseCache.make_key(
+            self.provider_name, model, messages, temperature, max_tokens
+        )
+        if self.cache is not None:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Identical concurrent requests share one API call, keyed like the
+        # response cache; shield it so a cancelled caller doesn't cancel the others
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._fill_caches(messages, model, temperature, max_tokens, cache_key)
+            )
+            self._inflight[cache_key] = task
+
+            def finish(done: asyncio.Future[str]) -> None:
+                self._inflight.pop(cache_key, None)
+                # Every caller may have been cancelled; read the error so
+                # asyncio doesn't report it as never retrieved
+                if not done.cancelled():
+                    done.exception()
+
+            task.add_done_callback(finish)
+        else:
+            log.debug("llm request joined in-flight call", provider=self.provider_name, model=model)
+        return await asyncio.shield(task)
+
+    async def _fill_caches(
+        self,
+        messages: List[Any],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        cache_key: Optional[str] = None,
+    ) -> str:
+        """Generate a non-streaming completion, consulting and filling the caches."""
+        semantic_slot = None
+        if self.semantic_cache is not None:
+            cached, semantic_slot = await self.semantic_cache.lookup(
+                self.provider_name, model, messages, temperature, max_tokens
+            )
+            if cached is not None:
+                return cached
+
+        content = await self._create_completion(messages, model, temperature, max_tokens)
+
+        if self.cache is not None and cache_key is not None:
+            await self.cache.set(cache_key, content)
+        if self.semantic_cache is not None and semantic_slot is not None:
+            self.semantic_cache.store(semantic_slot, content)
+
+        return content
+
+    async def _cached_structured(
+        self,
+        messages: List[Any],
+        response_format: Type[BaseModel],
+        model: str,
+        temperature: Optional[float],
+    ) -> BaseModel:
+        """
+        Generate structured output through the response cache.
+
+        Args:
+            messages: List of message dicts
+            response_format: Pydantic model class for response schema
+            model: Model to use
+            temperature: Sampling temperature (provider default if None)
 
         Returns:
             Instance of response_format Pydantic model
         """
+        schema = structured_response_format(response_format)
+
+        # Only temperature 0 requests are deterministic enough to replay
+        cache_key = None
+        if self.cache is not None and temperature == 0:
+            cache_key = self.cache.make_key(
+                self.provider_name,
+                model,
+                messages,
+                temperature,
+                response_format=schema,
+            )
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return response_format.model_validate_json(cached)
+
+        content = await self._create_structured(messages, model, schema, temperature)
+        if not content:
+            raise ValueError("Failed to parse response")
+        parsed = response_format.model_validate_json(content)
+
+        log.debug("llm structured response", provider=self.provider_name, parsed=str(parsed)[:500])
+
+        if self.cache is not None and cache_key is not None:
+            await self.cache.set(cache_key, content)
+
+        return parsed
+
+    async def generate_completions_batch(
+        self,
+        messages_batch: List[List[dict]],
+        model: Optional[str] = None,
+        temperature: float = 0.3,
+        max_tokens: int = 1000,
+        concurrency: int = 4,
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Generate several completions concurrently, yielding each as it finishes.
+
+        Results arrive in completion order rather than input order, so callers
+        can start on the fastest responses while slower ones are still running.
+        Pending requests are cancelled if the caller stops iterating early.
+
+        Args:
+            messages_batch: One message list per completion
+            model: Model to use (overrides default)
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum tokens to generate per completion
+            concurrency: Maximum requests in flight at once
+
+        Yields:
+            (index into messages_batch, completion text)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def complete(index: int, messages: List[dict]) -> Tuple[int, str]:
+            async with semaphore:
+                content = await self.generate_completion(
+                    messages, model=model, temperature=temperature, max_tokens=max_tokens
+                )
+                return index, cast(str, content)
+
+        tasks = [
+            asyncio.create_task(complete(index, messages))
+            for index, messages in enumerate(messages_batch)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def warm_up(self) -> None:
+        """Open a pooled connection to the provider ahead of the first request."""
         pass
@@ -1,28 +1,50 @@
 """Z.AI API client using OpenAI-compatible interface."""
 
-from typing import List, AsyncIterator, Type, Optional, Any, cast
+import logging
+from typing import Dict, List, AsyncIterator, Type, Optional, Any, cast
+import httpx
 from pydantic import BaseModel
 from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionMessageParam
 
 from src.clients.base_llm_client import BaseLLMClient
+from src.utils.llm_cache import LLMResponseCache, SemanticCache
 from src.utils.logger import get_logger, truncate
+from src.utils.streaming import coalesce_stream
 
 log = get_logger(__name__)
 
+# Seconds to wait for the startup warm-up request
+WARM_UP_TIMEOUT = 5.0
+
 
 class ZAIClient(BaseLLMClient):
     """Client for Z.AI API with OpenAI-compatible interface."""
 
-    def __init__(self, api_key: str, model: str = "glm-4.6"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "glm-4.6",
+        http_client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[LLMResponseCache] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+    ):
         """
         Initialize Z.AI client.
 
         Args:
             api_key: Z.AI API key
             model: Default model to use
+            http_client: Shared HTTP client; the SDK creates its own if None
+            cache: Response cache for deterministic requests (disabled if None)
+            semantic_cache: Similarity cache for completions (disabled if None)
         """
-        self.client = AsyncOpenAI(api_key=api_key, base_url="https://api.z.ai/api/paas/v4/")
+        super().__init__(cache=cache, semantic_cache=semantic_cache)
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            base_url="https://api.z.ai/api/paas/v4/",
+            http_client=http_client,
+        )
         self._model = model
 
     @property
@@ -35,6 +57,10 @@ class ZAIClient(BaseLLMClient):
         """Return current model name."""
         return self._model
 
+    async def warm_up(self) -> None:
+        """Open a pooled connection to the Z.AI API with a cheap request."""
+        await self.client.with_options(timeout=WARM_UP_TIMEOUT, max_retries=0).models.list()
+
     async def generate_completion(
         self,
         messages: List[ChatCompletionMessageParam],
@@ -58,13 +84,17 @@ class ZAIClient(BaseLLMClient):
         """
         model_to_use = model or self.model
 
-        # Log full prompt at debug level
-        for msg in messages:
-            content = msg.get("content", "")
+        # Log full prompt at debug level as one record; skip building it otherwise
+        if log.is_enabled_for(logging.DEBUG):
             log.debug(
-                "llm prompt message",
-                role=msg.get("role"),
-                content=truncate(str(content), 2000),
+                "llm prompt",
+                messages=[
+                    {
+                        "role": msg.get("role"),
+                        "content": truncate(str(msg.get("content", "")), 2000),
+                    }
+                    for msg in messages
+                ],
             )
 
         log.debug(
@@ -78,31 +108,43 @@ class ZAIClient(BaseLLMClient):
 
         if stream:
             return self._generate_streaming(
-                messages=cast(Any, messages),
+                messages=messages,
                 model=model_to_use,
                 temperature=temperature,
                 max_tokens=max_tokens,
             )
         else:
-            response = await self.client.chat.completions.create(
-                model=model_to_use,
-                messages=cast(Any, messages),
-                temperature=temperature,
-                max_tokens=max_tokens,
-            )
-            content = response.choices[0].message.content or ""
-            usage = response.usage
+            return await self._cached_completion(messages, model_to_use, temperature, max_tokens)
+
+    async def _create_completion(
+        self,
+        messages: List[ChatCompletionMessageParam],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """Call the chat completions API for one non-streaming completion."""
+        response = await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        content = response.choices[0].message.content or ""
 
+        # Truncating the content copies it, so only do it when debug is on
+        if log.is_enabled_for(logging.DEBUG):
+            usage = response.usage
             log.debug(
                 "zai response",
-                model=model_to_use,
+                model=model,
                 content=truncate(content, 2000),
                 prompt_tokens=usage.prompt_tokens if usage else None,
                 completion_tokens=usage.completion_tokens if usage else None,
                 total_tokens=usage.total_tokens if usage else None,
             )
 
-            return content
+        return content
 
     async def _generate_streaming(
         self,
@@ -114,21 +156,23 @@ class ZAIClient(BaseLLMClient):
         """Generate streaming completion."""
         stream = await self.client.chat.completions.create(
             model=model,
-            messages=cast(Any, messages),
+            messages=messages,
             temperature=temperature,
             max_tokens=max_tokens,
             stream=True,
         )
 
-        async for chunk in stream:
-            if chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+        deltas = (content async for chunk in stream if (content := chunk.choices[0].delta.content))
+        # Tokens that arrive in a burst are relayed as one chunk
+        async for text in coalesce_stream(deltas):
+            yield text
 
     async def generate_structured(
         self,
         messages: List[ChatCompletionMessageParam],
         response_format: Type[BaseModel],
         model: Optional[str] = None,
+        temperature: Optional[float] = None,
     ) -> BaseModel:
         """
         Generate structured output using Z.AI.
@@ -137,6 +181,7 @@ class ZAIClient(BaseLLMClient):
             messages: List of message dicts
             response_format: Pydantic model class for response schema
             model: Model to use (overrides default)
+            temperature: Sampling temperature (provider default if None)
 
         Returns:
             Instance of response_format Pydantic model
@@ -149,16 +194,21 @@ class ZAIClient(BaseLLMClient):
             response_format=response_format.__name__,
         )
 
-        response = await self.client.beta.chat.completions.parse(
-            model=model_to_use,
-            messages=cast(Any, messages),
-            response_format=response_format,
-        )
+        return await self._cached_structured(messages, response_format, model_to_use, temperature)
 
-        parsed = response.choices[0].message.parsed
-        if parsed is None:
-            raise ValueError("Failed to parse response")
-
-        log.debug("zai structured response", parsed=str(parsed)[:500])
-
-        return parsed
+    async def _create_structured(
+        self,
+        messages: List[ChatCompletionMessageParam],
+        model: str,
+        response_format: Dict[str, Any],
+        temperature: Optional[float],
+    ) -> Optional[str]:
+        """Call the chat completions API with a strict json_schema response format."""
+        extra: Dict[str, Any] = {} if temperature is None else {"temperature": temperature}
+        response = await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            response_format=cast(Any, response_format),
+            **extra,
+        )
+        return response.choices[0].message.content
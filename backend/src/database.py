@@ -1,12 +1,22 @@
 """Database connection and session management."""
 
 from typing import AsyncGenerator
+from pgvector.asyncpg import register_vector
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import DeclarativeBase
+from starlette.requests import Request
 from src.config import get_settings
 
-# Base class for all models
-Base = declarative_base()
+# ASGI scope key holding the request's session for TransactionMiddleware
+DB_SESSION_SCOPE_KEY = "db_session"
+
+
+class Base(DeclarativeBase):
+    """Base class for all models."""
+
+    pass
+
 
 # Create async engine
 settings = get_settings()
@@ -14,8 +24,20 @@ engine = create_async_engine(
     settings.postgres_url,
     echo=settings.debug,
     future=True,
+    # Sized for concurrent agent requests; the default pool of 5 queues them
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,
+    pool_recycle=settings.db_pool_recycle_seconds,
 )
 
+
+@event.listens_for(engine.sync_engine, "connect")
+def _register_vector_codecs(dbapi_connection, connection_record):
+    """Exchange vector/halfvec values in binary instead of formatted text."""
+    dbapi_connection.run_async(register_vector)
+
+
 # Session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -24,9 +46,10 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting database sessions."""
     async with AsyncSessionLocal() as session:
+        request.scope[DB_SESSION_SCOPE_KEY] = session
         try:
             yield session
         finally:
@@ -4,6 +4,7 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import get_settings
 from src.database import get_db
 from src.clients.arxiv_client import ArxivClient
 from src.clients.embeddings_client import JinaEmbeddingsClient
@@ -25,19 +26,32 @@ from src.factories.service_factories import (
     get_chunking_service,
     get_pdf_parser,
     get_ingest_service,
+    get_paper_count_cache,
 )
 
+settings = get_settings()
 
 # Type aliases for cleaner router signatures
 DbSession = Annotated[AsyncSession, Depends(get_db)]
 
+
 # Client dependencies (singletons)
-ArxivClientDep = Annotated[ArxivClient, Depends(get_arxiv_client)]
-EmbeddingsClientDep = Annotated[JinaEmbeddingsClient, Depends(get_embeddings_client)]
+async def get_arxiv_client_dep() -> ArxivClient:
+    """Get the shared arXiv client."""
+    return get_arxiv_client()
+
+
+async def get_embeddings_client_dep() -> JinaEmbeddingsClient:
+    """Get the shared Jina embeddings client."""
+    return get_embeddings_client()
+
+
+ArxivClientDep = Annotated[ArxivClient, Depends(get_arxiv_client_dep)]
+EmbeddingsClientDep = Annotated[JinaEmbeddingsClient, Depends(get_embeddings_client_dep)]
 
 
 # Service dependencies
-def get_search_service_dep(db: DbSession) -> SearchService:
+async def get_search_service_dep(db: DbSession) -> SearchService:
     """
     Get SearchService with database session.
 
@@ -50,7 +64,7 @@ def get_search_service_dep(db: DbSession) -> SearchService:
     return get_search_service(db)
 
 
-def get_ingest_service_dep(db: DbSession) -> IngestService:
+async def get_ingest_service_dep(db: DbSession) -> IngestService:
     """
     Get IngestService with database session.
 
@@ -63,14 +77,24 @@ def get_ingest_service_dep(db: DbSession) -> IngestService:
     return get_ingest_service(db)
 
 
+async def get_chunking_service_dep() -> ChunkingService:
+    """Get the shared chunking service."""
+    return get_chunking_service()
+
+
+async def get_pdf_parser_dep() -> PDFParser:
+    """Get the shared PDF parser."""
+    return get_pdf_parser()
+
+
 SearchServiceDep = Annotated[SearchService, Depends(get_search_service_dep)]
 IngestServiceDep = Annotated[IngestService, Depends(get_ingest_service_dep)]
-ChunkingServiceDep = Annotated[ChunkingService, Depends(get_chunking_service)]
-PDFParserDep = Annotated[PDFParser, Depends(get_pdf_parser)]
+ChunkingServiceDep = Annotated[ChunkingService, Depends(get_chunking_service_dep)]
+PDFParserDep = Annotated[PDFParser, Depends(get_pdf_parser_dep)]
 
 
 # Repository dependencies (request-scoped)
-def get_paper_repository(db: DbSession) -> PaperRepository:
+async def get_paper_repository(db: DbSession) -> PaperRepository:
     """
     Get PaperRepository with database session.
 
@@ -80,10 +104,10 @@ def get_paper_repository(db: DbSession) -> PaperRepository:
     Returns:
         PaperRepository instance
     """
-    return PaperRepository(db)
+    return PaperRepository(db, count_cache=get_paper_count_cache())
 
 
-def get_chunk_repository(db: DbSession) -> ChunkRepository:
+async def get_chunk_repository(db: DbSession) -> ChunkRepository:
     """
     Get ChunkRepository with database session.
 
@@ -96,7 +120,7 @@ def get_chunk_repository(db: DbSession) -> ChunkRepository:
     return ChunkRepository(db)
 
 
-def get_search_repository(db: DbSession) -> SearchRepository:
+async def get_search_repository(db: DbSession) -> SearchRepository:
     """
     Get SearchRepository with database session.
 
@@ -106,10 +130,14 @@ def get_search_repository(db: DbSession) -> SearchRepository:
     Returns:
         SearchRepository instance
     """
-    return SearchRepository(db)
+    return SearchRepository(
+        db,
+        ef_search=settings.hnsw_ef_search,
+        quantized=settings.quantized_vector_search,
+    )
 
 
-def get_conversation_repository(db: DbSession) -> ConversationRepository:
+async def get_conversation_repository(db: DbSession) -> ConversationRepository:
     """
     Get ConversationRepository with database session.
 
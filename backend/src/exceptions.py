@@ -2,6 +2,9 @@
 
 from typing import Any, Optional
 
+# Shared details for exceptions raised without any; never mutated in place
+_NO_DETAILS: dict[str, Any] = {}
+
 
 class BaseAPIException(Exception):
     """Base exception for all API errors."""
@@ -26,7 +29,7 @@ class BaseAPIException(Exception):
         self.message = message
         self.status_code = status_code
         self.error_code = error_code or self.__class__.__name__
-        self.details = details or {}
+        self.details = details if details else _NO_DETAILS
 
     def to_dict(self) -> dict[str, Any]:
         """Convert exception to dictionary for API response."""
@@ -1,7 +1,12 @@
 """Factory functions for external API clients."""
 
-from functools import lru_cache
-from typing import Optional
+import asyncio
+import warnings
+from functools import cache
+from typing import Callable, Dict, List, NamedTuple, Optional, cast
+
+import httpx
+from openai import DefaultAioHttpClient, DefaultAsyncHttpxClient
 
 from src.config import get_settings
 from src.clients.arxiv_client import ArxivClient
@@ -10,9 +15,39 @@ from src.clients.base_llm_client import BaseLLMClient
 from src.clients.openai_client import OpenAIClient
 from src.clients.zai_client import ZAIClient
 from src.exceptions import ConfigurationError, InvalidModelError, InvalidProviderError
+from src.utils.llm_cache import LLMResponseCache, MemoryCacheBackend, SemanticCache
+from src.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+settings = get_settings()
+
+# get_openai_client warns once per process
+_openai_client_warned = False
+
+
+class _ProviderSpec(NamedTuple):
+    """How to build the client for an LLM provider."""
+
+    client_cls: Callable[..., BaseLLMClient]
+    key_setting: str
+    env_var: str
+    display_name: str
+
+
+_PROVIDERS: Dict[str, _ProviderSpec] = {
+    "openai": _ProviderSpec(OpenAIClient, "openai_api_key", "OPENAI_API_KEY", "OpenAI"),
+    "zai": _ProviderSpec(ZAIClient, "zai_api_key", "ZAI_API_KEY", "Z.AI"),
+}
 
+# Providers get_llm_client accepts
+VALID_PROVIDERS = frozenset(_PROVIDERS)
 
-@lru_cache(maxsize=1)
+# Seconds an idle pooled LLM connection is kept open
+LLM_KEEPALIVE_EXPIRY = 30.0
+
+
+@cache
 def get_arxiv_client() -> ArxivClient:
     """
     Create singleton arXiv client.
@@ -23,7 +58,7 @@ def get_arxiv_client() -> ArxivClient:
     return ArxivClient()
 
 
-@lru_cache(maxsize=1)
+@cache
 def get_embeddings_client() -> JinaEmbeddingsClient:
     """
     Create singleton Jina embeddings client.
@@ -31,13 +66,102 @@ def get_embeddings_client() -> JinaEmbeddingsClient:
     Returns:
         JinaEmbeddingsClient instance
     """
-    settings = get_settings()
     return JinaEmbeddingsClient(api_key=settings.jina_api_key, model="jina-embeddings-v3")
 
 
+def _aiohttp_transport() -> Optional[httpx.AsyncBaseTransport]:
+    """
+    Build an aiohttp transport with the LLM pool limits on its connector.
+
+    Returns:
+        AiohttpTransport, or None if the `aiohttp` extra isn't installed
+    """
+    try:
+        import aiohttp  # pyright: ignore[reportMissingImports]
+        from httpx_aiohttp import AiohttpTransport  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return None
+
+    def session() -> aiohttp.ClientSession:
+        # aiohttp has no separate keep-alive cap; limit bounds every connection
+        connector = aiohttp.TCPConnector(
+            limit=settings.llm_max_connections,
+            keepalive_timeout=LLM_KEEPALIVE_EXPIRY,
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    # Called on the first request, so the session is created inside the event loop
+    return AiohttpTransport(client=session)
+
+
+@cache
+def get_llm_http_client() -> httpx.AsyncClient:
+    """
+    Create singleton HTTP client shared by all LLM clients.
+
+    Uses the SDK's aiohttp transport, which holds up better under concurrent
+    requests, when the `aiohttp` extra is installed; otherwise falls back to
+    the default httpx transport.
+
+    The pool is sized from settings rather than the SDK default so that
+    concurrent agent runs don't queue on connections (httpx.PoolTimeout).
+    The aiohttp connector is configured directly, since it doesn't read
+    httpx.Limits.
+
+    Returns:
+        httpx.AsyncClient-compatible client for AsyncOpenAI
+    """
+    transport = _aiohttp_transport()
+    if transport is not None:
+        return DefaultAioHttpClient(transport=transport)
+
+    limits = httpx.Limits(
+        max_connections=settings.llm_max_connections,
+        max_keepalive_connections=settings.llm_max_keepalive_connections,
+        keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+    )
+    return DefaultAsyncHttpxClient(limits=limits)
+
+
+@cache
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """
+    Create singleton LLM response cache shared by all LLM clients.
+
+    Returns:
+        LLMResponseCache instance, or None if caching is disabled
+    """
+    if not settings.llm_cache_enabled:
+        return None
+    return LLMResponseCache(
+        backend=MemoryCacheBackend(max_entries=settings.llm_cache_max_entries),
+        ttl=settings.llm_cache_ttl_seconds,
+    )
+
+
+@cache
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """
+    Create singleton semantic LLM cache backed by Jina query embeddings.
+
+    Returns:
+        SemanticCache instance, or None if disabled
+    """
+    if not settings.semantic_cache_enabled:
+        return None
+    return SemanticCache(
+        embed=get_embeddings_client().embed_query,
+        threshold=settings.semantic_cache_threshold,
+        max_entries=settings.semantic_cache_max_entries,
+    )
+
+
 def get_llm_client(provider: Optional[str] = None, model: Optional[str] = None) -> BaseLLMClient:
     """
-    Create LLM client for specified provider and model.
+    Get LLM client for specified provider and model.
+
+    Clients are created once per (provider, model) and reused, so requests
+    keep their pooled connections instead of re-doing TLS handshakes.
 
     Args:
         provider: LLM provider ('openai' or 'zai'). Uses default if None.
@@ -49,15 +173,14 @@ def get_llm_client(provider: Optional[str] = None, model: Optional[str] = None)
     Raises:
         ValueError: If provider is invalid or model not allowed
     """
-    settings = get_settings()
 
     # Use default provider if not specified
     if provider is None:
         provider = settings.default_llm_provider
 
     # Validate provider
-    if provider not in ["openai", "zai"]:
-        raise InvalidProviderError(provider=provider, valid_providers=["openai", "zai"])
+    if provider not in VALID_PROVIDERS:
+        raise InvalidProviderError(provider=provider, valid_providers=list(_PROVIDERS))
 
     # Use default model if not specified
     if model is None:
@@ -68,36 +191,104 @@ def get_llm_client(provider: Optional[str] = None, model: Optional[str] = None)
         allowed = settings.get_allowed_models(provider)
         raise InvalidModelError(model=model, provider=provider, valid_models=allowed)
 
-    # Create appropriate client
-    if provider == "openai":
-        if not settings.openai_api_key:
-            raise ConfigurationError(
-                message="OpenAI API key not configured",
-                details={"required_env_var": "OPENAI_API_KEY"},
-            )
-        openai_key: str = settings.openai_api_key
-        return OpenAIClient(api_key=openai_key, model=model)
-    elif provider == "zai":
-        if not settings.zai_api_key:
-            raise ConfigurationError(
-                message="Z.AI API key not configured",
-                details={"required_env_var": "ZAI_API_KEY"},
-            )
-        zai_key: str = settings.zai_api_key
-        return ZAIClient(api_key=zai_key, model=model)
-
-    raise InvalidProviderError(provider=provider, valid_providers=["openai", "zai"])
-
-
-@lru_cache(maxsize=1)
+    return _create_llm_client(provider, model)
+
+
+@cache
+def _create_llm_client(provider: str, model: str) -> BaseLLMClient:
+    """
+    Create the singleton client for a validated provider and model.
+
+    Args:
+        provider: LLM provider ('openai' or 'zai')
+        model: Model name
+
+    Returns:
+        BaseLLMClient instance sharing the LLM HTTP client
+    """
+    spec = _PROVIDERS[provider]
+    api_key = getattr(settings, spec.key_setting)
+    if not api_key:
+        raise ConfigurationError(
+            message=f"{spec.display_name} API key not configured",
+            details={"required_env_var": spec.env_var},
+        )
+    return spec.client_cls(
+        api_key=api_key,
+        model=model,
+        http_client=get_llm_http_client(),
+        cache=get_llm_cache(),
+        semantic_cache=get_semantic_cache(),
+    )
+
+
+def init_llm_clients() -> List[BaseLLMClient]:
+    """
+    Construct a client for every allowed model of each configured provider.
+
+    Called at startup so configuration errors surface at boot and the first
+    request for any model finds its client already cached. Providers without
+    an API key are skipped with a warning.
+
+    Returns:
+        Created LLM clients
+    """
+    keys = {"openai": settings.openai_api_key, "zai": settings.zai_api_key}
+    clients: List[BaseLLMClient] = []
+
+    for provider, key in keys.items():
+        if not key:
+            log.warning("llm provider not configured, skipping", provider=provider)
+            continue
+        clients.extend(
+            get_llm_client(provider, model) for model in settings.get_allowed_models(provider)
+        )
+
+    log.info("llm clients initialized", count=len(clients))
+    return clients
+
+
+async def warm_up_llm_clients() -> None:
+    """
+    Pre-open connections to every LLM provider with a configured API key.
+
+    Runs the warm-up requests concurrently so the first user query skips the
+    DNS/TLS handshake. Failures are logged and never block startup.
+    """
+    keys = {"openai": settings.openai_api_key, "zai": settings.zai_api_key}
+    clients = [get_llm_client(provider) for provider, key in keys.items() if key]
+
+    results = await asyncio.gather(*(c.warm_up() for c in clients), return_exceptions=True)
+    for client, result in zip(clients, results):
+        if isinstance(result, BaseException):
+            log.warning("llm warm-up failed", provider=client.provider_name, error=str(result))
+        else:
+            log.info("llm connection warmed", provider=client.provider_name)
+
+
+async def close_llm_clients() -> None:
+    """Close the shared LLM HTTP client and drop cached LLM clients."""
+    _create_llm_client.cache_clear()
+    await get_llm_http_client().aclose()
+    get_llm_http_client.cache_clear()
+
+
 def get_openai_client() -> OpenAIClient:
     """
-    Create singleton OpenAI client (DEPRECATED).
+    Get the default OpenAI client (DEPRECATED).
 
-    Use get_llm_client() instead.
+    Use get_llm_client() instead. Returns the same cached client, so both
+    paths share one connection pool.
 
     Returns:
         OpenAIClient instance
     """
-    settings = get_settings()
-    return OpenAIClient(api_key=settings.openai_api_key, model=settings.get_default_model("openai"))
+    global _openai_client_warned
+    if not _openai_client_warned:
+        _openai_client_warned = True
+        warnings.warn(
+            "get_openai_client() is deprecated; use get_llm_client('openai') instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+    return cast(OpenAIClient, get_llm_client("openai", settings.get_default_model("openai")))
@@ -1,6 +1,6 @@
 """Factory functions for business logic services."""
 
-from functools import lru_cache
+from functools import cache
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.config import get_settings
@@ -8,6 +8,7 @@ from src.services.search_service import SearchService
 from src.services.agent_service import AgentService
 from src.services.ingest_service import IngestService
 from src.utils.chunking_service import ChunkingService
+from src.utils.count_cache import CountCache
 from src.utils.pdf_parser import PDFParser
 from src.factories.client_factories import (
     get_embeddings_client,
@@ -19,12 +20,15 @@ from src.repositories.chunk_repository import ChunkRepository
 from src.repositories.search_repository import SearchRepository
 from src.repositories.conversation_repository import ConversationRepository
 
+settings = get_settings()
+
 
 def get_search_service(db_session: AsyncSession) -> SearchService:
     """
     Create SearchService with dependencies.
 
-    Note: Not cached because depends on request-scoped db session.
+    Note: Cached per db session (not globally), so every caller within a
+    request shares one instance.
 
     Args:
         db_session: Database session
@@ -32,16 +36,25 @@ def get_search_service(db_session: AsyncSession) -> SearchService:
     Returns:
         SearchService instance
     """
-    settings = get_settings()
-    search_repo = SearchRepository(db_session)
+    cached = db_session.info.get("search_service")
+    if cached is not None:
+        return cached
+
+    search_repo = SearchRepository(
+        db_session,
+        ef_search=settings.hnsw_ef_search,
+        quantized=settings.quantized_vector_search,
+    )
     embeddings_client = get_embeddings_client()
 
-    return SearchService(
+    service = SearchService(
         search_repository=search_repo, embeddings_client=embeddings_client, rrf_k=settings.rrf_k
     )
+    db_session.info["search_service"] = service
+    return service
 
 
-@lru_cache(maxsize=1)
+@cache
 def get_chunking_service() -> ChunkingService:
     """
     Create singleton chunking service.
@@ -49,7 +62,6 @@ def get_chunking_service() -> ChunkingService:
     Returns:
         ChunkingService instance
     """
-    settings = get_settings()
     return ChunkingService(
         target_words=settings.chunk_size_words,
         overlap_words=settings.chunk_overlap_words,
@@ -57,7 +69,7 @@ def get_chunking_service() -> ChunkingService:
     )
 
 
-@lru_cache(maxsize=1)
+@cache
 def get_pdf_parser() -> PDFParser:
     """
     Create singleton PDF parser.
@@ -68,11 +80,40 @@ def get_pdf_parser() -> PDFParser:
     return PDFParser()
 
 
+@cache
+def get_paper_count_cache() -> CountCache:
+    """
+    Create singleton cache for the unfiltered paper count.
+
+    The cache lives in this worker only, so counts served from it are
+    approximate across workers until it expires.
+
+    Returns:
+        CountCache instance
+    """
+    return CountCache(ttl=settings.paper_count_cache_ttl_seconds)
+
+
+def init_singletons() -> None:
+    """
+    Construct the singleton clients and services at startup.
+
+    The factories are cached, so building them here means the first request
+    resolving these dependencies gets a ready instance.
+    """
+    get_arxiv_client()
+    get_embeddings_client()
+    get_chunking_service()
+    get_pdf_parser()
+    get_paper_count_cache()
+
+
 def get_ingest_service(db_session: AsyncSession) -> IngestService:
     """
     Create IngestService with dependencies.
 
-    Note: Not cached because depends on request-scoped db session.
+    Note: Cached per db session (not globally), so every caller within a
+    request shares one instance.
 
     Args:
         db_session: Database session
@@ -80,14 +121,18 @@ def get_ingest_service(db_session: AsyncSession) -> IngestService:
     Returns:
         IngestService instance
     """
+    cached = db_session.info.get("ingest_service")
+    if cached is not None:
+        return cached
+
     arxiv_client = get_arxiv_client()
     pdf_parser = get_pdf_parser()
     embeddings_client = get_embeddings_client()
     chunking_service = get_chunking_service()
-    paper_repository = PaperRepository(db_session)
+    paper_repository = PaperRepository(db_session, count_cache=get_paper_count_cache())
     chunk_repository = ChunkRepository(db_session)
 
-    return IngestService(
+    service = IngestService(
         arxiv_client=arxiv_client,
         pdf_parser=pdf_parser,
         embeddings_client=embeddings_client,
@@ -95,6 +140,8 @@ def get_ingest_service(db_session: AsyncSession) -> IngestService:
         paper_repository=paper_repository,
         chunk_repository=chunk_repository,
     )
+    db_session.info["ingest_service"] = service
+    return service
 
 
 def get_agent_service(
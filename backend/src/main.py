@@ -5,18 +5,27 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from src.config import get_settings
 from src.database import engine, init_db
+from src.factories.client_factories import (
+    close_llm_clients,
+    get_arxiv_client,
+    init_llm_clients,
+    warm_up_llm_clients,
+)
+from src.factories.service_factories import init_singletons
 
 # Import routers
 from src.routers import health, ingest, search, stream, papers, conversations
 
 # Import middleware
-from src.middleware import logging_middleware, transaction_middleware, register_exception_handlers
+from src.middleware import LoggingMiddleware, register_exception_handlers
+from src.utils.async_log import start_log_worker, stop_log_worker
 from src.utils.logger import configure_logging, get_logger
+from src.utils.responses import ORJSONResponse
 
 settings = get_settings()
 
 # Configure logging early
-configure_logging(log_level=settings.log_level, debug=settings.debug)
+configure_logging(log_level=settings.log_level, debug=settings.debug, json=settings.log_json)
 log = get_logger(__name__)
 
 
@@ -24,12 +33,19 @@ log = get_logger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     log.info("starting application", debug=settings.debug, log_level=settings.log_level)
+    start_log_worker()
     await init_db()
     log.info("database initialized")
+    init_singletons()
+    init_llm_clients()
+    await warm_up_llm_clients()
     yield
     log.info("shutting down application")
+    await get_arxiv_client().close()
+    await close_llm_clients()
     await engine.dispose()
     log.info("database connections closed")
+    await stop_log_worker()
 
 
 app = FastAPI(
@@ -37,6 +53,7 @@ app = FastAPI(
     description="Jireh's Agent system for AI/ML research papers from arXiv",
     version="0.3.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Register exception handlers first
@@ -51,11 +68,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Request logging middleware (function-based, works with streaming)
-app.middleware("http")(logging_middleware)
-
-# Database transaction middleware (function-based, works with streaming)
-app.middleware("http")(transaction_middleware)
+# Request logging and database transaction management in one pure ASGI layer
+# (works with streaming)
+app.add_middleware(LoggingMiddleware, manage_transactions=True)
 
 # Register routers
 app.include_router(health.router, prefix="/api/v1", tags=["Health"])
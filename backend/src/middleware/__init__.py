@@ -1,11 +1,11 @@
 """Middleware components for request processing."""
 
 from .error_handler import register_exception_handlers
-from .logging import logging_middleware
-from .transaction import transaction_middleware
+from .logging import LoggingMiddleware
+from .transaction import TransactionMiddleware
 
 __all__ = [
     "register_exception_handlers",
-    "logging_middleware",
-    "transaction_middleware",
+    "LoggingMiddleware",
+    "TransactionMiddleware",
 ]
@@ -1,12 +1,11 @@
 """Global exception handler for consistent error responses."""
 
-import traceback
-from datetime import datetime
-from typing import Union
+from datetime import datetime, timezone
+from typing import Iterator, Type, Union
 
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -17,7 +16,30 @@ from src.utils.logger import get_logger, get_request_id
 log = get_logger(__name__)
 
 
-async def base_exception_handler(request: Request, exc: BaseAPIException) -> JSONResponse:
+def _error_response(status_code: int, error: ErrorDetail) -> Response:
+    """
+    Serialize an error response in one pass with pydantic's JSON encoder.
+
+    Args:
+        status_code: HTTP status code
+        error: Error details
+
+    Returns:
+        JSON response
+    """
+    error_response = ErrorResponse(
+        error=error,
+        request_id=get_request_id(),
+        timestamp=datetime.now(timezone.utc),
+    )
+    return Response(
+        content=error_response.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+async def base_exception_handler(request: Request, exc: BaseAPIException) -> Response:
     """Handle custom API exceptions."""
     log.error(
         "api exception",
@@ -27,80 +49,63 @@ async def base_exception_handler(request: Request, exc: BaseAPIException) -> JSO
         details=exc.details,
     )
 
-    error_response = ErrorResponse(
-        error=ErrorDetail(
+    return _error_response(
+        exc.status_code,
+        ErrorDetail(
             code=exc.error_code,
             message=exc.message,
             details=exc.details,
         ),
-        request_id=get_request_id(),
-        timestamp=datetime.utcnow(),
-    )
-
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=error_response.model_dump(mode="json"),
     )
 
 
 async def validation_exception_handler(
     request: Request, exc: Union[RequestValidationError, PydanticValidationError]
-) -> JSONResponse:
+) -> Response:
     """Handle Pydantic validation errors from request parsing."""
     log.warning("validation error", errors=exc.errors())
 
-    error_response = ErrorResponse(
-        error=ErrorDetail(
+    return _error_response(
+        status.HTTP_422_UNPROCESSABLE_ENTITY,
+        ErrorDetail(
             code="VALIDATION_ERROR",
             message="Request validation failed",
             details={"errors": exc.errors()},
         ),
-        request_id=get_request_id(),
-        timestamp=datetime.utcnow(),
-    )
-
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=error_response.model_dump(mode="json"),
     )
 
 
-async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -> JSONResponse:
+async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -> Response:
     """Handle SQLAlchemy database errors."""
-    log.error("database error", error=str(exc), traceback=traceback.format_exc())
+    log.error("database error", error=str(exc), exc_info=exc)
 
     db_error = DatabaseError(
         message="Database operation failed",
         details={"error": str(exc)},
     )
 
-    error_response = ErrorResponse(
-        error=ErrorDetail(
+    return _error_response(
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        ErrorDetail(
             code=db_error.error_code,
             message=db_error.message,
             details=db_error.details,
         ),
-        request_id=get_request_id(),
-        timestamp=datetime.utcnow(),
-    )
-
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response.model_dump(mode="json"),
     )
 
 
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> Response:
     """Handle unexpected exceptions."""
     log.critical(
         "unhandled exception",
         error_type=type(exc).__name__,
         error=str(exc),
-        traceback=traceback.format_exc(),
+        exc_info=exc,
     )
 
-    error_response = ErrorResponse(
-        error=ErrorDetail(
+    return _error_response(
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        ErrorDetail(
             code="INTERNAL_SERVER_ERROR",
             message="An unexpected error occurred",
             details={
@@ -108,19 +113,26 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
                 "error_message": str(exc),
             },
         ),
-        request_id=get_request_id(),
-        timestamp=datetime.utcnow(),
     )
 
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response.model_dump(mode="json"),
-    )
+
+def _api_exception_types(
+    cls: Type[BaseAPIException] = BaseAPIException,
+) -> Iterator[Type[BaseAPIException]]:
+    """Yield cls and every BaseAPIException subclass defined beneath it."""
+    yield cls
+    for subclass in cls.__subclasses__():
+        yield from _api_exception_types(subclass)
 
 
 def register_exception_handlers(app: FastAPI) -> None:
     """Register all exception handlers with FastAPI application."""
-    app.add_exception_handler(BaseAPIException, base_exception_handler)
+    # Starlette resolves a handler by walking the exception's MRO, so registering
+    # each concrete API exception matches on the first lookup. Subclasses defined
+    # later still resolve through BaseAPIException; only unexpected errors reach
+    # the catch-all, which Starlette runs in its outermost server error middleware.
+    for exc_type in _api_exception_types():
+        app.add_exception_handler(exc_type, base_exception_handler)
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
     app.add_exception_handler(PydanticValidationError, validation_exception_handler)
     app.add_exception_handler(SQLAlchemyError, sqlalchemy_exception_handler)
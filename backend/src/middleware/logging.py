@@ -1,144 +1,326 @@
 """Request logging middleware with body capture."""
 
+import itertools
+import logging
+import os
+import re
 import time
-import uuid
-from typing import Callable, Awaitable
+from dataclasses import dataclass
+from typing import Optional
 
-from fastapi import Request, Response
-from starlette.responses import StreamingResponse
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.config import get_settings
-from src.utils.logger import get_logger, set_request_id, clear_request_id, truncate
+from src.middleware.transaction import commit_on_success, rollback, run_in_transaction
+from src.utils.asgi import find_header
+from src.utils.async_log import emit
+from src.utils.logger import get_logger, set_request_id, clear_request_id, truncate_bytes
 
 log = get_logger(__name__)
 settings = get_settings()
 
-# Paths to skip logging (noisy/health endpoints)
-SKIP_PATHS = {"/health", "/api/v1/health", "/docs", "/openapi.json", "/redoc", "/favicon.ico"}
+# Paths to skip logging (noisy/health endpoints), matched exactly or by prefix
+SKIP_PATHS = frozenset({"/health", "/favicon.ico"})
+SKIP_PREFIXES = ("/docs", "/redoc", "/openapi", "/api/v1/health")
+
+# Read once; settings don't change while the app runs
+LOG_REQUEST_BODY = settings.log_request_body
+LOG_RESPONSE_BODY = settings.log_response_body
+LOG_BODY_SAMPLE_RATE = max(settings.log_body_sample_rate, 1)
 SLOW_REQUEST_MS = 2000
 
+# Longer query strings are logged as their length only
+MAX_QUERY_LOG_BYTES = 1024
+
+# Methods whose request body is logged
+MUTATING_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# Request bodies are not read for uploads or above this size
+SKIPPED_REQUEST_CONTENT_TYPES = (
+    "multipart/form-data",
+    "application/pdf",
+    "application/octet-stream",
+)
+MAX_REQUEST_CAPTURE_BYTES = 64 * 1024
+
+# Other request bodies are logged by size only
+TEXT_REQUEST_CONTENT_TYPES = ("application/json", "application/x-www-form-urlencoded", "text/")
+
+# Response bodies are only captured for textual content types
+LOGGABLE_CONTENT_TYPES = ("application/json", "text/")
+
+REQUEST_ID_HEADER = b"x-request-id"
+
+# Incoming request IDs are reused only if they look like an ID, so clients
+# can't inject arbitrary text into the logs
+_REQUEST_ID_RE = re.compile(r"[A-Za-z0-9._:-]{1,128}")
+
+
+# Requests seen by this worker, for body sampling
+_request_counter = itertools.count()
+
+
+class _LogData:
+    """Base for slotted log data; unset (None/False) fields are left out of the event."""
+
+    __slots__ = ()
+
+    def as_fields(self) -> dict:
+        fields = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is not None and value is not False:
+                fields[name] = value
+        return fields
+
+
+@dataclass(slots=True)
+class RequestLog(_LogData):
+    """Fields of the "request" log event."""
+
+    method: str
+    path: str
+    request_id: str
+    client: Optional[str] = None
+    query_string: Optional[str] = None
+    body_sampled: bool = False
+    body: Optional[str] = None
 
-async def logging_middleware(
-    request: Request, call_next: Callable[[Request], Awaitable[Response]]
-) -> Response:
+
+@dataclass(slots=True)
+class ResponseLog(_LogData):
+    """Fields of the "response" log event."""
+
+    method: str
+    path: str
+    request_id: str
+    status: int = 500
+    duration_ms: float = 0.0
+    body_sampled: bool = False
+    streaming: bool = False
+    body: Optional[str] = None
+    body_size: Optional[int] = None
+
+
+def _sample_bodies() -> bool:
+    """Whether this request's bodies should be captured under body sampling."""
+    if not (LOG_REQUEST_BODY or LOG_RESPONSE_BODY):
+        return False
+    return LOG_BODY_SAMPLE_RATE == 1 or next(_request_counter) % LOG_BODY_SAMPLE_RATE == 0
+
+
+def _elapsed_ms(start_ns: int) -> float:
+    """Milliseconds since a time.perf_counter_ns() reading, to two decimal places."""
+    # Integer division truncates to 10 microseconds before the single float conversion
+    return (time.perf_counter_ns() - start_ns) // 10_000 / 100
+
+
+def _log_response(resp_data: ResponseLog) -> None:
+    """Log a finished response at a level based on its status and duration."""
+    status_code = resp_data.status
+    if status_code >= 500:
+        emit(log, "error", "response", resp_data)
+    elif status_code >= 400:
+        emit(log, "warning", "response", resp_data)
+    elif resp_data.duration_ms > SLOW_REQUEST_MS:
+        emit(log, "warning", "response (slow)", resp_data)
+    else:
+        emit(log, "info", "response", resp_data)
+
+
+class LoggingMiddleware:
     """
-    Middleware for request/response logging with timing and body capture.
+    ASGI middleware for request/response logging with timing and body capture.
 
-    Works with StreamingResponse by logging before and after the stream starts.
+    Runs as plain ASGI rather than through BaseHTTPMiddleware, so responses
+    pass straight through to the server without an extra task and memory
+    stream per request. The response body is observed as it is sent, which
+    keeps streaming responses streaming.
+
+    With manage_transactions, it also commits or rolls back the request's
+    database session as TransactionMiddleware does, saving a middleware layer.
     """
-    # Skip noisy endpoints
-    if request.url.path in SKIP_PATHS:
-        return await call_next(request)
-
-    # Generate and set request ID
-    request_id = f"req_{uuid.uuid4().hex[:12]}"
-    set_request_id(request_id)
-    request.state.request_id = request_id
-
-    start = time.perf_counter()
-    method = request.method
-    path = request.url.path
-
-    # Build request log data
-    req_data: dict = {
-        "method": method,
-        "path": path,
-        "request_id": request_id,
-    }
-
-    if request.client:
-        req_data["client"] = request.client.host
-
-    if request.query_params:
-        req_data["query"] = dict(request.query_params)
-
-    # Capture request body for mutations
-    request_body: bytes | None = None
-    if method in ("POST", "PUT", "PATCH") and settings.log_request_body:
-        try:
-            request_body = await request.body()
 
-            if request_body:
-                req_data["body"] = truncate(request_body.decode("utf-8", errors="replace"))
+    def __init__(self, app: ASGIApp, manage_transactions: bool = False):
+        self.app = app
+        self.manage_transactions = manage_transactions
 
-        except Exception as e:
-            log.error("failed to capture request body", error=str(e), error_type=type(e).__name__)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    log.info("request", **req_data)
-
-    try:
-        response = await call_next(request)
-        duration_ms = (time.perf_counter() - start) * 1000
-
-        # Build response log data
-        resp_data: dict = {
-            "method": method,
-            "path": path,
-            "status": response.status_code,
-            "duration_ms": round(duration_ms, 2),
-            "request_id": request_id,
-        }
-
-        # For streaming responses, log without reading the body
-        # (body will be consumed by the client as it streams)
-        # Check for StreamingResponse (including _StreamingResponse wrapper from middleware)
-        # or text/event-stream media type, or if it has body_iterator attribute
-        is_streaming = (
-            isinstance(response, StreamingResponse)
-            or "StreamingResponse" in type(response).__name__
-            or (hasattr(response, "media_type") and response.media_type == "text/event-stream")
-        )
+        # Skip noisy endpoints
+        path: str = scope["path"]
+        if path in SKIP_PATHS or path.startswith(SKIP_PREFIXES):
+            if self.manage_transactions:
+                await run_in_transaction(self.app, scope, receive, send)
+            else:
+                await self.app(scope, receive, send)
+            return
 
-        if is_streaming:
-            resp_data["streaming"] = True
-        elif settings.log_response_body:
-            # Only capture body for non-streaming responses
-            try:
-                response_body = b""
-                async for chunk in response.body_iterator:
-                    response_body += chunk
-
-                if response_body:
-                    resp_data["body"] = truncate(response_body.decode("utf-8", errors="replace"))
-                    resp_data["body_size"] = len(response_body)
-
-                # Recreate response with body
-                response = Response(
-                    content=response_body,
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
-                    media_type=response.media_type,
-                )
-            except Exception:
-                pass
-
-        # Log with appropriate level based on duration/status
-        if response.status_code >= 500:
-            log.error("response", **resp_data)
-        elif response.status_code >= 400:
-            log.warning("response", **resp_data)
-        elif duration_ms > SLOW_REQUEST_MS:
-            log.warning("response (slow)", **resp_data)
+        # Reuse the caller's request ID so upstream traces line up; otherwise
+        # generate one from 48 random bits
+        incoming_id = find_header(scope["headers"], REQUEST_ID_HEADER)
+        if incoming_id and _REQUEST_ID_RE.fullmatch(incoming_id):
+            request_id = incoming_id
         else:
-            log.info("response", **resp_data)
-
-        # Add request ID header for client correlation
-        response.headers["X-Request-ID"] = request_id
-        return response
-
-    except Exception as exc:
-        duration_ms = (time.perf_counter() - start) * 1000
-        log.error(
-            "request failed",
-            method=method,
-            path=path,
-            duration_ms=round(duration_ms, 2),
-            error=str(exc),
-            error_type=type(exc).__name__,
-            request_id=request_id,
+            request_id = "req_" + os.urandom(6).hex()
+        set_request_id(request_id)
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        start = time.perf_counter_ns()
+        method: str = scope["method"]
+
+        # The request line and bodies are only logged at INFO, so skip building
+        # them when that level is filtered out
+        info_enabled = log.is_enabled_for(logging.INFO)
+        capture_bodies = info_enabled and _sample_bodies()
+
+        if info_enabled:
+            req_data = RequestLog(method, path, request_id)
+
+            client = scope.get("client")
+            if client:
+                req_data.client = client[0]
+
+            # Log the raw query string rather than parsing it into a dict
+            query_string: bytes = scope.get("query_string", b"")
+            if len(query_string) > MAX_QUERY_LOG_BYTES:
+                req_data.query_string = f"<elided: {len(query_string)} bytes>"
+            elif query_string:
+                req_data.query_string = query_string.decode("latin-1")
+
+            req_data.body_sampled = capture_bodies and LOG_BODY_SAMPLE_RATE > 1
+
+            # Capture request body for mutations
+            if capture_bodies and LOG_REQUEST_BODY and method in MUTATING_METHODS:
+                receive = await self._capture_request_body(scope, receive, req_data)
+
+            # Request and response lines are rendered by the log worker, off this task
+            emit(log, "info", "request", req_data)
+
+        resp_data = ResponseLog(
+            method, path, request_id, body_sampled=capture_bodies and LOG_BODY_SAMPLE_RATE > 1
         )
-        raise
+        capture_body = False
+        logged = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal capture_body, logged
+
+            if message["type"] == "http.response.start":
+                headers = message.get("headers", [])
+                resp_data.status = message["status"]
+
+                # Add request ID header for client correlation; a new list leaves
+                # the response object's own headers untouched
+                message["headers"] = [*headers, (REQUEST_ID_HEADER, request_id.encode("latin-1"))]
+
+                if capture_bodies and LOG_RESPONSE_BODY:
+                    content_type = find_header(headers, b"content-type") or ""
+                    capture_body = content_type.startswith(LOGGABLE_CONTENT_TYPES)
+
+                if self.manage_transactions:
+                    await commit_on_success(scope, message)
+
+            elif message["type"] == "http.response.body" and not logged:
+                resp_data.duration_ms = _elapsed_ms(start)
+                if message.get("more_body", False):
+                    # A body sent in several messages is a stream (SSE, files); log
+                    # it as it starts, since the client consumes it over time
+                    resp_data.streaming = True
+                else:
+                    # Whole body in one message; decode only the logged prefix
+                    body: bytes = message.get("body", b"")
+                    if capture_body and body:
+                        resp_data.body = truncate_bytes(body)
+                        resp_data.body_size = len(body)
+                _log_response(resp_data)
+                logged = True
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+
+        except Exception as exc:
+            log.error(
+                "request failed",
+                method=method,
+                path=path,
+                duration_ms=_elapsed_ms(start),
+                error=str(exc),
+                error_type=type(exc).__name__,
+                request_id=request_id,
+            )
+            if self.manage_transactions:
+                await rollback(scope)
+            raise
+
+        finally:
+            clear_request_id()
+
+    @staticmethod
+    async def _capture_request_body(
+        scope: Scope, receive: Receive, req_data: RequestLog
+    ) -> Receive:
+        """
+        Read a small request body into req_data and return a receive that replays it.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            req_data: Request log data, updated with the body
+
+        Returns:
+            Receive callable the downstream app should use
+        """
+        headers = Headers(scope=scope)
+        content_type = headers.get("content-type", "")
+        try:
+            content_length = int(headers.get("content-length") or 0)
+        except ValueError:
+            # Malformed header; the server decides what to do with the body
+            content_length = 0
+
+        # Leave uploads and large bodies unread so they stream to the handler
+        if content_type.startswith(SKIPPED_REQUEST_CONTENT_TYPES):
+            req_data.body = f"<elided: {content_type.split(';')[0]}, {content_length} bytes>"
+            return receive
+        if content_length > MAX_REQUEST_CAPTURE_BYTES:
+            req_data.body = f"<elided: {content_length} bytes>"
+            return receive
+
+        messages: list[Message] = []
+        try:
+            size = 0
+            while True:
+                message = await receive()
+                messages.append(message)
+                size += len(message.get("body", b""))
+                if message["type"] != "http.request" or not message.get("more_body", False):
+                    break
+                # Chunked bodies carry no Content-Length; stop buffering at the
+                # cap and let replay pass the rest straight through
+                if size > MAX_REQUEST_CAPTURE_BYTES:
+                    break
+
+            if size > MAX_REQUEST_CAPTURE_BYTES:
+                req_data.body = f"<elided: over {MAX_REQUEST_CAPTURE_BYTES} bytes>"
+            elif size and content_type.startswith(TEXT_REQUEST_CONTENT_TYPES):
+                req_data.body = truncate_bytes(b"".join(m.get("body", b"") for m in messages))
+            elif size:
+                # No content type is treated as binary too
+                req_data.body = f"<binary: {size} bytes>"
+
+        except Exception as e:
+            log.error("failed to capture request body", error=str(e), error_type=type(e).__name__)
+
+        async def replay() -> Message:
+            if messages:
+                return messages.pop(0)
+            return await receive()
 
-    finally:
-        clear_request_id()
+        return replay
@@ -1,48 +1,93 @@
 """Database transaction middleware."""
 
-from typing import Callable, Awaitable
+from typing import Optional
 
-from fastapi import Request, Response
-from starlette.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from src.database import DB_SESSION_SCOPE_KEY
+from src.utils.asgi import find_header
 from src.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# Event streams commit their own transactions within the stream generator
+STREAMING_CONTENT_TYPE = "text/event-stream"
 
-async def transaction_middleware(
-    request: Request, call_next: Callable[[Request], Awaitable[Response]]
-) -> Response:
+
+async def commit_on_success(scope: Scope, message: Message) -> None:
     """
-    Middleware for automatic database transaction management.
+    Commit the request's session as a 2xx response starts.
 
-    Commits on successful responses (2xx), rolls back on exceptions.
-    For streaming responses, skips transaction management as they handle their own commits.
+    Streaming responses are skipped, as they handle their own commits.
+
+    Args:
+        scope: ASGI connection scope
+        message: http.response.start message about to be sent
     """
-    try:
-        response = await call_next(request)
+    if not 200 <= message["status"] < 300:
+        return
+    db: Optional[AsyncSession] = scope.get(DB_SESSION_SCOPE_KEY)
+    if db is None:
+        return
 
-        # Skip transaction management for streaming responses
-        # (they handle their own DB commits within the stream generator)
-        if isinstance(response, StreamingResponse):
-            log.debug("skipping transaction management for streaming response")
-            return response
+    content_type = find_header(message.get("headers", []), b"content-type") or ""
+    if content_type.startswith(STREAMING_CONTENT_TYPE):
+        log.debug("skipping transaction management for streaming response")
+        return
 
-        # Auto-commit on success (2xx status codes)
-        if 200 <= response.status_code < 300:
-            if hasattr(request.state, "db_session"):
-                db: AsyncSession = request.state.db_session
-                await db.commit()
-                log.debug("transaction committed")
+    await db.commit()
+    log.debug("transaction committed")
 
-        return response
 
-    except Exception:
-        # Auto-rollback on exceptions
-        if hasattr(request.state, "db_session"):
-            db: AsyncSession = request.state.db_session
-            await db.rollback()
-            log.debug("transaction rolled back")
+async def rollback(scope: Scope) -> None:
+    """Roll back the request's session, if it opened one."""
+    db: Optional[AsyncSession] = scope.get(DB_SESSION_SCOPE_KEY)
+    if db is not None:
+        await db.rollback()
+        log.debug("transaction rolled back")
+
+
+async def run_in_transaction(app: ASGIApp, scope: Scope, receive: Receive, send: Send) -> None:
+    """
+    Run an HTTP request, committing on success and rolling back on exceptions.
+
+    Args:
+        app: ASGI app handling the request
+        scope: ASGI connection scope
+        receive: ASGI receive callable
+        send: ASGI send callable
+    """
+
+    async def send_wrapper(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            await commit_on_success(scope, message)
+        await send(message)
 
+    try:
+        await app(scope, receive, send_wrapper)
+    except Exception:
+        await rollback(scope)
         raise
+
+
+class TransactionMiddleware:
+    """
+    ASGI middleware for automatic database transaction management.
+
+    Commits on successful responses (2xx), rolls back on exceptions.
+    For streaming responses, skips transaction management as they handle their own commits.
+    The commit happens when the response headers are sent, before the client sees them.
+
+    LoggingMiddleware(manage_transactions=True) does the same within its own
+    layer; use this one only when request logging isn't installed.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        await run_in_transaction(self.app, scope, receive, send)
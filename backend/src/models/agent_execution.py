@@ -1,6 +1,5 @@
 """Agent execution model for state persistence."""
 
-import uuid
 from sqlalchemy import Column, String, Text, Integer, TIMESTAMP, func, Enum
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from src.database import Base
@@ -11,7 +10,7 @@ class AgentExecution(Base):
 
     __tablename__ = "agent_executions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     session_id = Column(String(255), nullable=False, index=True)
     status = Column(
         Enum("running", "paused", "completed", "failed", name="execution_status"),
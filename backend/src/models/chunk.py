@@ -1,10 +1,40 @@
 """Chunk model for text chunks with embeddings."""
 
-import uuid
-from sqlalchemy import Column, String, Text, Integer, TIMESTAMP, ForeignKey, Index, func, Computed
+from sqlalchemy import (
+    DDL,
+    Column,
+    String,
+    Text,
+    Integer,
+    TIMESTAMP,
+    ForeignKey,
+    Index,
+    func,
+    Computed,
+    event,
+)
 from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 from src.database import Base
+from src.utils.vector_index import HNSW_M, HNSW_EF_CONSTRUCTION
+
+# Hash partitions of the chunks table, keyed on paper_id
+CHUNK_PARTITIONS = 16
+
+
+class BinaryHalfVec(HALFVEC):
+    """
+    halfvec column bound through the asyncpg pgvector codec.
+
+    HALFVEC formats values as text for the server to parse; with the binary
+    codec registered on each connection (see src.database), lists are passed
+    through and encoded as raw half-precision floats instead.
+    """
+
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        return None
 
 
 class Chunk(Base):
@@ -13,13 +43,13 @@ class Chunk(Base):
     __tablename__ = "chunks"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
 
-    # Foreign key to papers
+    # Foreign key to papers; also the partition key, so part of the primary key
     paper_id = Column(
         UUID(as_uuid=True),
         ForeignKey("papers.id", ondelete="CASCADE"),
-        nullable=False,
+        primary_key=True,
         index=True,
     )
     arxiv_id = Column(String(50), nullable=False, index=True)  # Denormalized for faster queries
@@ -33,8 +63,8 @@ class Chunk(Base):
     page_number = Column(Integer, nullable=True)
     word_count = Column(Integer, nullable=True)
 
-    # Embedding (1024 dimensions for Jina v3)
-    embedding = Column(Vector(1024), nullable=False)
+    # Embedding (1024 dimensions for Jina v3, stored as half precision)
+    embedding = Column(BinaryHalfVec(1024), nullable=False)
 
     # Full-text search vector (generated column - computed by database)
     search_vector = Column(TSVECTOR, Computed("to_tsvector('english', chunk_text)"))
@@ -43,16 +73,39 @@ class Chunk(Base):
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
     __table_args__ = (
-        Index("idx_chunks_paper_chunk_unique", "paper_id", "chunk_index", unique=True),
+        # Covers chunk metadata for index-only per-paper scans; chunk_text would
+        # exceed the B-tree tuple size limit
+        Index(
+            "idx_chunks_paper_chunk_unique",
+            "paper_id",
+            "chunk_index",
+            unique=True,
+            postgresql_include=["section_name", "page_number", "word_count"],
+        ),
         Index(
             "idx_chunks_embedding",
             "embedding",
             postgresql_using="hnsw",
-            postgresql_with={"m": 16, "ef_construction": 64},
-            postgresql_ops={"embedding": "vector_cosine_ops"},
+            postgresql_with={"m": HNSW_M, "ef_construction": HNSW_EF_CONSTRUCTION},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
         ),
+        # fastupdate is turned off on each partition's index by migration 011;
+        # storage parameters can't be set on the partitioned parent index
         Index("idx_chunks_search_vector", "search_vector", postgresql_using="gin"),
+        {"postgresql_partition_by": "HASH (paper_id)"},
     )
 
     def __repr__(self):
         return f"<Chunk(arxiv_id='{self.arxiv_id}', chunk_index={self.chunk_index})>"
+
+
+# Partitions are created alongside the table; indexes on chunks cascade to each
+for _remainder in range(CHUNK_PARTITIONS):
+    event.listen(
+        Chunk.__table__,
+        "after_create",
+        DDL(
+            f"CREATE TABLE chunks_p{_remainder} PARTITION OF chunks "
+            f"FOR VALUES WITH (MODULUS {CHUNK_PARTITIONS}, REMAINDER {_remainder})"
+        ),
+    )
@@ -1,6 +1,5 @@
 """Conversation models for multi-turn memory."""
 
-import uuid
 from sqlalchemy import Column, String, Text, Integer, ForeignKey, TIMESTAMP, func, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
@@ -12,18 +11,22 @@ class Conversation(Base):
 
     __tablename__ = "conversations"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     session_id = Column(String(255), unique=True, nullable=False, index=True)
     metadata_ = Column("metadata_", JSONB, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
     updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now())
 
-    # Relationship to turns
+    # Relationship to turns. Never lazy-loaded: queries that need turns
+    # eager-load them with selectinload, so a missed one fails loudly instead
+    # of issuing a hidden query. Deletes leave the turns to ON DELETE CASCADE.
     turns = relationship(
         "ConversationTurn",
         back_populates="conversation",
         cascade="all, delete-orphan",
         order_by="ConversationTurn.turn_number",
+        lazy="raise",
+        passive_deletes=True,
     )
 
     def __repr__(self):
@@ -35,12 +38,11 @@ class ConversationTurn(Base):
 
     __tablename__ = "conversation_turns"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     conversation_id = Column(
         UUID(as_uuid=True),
         ForeignKey("conversations.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     turn_number = Column(Integer, nullable=False)
     user_query = Column(Text, nullable=False)
@@ -55,9 +57,10 @@ class ConversationTurn(Base):
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
     # Relationship to conversation
-    conversation = relationship("Conversation", back_populates="turns")
+    conversation = relationship("Conversation", back_populates="turns", lazy="raise")
 
-    # Unique constraint on (conversation_id, turn_number)
+    # Unique constraint on (conversation_id, turn_number); its index also
+    # serves lookups by conversation_id alone
     __table_args__ = (
         UniqueConstraint(
             "conversation_id",
@@ -1,7 +1,6 @@
 """Paper model for arXiv papers."""
 
-import uuid
-from sqlalchemy import Column, String, Text, Boolean, TIMESTAMP, func
+from sqlalchemy import Column, String, Text, Boolean, TIMESTAMP, Index, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from src.database import Base
 
@@ -12,7 +11,7 @@ class Paper(Base):
     __tablename__ = "papers"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
 
     # arXiv metadata
     arxiv_id = Column(String(50), unique=True, nullable=False, index=True)
@@ -38,5 +37,25 @@ class Paper(Base):
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
     updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        # Serve containment filters such as categories @> '["cs.LG"]'
+        Index(
+            "idx_papers_categories",
+            "categories",
+            postgresql_using="gin",
+            postgresql_ops={"categories": "jsonb_path_ops"},
+        ),
+        Index(
+            "idx_papers_authors",
+            "authors",
+            postgresql_using="gin",
+            postgresql_ops={"authors": "jsonb_path_ops"},
+        ),
+        # Keyset pagination: WHERE (sort_column, id) < (...) ORDER BY sort_column, id
+        Index("idx_papers_created_at_id", "created_at", "id"),
+        Index("idx_papers_updated_at_id", "updated_at", "id"),
+        Index("idx_papers_published_date_id", "published_date", "id"),
+    )
+
     def __repr__(self):
         return f"<Paper(arxiv_id='{self.arxiv_id}', title='{self.title[:50]}...')>"
@@ -1,9 +1,10 @@
 """Repository for AgentExecution model operations."""
 
-from typing import Optional, List
+from typing import Optional, List, cast
 from uuid import UUID
-from sqlalchemy import select, desc
+from sqlalchemy import Table, select, delete, desc, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 from src.models.agent_execution import AgentExecution
 from src.utils.logger import get_logger
 
@@ -39,17 +40,23 @@ class AgentExecutionRepository:
         Returns:
             Created AgentExecution instance
         """
-        execution = AgentExecution(
-            session_id=session_id,
-            state_snapshot=state_snapshot,
-            status=status,
-            iteration=iteration,
-            pause_reason=pause_reason,
-            error_message=error_message,
+        # RETURNING brings back the generated id and timestamps with the INSERT
+        result = await self.session.execute(
+            insert(AgentExecution)
+            .values(
+                session_id=session_id,
+                state_snapshot=state_snapshot,
+                status=status,
+                iteration=iteration,
+                pause_reason=pause_reason,
+                error_message=error_message,
+            )
+            .returning(AgentExecution)
         )
-        self.session.add(execution)
+        execution = result.scalar_one()
+        # Detach so the commit doesn't expire the loaded columns
+        self.session.expunge(execution)
         await self.session.commit()
-        await self.session.refresh(execution)
 
         log.debug(
             "execution state saved",
@@ -59,6 +66,41 @@ class AgentExecutionRepository:
         )
         return execution
 
+    async def save_states(self, states: List[dict], batch_size: int = 500) -> int:
+        """
+        Save several execution states with multi-row INSERTs.
+
+        Args:
+            states: Dicts with save_state's keyword arguments (session_id and
+                state_snapshot required)
+            batch_size: Maximum rows per INSERT statement
+
+        Returns:
+            Number of executions written
+        """
+        if not states:
+            return 0
+
+        rows = [
+            {
+                "session_id": state["session_id"],
+                "state_snapshot": state["state_snapshot"],
+                "status": state.get("status", "running"),
+                "iteration": state.get("iteration", 0),
+                "pause_reason": state.get("pause_reason"),
+                "error_message": state.get("error_message"),
+            }
+            for state in states
+        ]
+
+        stmt = insert(AgentExecution)
+        for start in range(0, len(rows), batch_size):
+            await self.session.execute(stmt, rows[start : start + batch_size])
+        await self.session.commit()
+
+        log.debug("execution states saved", count=len(rows))
+        return len(rows)
+
     async def load_state(self, execution_id: UUID) -> Optional[AgentExecution]:
         """
         Load an execution state by ID.
@@ -116,25 +158,34 @@ class AgentExecutionRepository:
         Returns:
             Updated AgentExecution if found, None otherwise
         """
+        values: dict = {"status": status}
+        if state_snapshot is not None:
+            values["state_snapshot"] = state_snapshot
+        if pause_reason is not None:
+            values["pause_reason"] = pause_reason
+        if error_message is not None:
+            values["error_message"] = error_message
+
+        executions = cast(Table, AgentExecution.__table__)
+        # Core RETURNING leaves the identity map alone, so an instance the
+        # caller already loaded stays attached (and is expired by the commit)
         result = await self.session.execute(
-            select(AgentExecution).where(AgentExecution.id == execution_id)
+            update(executions)
+            .where(executions.c.id == execution_id)
+            .values(**values)
+            .returning(*executions.c)
         )
-        execution = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if not execution:
+        if row is None:
             log.warning("execution not found for update", execution_id=str(execution_id))
             return None
 
-        execution.status = status
-        if state_snapshot is not None:
-            execution.state_snapshot = state_snapshot
-        if pause_reason is not None:
-            execution.pause_reason = pause_reason
-        if error_message is not None:
-            execution.error_message = error_message
-
         await self.session.commit()
-        await self.session.refresh(execution)
+
+        # Built only once the commit succeeded, detached as if freshly loaded
+        execution = AgentExecution(**row._mapping)
+        make_transient_to_detached(execution)
 
         log.debug(
             "execution status updated",
@@ -175,17 +226,15 @@ class AgentExecutionRepository:
             True if deleted, False if not found
         """
         result = await self.session.execute(
-            select(AgentExecution).where(AgentExecution.id == execution_id)
+            delete(AgentExecution).where(AgentExecution.id == execution_id)
         )
-        execution = result.scalar_one_or_none()
+        deleted = (result.rowcount or 0) > 0
 
-        if execution:
-            await self.session.delete(execution)
+        if deleted:
             await self.session.commit()
             log.info("execution deleted", execution_id=str(execution_id))
-            return True
 
-        return False
+        return deleted
 
     async def cleanup_old_executions(
         self, session_id: str, keep_count: int = 5
@@ -200,19 +249,17 @@ class AgentExecutionRepository:
         Returns:
             Number of executions deleted
         """
-        # Get all executions for the session
-        result = await self.session.execute(
-            select(AgentExecution)
+        # Everything past the newest keep_count, removed in one statement
+        stale_ids = (
+            select(AgentExecution.id)
             .where(AgentExecution.session_id == session_id)
             .order_by(desc(AgentExecution.created_at))
+            .offset(keep_count)
         )
-        executions = list(result.scalars().all())
-
-        # Delete older ones
-        deleted_count = 0
-        for execution in executions[keep_count:]:
-            await self.session.delete(execution)
-            deleted_count += 1
+        result = await self.session.execute(
+            delete(AgentExecution).where(AgentExecution.id.in_(stale_ids))
+        )
+        deleted_count = result.rowcount or 0
 
         if deleted_count > 0:
             await self.session.commit()
@@ -1,13 +1,37 @@
 """Repository for Chunk model operations."""
 
-from typing import List
-from sqlalchemy import select, delete
+import uuid
+from typing import List, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import bindparam, delete, func, insert, lambda_stmt, select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.chunk import Chunk
 from src.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# Columns written by COPY; id, created_at and search_vector are filled by the database
+COPY_COLUMNS = (
+    "paper_id",
+    "arxiv_id",
+    "chunk_text",
+    "chunk_index",
+    "section_name",
+    "page_number",
+    "word_count",
+    "embedding",
+)
+
+# create_bulk switches from INSERT to COPY at this many rows; below it COPY's
+# setup and the follow-up SELECT cost more than they save
+COPY_THRESHOLD = 100
+
+# Cached by code location, so the statement isn't rebuilt and hashed per call
+_GET_BY_PAPER_ID = lambda_stmt(
+    lambda: select(Chunk).where(Chunk.paper_id == bindparam("paper_id")).order_by(Chunk.chunk_index)
+)
+
 
 class ChunkRepository:
     """Repository for Chunk CRUD operations."""
@@ -16,20 +40,99 @@ class ChunkRepository:
         self.session = session
 
     async def create_bulk(self, chunks_data: List[dict]) -> List[Chunk]:
-        """Create multiple chunks at once."""
-        chunks = [Chunk(**data) for data in chunks_data]
-        self.session.add_all(chunks)
-        await self.session.commit()
+        """
+        Create multiple chunks at once.
+
+        Small batches use INSERT ... RETURNING. From COPY_THRESHOLD rows the
+        chunks are written with a binary COPY and read back by their
+        (paper_id, chunk_index) key, since COPY returns no rows. Either way
+        the chunks are detached and then committed together.
+
+        Args:
+            chunks_data: Chunk dicts keyed by column name
+
+        Returns:
+            Created chunks
+        """
+        if not chunks_data:
+            return []
+        if len(chunks_data) >= COPY_THRESHOLD:
+            await self._copy_records(chunks_data)
+            keys = [(data["paper_id"], data["chunk_index"]) for data in chunks_data]
+            result = await self.session.scalars(
+                select(Chunk)
+                .where(tuple_(Chunk.paper_id, Chunk.chunk_index).in_(keys))
+                .order_by(Chunk.paper_id, Chunk.chunk_index)
+            )
+        else:
+            result = await self.session.scalars(insert(Chunk).returning(Chunk), chunks_data)
+        chunks = list(result.all())
+        # Already fully loaded; detach so the commit doesn't expire them
         for chunk in chunks:
-            await self.session.refresh(chunk)
-        log.debug("chunks created", count=len(chunks))
+            self.session.expunge(chunk)
+        await self.session.commit()
+        log.debug("chunks created", count=len(chunks), copied=len(chunks_data) >= COPY_THRESHOLD)
         return chunks
 
+    async def copy_bulk(self, chunks_data: List[dict]) -> int:
+        """
+        Insert chunks with a binary PostgreSQL COPY instead of per-row INSERTs.
+
+        Rows stream to the server in COPY's binary format, so embeddings are
+        sent as raw half-precision floats rather than formatted text, and no
+        per-statement parse/plan is paid. Runs inside the session's
+        transaction and commits on success.
+
+        Args:
+            chunks_data: Chunk dicts with the same keys as create_bulk
+
+        Returns:
+            Number of chunks inserted
+        """
+        if not chunks_data:
+            return 0
+
+        await self._copy_records(chunks_data)
+        await self.session.commit()
+
+        log.debug("chunks copied", count=len(chunks_data))
+        return len(chunks_data)
+
+    async def _copy_records(self, chunks_data: List[dict]) -> None:
+        """COPY chunks into the table within the session's transaction, without committing."""
+        conn = await self.session.connection()
+        # The asyncpg adapter only sends BEGIN with the first statement it
+        # executes, and COPY goes around it on the driver connection; run a
+        # statement through the adapter first so COPY isn't autocommitted
+        await conn.exec_driver_sql("SELECT 1")
+        raw_conn = await conn.get_raw_connection()
+        driver_conn = raw_conn.driver_connection
+        if driver_conn is None:
+            raise RuntimeError("No driver connection available for COPY")
+
+        await driver_conn.copy_records_to_table(
+            Chunk.__tablename__,
+            records=map(self._to_record, chunks_data),
+            columns=list(COPY_COLUMNS),
+        )
+
+    @staticmethod
+    def _to_record(data: dict) -> tuple:
+        """Order a chunk dict as a COPY record matching COPY_COLUMNS."""
+        return (
+            data["paper_id"],
+            data["arxiv_id"],
+            data["chunk_text"],
+            data["chunk_index"],
+            data.get("section_name"),
+            data.get("page_number"),
+            data.get("word_count"),
+            data["embedding"],
+        )
+
     async def get_by_paper_id(self, paper_id: str) -> List[Chunk]:
         """Get all chunks for a paper."""
-        result = await self.session.execute(
-            select(Chunk).where(Chunk.paper_id == paper_id).order_by(Chunk.chunk_index)
-        )
+        result = await self.session.execute(_GET_BY_PAPER_ID, {"paper_id": paper_id})
         chunks = list(result.scalars().all())
         log.debug("chunks query by paper_id", paper_id=paper_id, count=len(chunks))
         return chunks
@@ -43,6 +146,41 @@ class ChunkRepository:
         log.debug("chunks query by arxiv_id", arxiv_id=arxiv_id, count=len(chunks))
         return chunks
 
+    async def get_embeddings(
+        self, chunk_ids: Sequence[uuid.UUID | str]
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Load chunk embeddings into one contiguous float32 matrix.
+
+        Bypasses the ORM, whose halfvec type converts each embedding to a list
+        of Python floats; the binary codec's values are viewed as float16
+        arrays and copied straight into their matrix row, ready for vectorized
+        scoring (e.g. matrix @ query).
+
+        Args:
+            chunk_ids: IDs of the chunks to load
+
+        Returns:
+            (chunk IDs in row order, array of shape (len(ids), dimensions));
+            IDs that don't exist are left out
+        """
+        if not chunk_ids:
+            return [], np.empty((0, 0), dtype=np.float32)
+
+        result = await self.session.execute(
+            text("SELECT id, embedding FROM chunks WHERE id = ANY(:ids)"),
+            {"ids": [uuid.UUID(str(chunk_id)) for chunk_id in chunk_ids]},
+        )
+        rows = result.all()
+        if not rows:
+            return [], np.empty((0, 0), dtype=np.float32)
+
+        matrix = np.empty((len(rows), rows[0].embedding.dimensions()), dtype=np.float32)
+        for i, row in enumerate(rows):
+            matrix[i] = row.embedding.to_numpy()
+
+        return [str(row.id) for row in rows], matrix
+
     async def delete_by_paper_id(self, paper_id: str) -> int:
         """Delete all chunks for a paper. Returns count deleted."""
         result = await self.session.execute(delete(Chunk).where(Chunk.paper_id == paper_id))
@@ -53,12 +191,12 @@ class ChunkRepository:
 
     async def count_by_paper_id(self, paper_id: str) -> int:
         """Count chunks for a paper."""
-        result = await self.session.execute(select(Chunk.id).where(Chunk.paper_id == paper_id))
-        return len(list(result.scalars().all()))
+        count = await self.session.scalar(
+            select(func.count()).select_from(Chunk).where(Chunk.paper_id == paper_id)
+        )
+        return count or 0
 
     async def count(self) -> int:
         """Get total count of chunks."""
-        from sqlalchemy import func
-
         result = await self.session.execute(select(func.count()).select_from(Chunk))
         return result.scalar_one()
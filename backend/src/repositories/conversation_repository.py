@@ -1,7 +1,8 @@
 """Repository for Conversation model operations."""
 
 from typing import Optional, List, Tuple
-from sqlalchemy import select, func, desc
+from sqlalchemy import bindparam, desc, func, insert, lambda_stmt, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
@@ -11,6 +12,18 @@ from src.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# Read on every chat request; cached by code location, so the statement isn't
+# rebuilt and hashed per call. An unknown session simply matches no turns.
+_GET_HISTORY = lambda_stmt(
+    lambda: (
+        select(ConversationTurn)
+        .join(Conversation)
+        .where(Conversation.session_id == bindparam("session_id"))
+        .order_by(desc(ConversationTurn.turn_number))
+        .limit(bindparam("limit"))
+    )
+)
+
 
 class ConversationRepository:
     """Repository for conversation CRUD operations."""
@@ -56,18 +69,7 @@ class ConversationRepository:
             List of ConversationTurn in chronological order
         """
         result = await self.session.execute(
-            select(Conversation).where(Conversation.session_id == session_id)
-        )
-        conv = result.scalar_one_or_none()
-
-        if not conv:
-            return []
-
-        result = await self.session.execute(
-            select(ConversationTurn)
-            .where(ConversationTurn.conversation_id == conv.id)
-            .order_by(desc(ConversationTurn.turn_number))
-            .limit(limit)
+            _GET_HISTORY, {"session_id": session_id, "limit": limit}
         )
         turns = list(result.scalars().all())
 
@@ -78,7 +80,9 @@ class ConversationRepository:
         """
         Save a conversation turn with optimistic retry.
 
-        Retries on unique constraint violation to handle concurrent requests.
+        The conversation is upserted and the turn numbered within its INSERT,
+        without row locks. Retries on unique constraint violation, which only
+        happens when concurrent requests pick the same turn number.
 
         Args:
             session_id: Session identifier
@@ -94,47 +98,51 @@ class ConversationRepository:
 
         for attempt in range(max_retries):
             try:
-                result = await self.session.execute(
-                    select(Conversation)
-                    .where(Conversation.session_id == session_id)
-                    .with_for_update()
+                await self.session.execute(
+                    pg_insert(Conversation)
+                    .values(session_id=session_id)
+                    .on_conflict_do_nothing(index_elements=[Conversation.session_id])
                 )
-                conv = result.scalar_one_or_none()
 
-                if not conv:
-                    conv = Conversation(session_id=session_id)
-                    self.session.add(conv)
-                    await self.session.flush()
+                # Number the turn inside the INSERT instead of locking the
+                # conversation; a concurrent writer that takes the same number
+                # hits the unique constraint and is retried below
+                next_turn = (
+                    select(func.coalesce(func.max(ConversationTurn.turn_number) + 1, 0))
+                    .where(ConversationTurn.conversation_id == Conversation.id)
+                    .scalar_subquery()
+                )
+                values = {
+                    "user_query": turn.user_query,
+                    "agent_response": turn.agent_response,
+                    "guardrail_score": turn.guardrail_score,
+                    "retrieval_attempts": turn.retrieval_attempts,
+                    "rewritten_query": turn.rewritten_query,
+                    "sources": turn.sources,
+                    "reasoning_steps": turn.reasoning_steps,
+                    "provider": turn.provider,
+                    "model": turn.model,
+                }
+                source = select(
+                    Conversation.id,
+                    next_turn,
+                    *(
+                        literal(value, ConversationTurn.__table__.c[column].type)
+                        for column, value in values.items()
+                    ),
+                ).where(Conversation.session_id == session_id)
 
-                # Lock the last turn to prevent concurrent inserts
                 result = await self.session.execute(
-                    select(ConversationTurn.turn_number)
-                    .where(ConversationTurn.conversation_id == conv.id)
-                    .order_by(ConversationTurn.turn_number.desc())
-                    .limit(1)
-                    .with_for_update()
+                    insert(ConversationTurn)
+                    .from_select(["conversation_id", "turn_number", *values], source)
+                    .returning(ConversationTurn)
                 )
-                max_turn = result.scalar_one_or_none()
-                turn_number = (max_turn if max_turn is not None else -1) + 1
-
-                ct = ConversationTurn(
-                    conversation_id=conv.id,
-                    turn_number=turn_number,
-                    user_query=turn.user_query,
-                    agent_response=turn.agent_response,
-                    guardrail_score=turn.guardrail_score,
-                    retrieval_attempts=turn.retrieval_attempts,
-                    rewritten_query=turn.rewritten_query,
-                    sources=turn.sources,
-                    reasoning_steps=turn.reasoning_steps,
-                    provider=turn.provider,
-                    model=turn.model,
-                )
-                self.session.add(ct)
+                ct = result.scalar_one()
+                # Loaded by RETURNING; detach so the commit doesn't expire it
+                self.session.expunge(ct)
                 await self.session.commit()
-                await self.session.refresh(ct)
 
-                log.debug("turn saved", session_id=session_id, turn_number=turn_number)
+                log.debug("turn saved", session_id=session_id, turn_number=ct.turn_number)
                 return ct
 
             except IntegrityError:
@@ -148,6 +156,95 @@ class ConversationRepository:
         # Should never reach here, but satisfy type checker
         raise IntegrityError("Failed to save turn after max retries", None, None)
 
+    async def save_turns(
+        self, session_id: str, turns: List[TurnData], batch_size: int = 500
+    ) -> int:
+        """
+        Save several conversation turns with multi-row inserts and optimistic retry.
+
+        Turns are numbered sequentially after the conversation's latest turn and
+        written in batches of multi-VALUES INSERT, one round-trip per batch
+        instead of one per turn. No row locks are taken; if a concurrent writer
+        claims any of the numbers, the transaction is rolled back and the whole
+        set is renumbered and retried.
+
+        Args:
+            session_id: Session identifier
+            turns: Turns to append, in chronological order
+            batch_size: Maximum rows per INSERT statement
+
+        Returns:
+            Number of turns written
+
+        Raises:
+            IntegrityError: If unable to save after max retries
+        """
+        if not turns:
+            return 0
+
+        max_retries = 3
+
+        for attempt in range(max_retries):
+            try:
+                await self.session.execute(
+                    pg_insert(Conversation)
+                    .values(session_id=session_id)
+                    .on_conflict_do_nothing(index_elements=[Conversation.session_id])
+                )
+                conversation_id = await self.session.scalar(
+                    select(Conversation.id).where(Conversation.session_id == session_id)
+                )
+                max_turn = await self.session.scalar(
+                    select(func.max(ConversationTurn.turn_number)).where(
+                        ConversationTurn.conversation_id == conversation_id
+                    )
+                )
+                first_turn = (max_turn if max_turn is not None else -1) + 1
+
+                rows = [
+                    {
+                        "conversation_id": conversation_id,
+                        "turn_number": first_turn + offset,
+                        "user_query": turn.user_query,
+                        "agent_response": turn.agent_response,
+                        "guardrail_score": turn.guardrail_score,
+                        "retrieval_attempts": turn.retrieval_attempts,
+                        "rewritten_query": turn.rewritten_query,
+                        "sources": turn.sources,
+                        "reasoning_steps": turn.reasoning_steps,
+                        "provider": turn.provider,
+                        "model": turn.model,
+                    }
+                    for offset, turn in enumerate(turns)
+                ]
+
+                # Plain INSERT, never an upsert: a number taken concurrently must
+                # fail the batch rather than overwrite the other writer's turn
+                for start in range(0, len(rows), batch_size):
+                    await self.session.execute(
+                        insert(ConversationTurn), rows[start : start + batch_size]
+                    )
+                await self.session.commit()
+
+                log.debug(
+                    "turns saved",
+                    session_id=session_id,
+                    count=len(rows),
+                    first_turn=first_turn,
+                )
+                return len(rows)
+
+            except IntegrityError:
+                await self.session.rollback()
+                self.session.expire_all()
+                log.warning("turns save retry", session_id=session_id, attempt=attempt + 1)
+                if attempt == max_retries - 1:
+                    raise
+                continue
+
+        # Should never reach here, but satisfy type checker
+        raise IntegrityError("Failed to save turns after max retries", None, None)
+
     async def delete(self, session_id: str) -> bool:
         """
         Delete a conversation and all its turns.
@@ -175,6 +272,8 @@ class ConversationRepository:
         """
         Get conversation by session ID.
 
+        Turns are not loaded; use get_with_turns when they are needed.
+
         Args:
             session_id: Session identifier
 
@@ -196,18 +295,13 @@ class ConversationRepository:
         Returns:
             Number of turns
         """
-        result = await self.session.execute(
-            select(Conversation).where(Conversation.session_id == session_id)
-        )
-        conv = result.scalar_one_or_none()
-
-        if not conv:
-            return 0
-
-        result = await self.session.execute(
-            select(func.count()).where(ConversationTurn.conversation_id == conv.id)
+        count = await self.session.scalar(
+            select(func.count())
+            .select_from(ConversationTurn)
+            .join(Conversation)
+            .where(Conversation.session_id == session_id)
         )
-        return result.scalar_one() or 0
+        return count or 0
 
     async def get_all(self, offset: int = 0, limit: int = 20) -> Tuple[List[Conversation], int]:
         """
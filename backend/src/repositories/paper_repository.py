@@ -1,25 +1,56 @@
 """Repository for Paper model operations."""
 
-from typing import Optional, List, Literal
+import uuid
+from typing import Optional, List, Literal, Tuple, cast
 from datetime import datetime
-from sqlalchemy import select, update, delete, func, desc, asc, or_
+from sqlalchemy import (
+    Table,
+    asc,
+    bindparam,
+    delete,
+    desc,
+    exists,
+    func,
+    lambda_stmt,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 from src.models.paper import Paper
+from src.utils.count_cache import CountCache
 from src.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# (sort column value, paper id) of the last paper on the previous page
+PageCursor = Tuple[datetime, uuid.UUID]
+
+# Hot lookups as lambda statements: SQLAlchemy caches their cache key by code
+# location instead of rebuilding and hashing the expression on every call
+_GET_BY_ID = lambda_stmt(lambda: select(Paper).where(Paper.id == bindparam("paper_id")))
+_GET_BY_ARXIV_ID = lambda_stmt(lambda: select(Paper).where(Paper.arxiv_id == bindparam("arxiv_id")))
+
 
 class PaperRepository:
     """Repository for Paper CRUD operations."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, count_cache: Optional[CountCache] = None):
         self.session = session
+        # Unfiltered paper count reused across requests (recounted every call if None)
+        self.count_cache = count_cache
+
+    def invalidate_count(self) -> None:
+        """Forget the cached unfiltered count; call once a create or delete is committed."""
+        if self.count_cache is not None:
+            self.count_cache.invalidate()
 
     async def get_by_id(self, paper_id: str) -> Optional[Paper]:
         """Get paper by UUID."""
         log.debug("query paper by id", paper_id=paper_id)
-        result = await self.session.execute(select(Paper).where(Paper.id == paper_id))
+        result = await self.session.execute(_GET_BY_ID, {"paper_id": paper_id})
         paper = result.scalar_one_or_none()
         log.debug("query result", found=paper is not None)
         return paper
@@ -27,7 +58,7 @@ class PaperRepository:
     async def get_by_arxiv_id(self, arxiv_id: str) -> Optional[Paper]:
         """Get paper by arXiv ID."""
         log.debug("query paper by arxiv_id", arxiv_id=arxiv_id)
-        result = await self.session.execute(select(Paper).where(Paper.arxiv_id == arxiv_id))
+        result = await self.session.execute(_GET_BY_ARXIV_ID, {"arxiv_id": arxiv_id})
         paper = result.scalar_one_or_none()
         log.debug("query result", found=paper is not None)
         return paper
@@ -38,20 +69,33 @@ class PaperRepository:
         self.session.add(paper)
         await self.session.commit()
         await self.session.refresh(paper)
+        self.invalidate_count()
         log.debug("paper created", arxiv_id=paper.arxiv_id)
         return paper
 
     async def update(self, paper_id: str, update_data: dict) -> Optional[Paper]:
         """Update paper."""
         update_data["updated_at"] = datetime.utcnow()
-        await self.session.execute(update(Paper).where(Paper.id == paper_id).values(**update_data))
+        papers = cast(Table, Paper.__table__)
+        # Core RETURNING keeps the row out of the identity map, so the commit
+        # has nothing to expire
+        result = await self.session.execute(
+            update(papers).where(papers.c.id == paper_id).values(**update_data).returning(*papers.c)
+        )
+        row = result.one_or_none()
         await self.session.commit()
+        if row is None:
+            return None
+
+        # Built only once the commit succeeded, detached as if freshly loaded
+        paper = Paper(**row._mapping)
+        make_transient_to_detached(paper)
         log.debug("paper updated", paper_id=paper_id)
-        return await self.get_by_id(paper_id)
+        return paper
 
     async def mark_as_processed(
         self, paper_id: str, raw_text: str, sections: List[dict], parser_used: str
-    ) -> Paper:
+    ) -> Optional[Paper]:
         """Mark paper as processed with content."""
         return await self.update(
             paper_id,
@@ -75,8 +119,40 @@ class PaperRepository:
 
     async def exists(self, arxiv_id: str) -> bool:
         """Check if paper exists by arXiv ID."""
-        result = await self.session.execute(select(Paper.id).where(Paper.arxiv_id == arxiv_id))
-        return result.scalar_one_or_none() is not None
+        # EXISTS stops at the first hit on the unique arxiv_id index
+        return bool(await self.session.scalar(select(exists().where(Paper.arxiv_id == arxiv_id))))
+
+    async def exists_many(self, arxiv_ids: List[str]) -> set[str]:
+        """
+        Check which of several papers exist, in one query.
+
+        Args:
+            arxiv_ids: arXiv IDs to check
+
+        Returns:
+            The subset of arxiv_ids that are stored
+        """
+        if not arxiv_ids:
+            return set()
+        result = await self.session.scalars(
+            select(Paper.arxiv_id).where(Paper.arxiv_id.in_(arxiv_ids))
+        )
+        return set(result.all())
+
+    async def get_many_by_arxiv_ids(self, arxiv_ids: List[str]) -> dict[str, Paper]:
+        """
+        Get several papers by arXiv ID in one query.
+
+        Args:
+            arxiv_ids: arXiv IDs to load
+
+        Returns:
+            Papers keyed by arXiv ID; IDs that aren't stored are left out
+        """
+        if not arxiv_ids:
+            return {}
+        result = await self.session.scalars(select(Paper).where(Paper.arxiv_id.in_(arxiv_ids)))
+        return {str(paper.arxiv_id): paper for paper in result.all()}
 
     async def count(self) -> int:
         """Get total count of papers."""
@@ -95,6 +171,8 @@ class PaperRepository:
         query: Optional[str] = None,
         sort_by: Literal["created_at", "published_date", "updated_at"] = "created_at",
         sort_order: Literal["asc", "desc"] = "desc",
+        partial_match: bool = False,
+        cursor: Optional[PageCursor] = None,
     ) -> tuple[List[Paper], int]:
         """
         Get paginated list of papers with optional filters.
@@ -103,13 +181,17 @@ class PaperRepository:
             offset: Number of papers to skip
             limit: Maximum number of papers to return
             processed_only: Filter by pdf_processed status
-            category_filter: Filter by category (case-insensitive substring match)
-            author_filter: Filter by author (case-insensitive substring match)
+            category_filter: Filter by category (exact match)
+            author_filter: Filter by author (exact match)
             start_date: Filter papers published on or after this date
             end_date: Filter papers published on or before this date
             query: Search term for title/abstract (case-insensitive)
             sort_by: Field to sort by
             sort_order: Sort order (asc or desc)
+            partial_match: Match categories and authors by case-insensitive
+                substring instead; this can't use the GIN indexes
+            cursor: Continue after this (sort_by value, id) of the previous
+                page's last paper instead of skipping offset rows
 
         Returns:
             Tuple of (list of papers, total count matching filters)
@@ -125,34 +207,29 @@ class PaperRepository:
 
         stmt = select(Paper)
         count_stmt = select(func.count()).select_from(Paper)
+        filtered = False
 
         def apply_filter(condition):
-            nonlocal stmt, count_stmt
+            nonlocal stmt, count_stmt, filtered
             stmt = stmt.where(condition)
             count_stmt = count_stmt.where(condition)
+            filtered = True
 
         if processed_only is not None:
             apply_filter(Paper.pdf_processed == processed_only)
 
         if category_filter:
-            condition = func.exists(
-                select(1).where(
-                    func.lower(func.jsonb_array_elements_text(Paper.categories)).like(
-                        f"%{category_filter.lower()}%"
-                    )
-                )
-            )
-            apply_filter(condition)
+            if partial_match:
+                apply_filter(self._array_element_like(Paper.categories, category_filter))
+            else:
+                # jsonb @> is served by the GIN index
+                apply_filter(Paper.categories.contains([category_filter]))
 
         if author_filter:
-            condition = func.exists(
-                select(1).where(
-                    func.lower(func.jsonb_array_elements_text(Paper.authors)).like(
-                        f"%{author_filter.lower()}%"
-                    )
-                )
-            )
-            apply_filter(condition)
+            if partial_match:
+                apply_filter(self._array_element_like(Paper.authors, author_filter))
+            else:
+                apply_filter(Paper.authors.contains([author_filter]))
 
         if start_date:
             apply_filter(Paper.published_date >= start_date)
@@ -164,11 +241,28 @@ class PaperRepository:
             pattern = f"%{query}%"
             apply_filter(or_(Paper.title.ilike(pattern), Paper.abstract.ilike(pattern)))
 
-        total = await self.session.scalar(count_stmt) or 0
-
+        cached_total = None
+        if not filtered and self.count_cache is not None:
+            cached_total = self.count_cache.get()
+        if cached_total is not None:
+            total = cached_total
+        else:
+            total = await self.session.scalar(count_stmt) or 0
+            if not filtered and self.count_cache is not None:
+                self.count_cache.set(total)
+
+        # id breaks ties so the order is total and a cursor position unique
         sort_column = getattr(Paper, sort_by)
         order_func = desc if sort_order == "desc" else asc
-        stmt = stmt.order_by(order_func(sort_column)).offset(offset).limit(limit)
+        stmt = stmt.order_by(order_func(sort_column), order_func(Paper.id))
+        if cursor is not None:
+            # Keyset pagination: seek past the cursor via the sort index
+            # instead of reading and discarding offset rows
+            position = tuple_(sort_column, Paper.id)
+            stmt = stmt.where(position < cursor if sort_order == "desc" else position > cursor)
+        else:
+            stmt = stmt.offset(offset)
+        stmt = stmt.limit(limit)
 
         result = await self.session.execute(stmt)
         papers = list(result.scalars().all())
@@ -176,11 +270,21 @@ class PaperRepository:
         log.debug("papers query result", count=len(papers), total=total)
         return papers, total
 
+    @staticmethod
+    def _array_element_like(column, term: str):
+        """Condition matching rows where any JSONB array element contains term, ignoring case."""
+        return func.exists(
+            select(1).where(
+                func.lower(func.jsonb_array_elements_text(column)).like(f"%{term.lower()}%")
+            )
+        )
+
     async def delete(self, paper_id: str) -> bool:
         """
         Delete a paper by ID.
 
-        Chunks are automatically deleted via CASCADE foreign key.
+        Chunks are automatically deleted via CASCADE foreign key. The caller
+        commits, then calls invalidate_count().
 
         Args:
             paper_id: UUID of the paper to delete
@@ -198,7 +302,8 @@ class PaperRepository:
         """
         Delete a paper by arXiv ID.
 
-        Chunks are automatically deleted via CASCADE foreign key.
+        Chunks are automatically deleted via CASCADE foreign key. The caller
+        commits, then calls invalidate_count().
 
         Args:
             arxiv_id: arXiv ID of the paper to delete
@@ -5,9 +5,13 @@ from dataclasses import dataclass
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.utils.logger import get_logger
+from src.utils.vector_index import DEFAULT_EF_SEARCH, set_ef_search
 
 log = get_logger(__name__)
 
+# Binary-quantized candidates fetched per requested result before exact re-ranking
+QUANTIZED_RERANK_FACTOR = 4
+
 
 @dataclass
 class SearchResult:
@@ -31,8 +35,15 @@ class SearchResult:
 class SearchRepository:
     """Repository for hybrid search operations."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        ef_search: int = DEFAULT_EF_SEARCH,
+        quantized: bool = False,
+    ):
         self.session = session
+        self.ef_search = ef_search
+        self.quantized = quantized
 
     async def vector_search(
         self, query_embedding: List[float], top_k: int = 10, min_score: float = 0.0
@@ -40,6 +51,10 @@ class SearchRepository:
         """
         Vector similarity search using cosine distance.
 
+        When the repository is quantized, candidates are first gathered from the
+        binary-quantized HNSW index (Hamming distance, 1 bit per dimension) and
+        then re-ranked by exact cosine distance on the halfvec embedding.
+
         Args:
             query_embedding: Query embedding vector
             top_k: Number of results to return
@@ -49,12 +64,41 @@ class SearchRepository:
             List of SearchResult objects ordered by similarity
         """
         log.debug(
-            "vector search", top_k=top_k, min_score=min_score, embedding_dim=len(query_embedding)
+            "vector search",
+            top_k=top_k,
+            min_score=min_score,
+            embedding_dim=len(query_embedding),
+            quantized=self.quantized,
         )
 
-        embedding_str = f"[{','.join(map(str, query_embedding))}]"
-
-        query = text("""
+        # Bound as halfvec and sent in binary by the pgvector codec (see src.database)
+        params: dict = {"embedding": query_embedding, "min_score": min_score, "limit": top_k}
+
+        if self.quantized:
+            candidates = top_k * QUANTIZED_RERANK_FACTOR
+            params["candidates"] = candidates
+            # An HNSW scan returns at most ef_search rows
+            await set_ef_search(self.session, max(self.ef_search, candidates))
+            candidates_cte = """
+            WITH candidates AS MATERIALIZED (
+                SELECT id
+                FROM chunks
+                ORDER BY binary_quantize(embedding)::bit(1024)
+                    <~> binary_quantize(CAST(:embedding AS halfvec))
+                LIMIT :candidates
+            )"""
+            candidates_join = "JOIN candidates cand ON cand.id = c.id"
+            # Sort on the score alias so the planner re-ranks candidates instead of
+            # switching to the full-precision HNSW index
+            order_by = "score DESC"
+        else:
+            # Widen the HNSW candidate list for this transaction (pgvector default is 40)
+            await set_ef_search(self.session, self.ef_search)
+            candidates_cte = ""
+            candidates_join = ""
+            order_by = "c.embedding <=> CAST(:embedding AS halfvec)"
+
+        query = text(f"""{candidates_cte}
             SELECT
                 c.id as chunk_id,
                 c.paper_id,
@@ -64,19 +108,18 @@ class SearchRepository:
                 c.chunk_text,
                 c.section_name,
                 c.page_number,
-                1 - (c.embedding <=> CAST(:embedding AS vector)) as score,
+                1 - (c.embedding <=> CAST(:embedding AS halfvec)) as score,
                 p.published_date,
                 p.pdf_url
             FROM chunks c
+            {candidates_join}
             JOIN papers p ON c.paper_id = p.id
-            WHERE 1 - (c.embedding <=> CAST(:embedding AS vector)) >= :min_score
-            ORDER BY c.embedding <=> CAST(:embedding AS vector)
+            WHERE 1 - (c.embedding <=> CAST(:embedding AS halfvec)) >= :min_score
+            ORDER BY {order_by}
             LIMIT :limit
         """)
 
-        result = await self.session.execute(
-            query, {"embedding": embedding_str, "min_score": min_score, "limit": top_k}
-        )
+        result = await self.session.execute(query, params)
 
         results = [
             SearchResult(
@@ -5,6 +5,7 @@ from datetime import datetime
 from src.schemas.health import HealthResponse, ServiceStatus
 from src.dependencies import DbSession, EmbeddingsClientDep, PaperRepoDep, ChunkRepoDep
 from src.config import get_settings
+from src.factories.client_factories import get_llm_cache, get_semantic_cache
 
 router = APIRouter()
 
@@ -68,6 +69,19 @@ async def health_check(
         services["llm"] = ServiceStatus(status="unhealthy", message=f"Error: {str(e)}")
         overall_status = "degraded"
 
+    # Report LLM cache effectiveness
+    for name, cache in (("llm_cache", get_llm_cache()), ("semantic_cache", get_semantic_cache())):
+        if cache is not None:
+            services[name] = ServiceStatus(
+                status="healthy",
+                message="Enabled",
+                details={
+                    "hits": cache.stats.hits,
+                    "misses": cache.stats.misses,
+                    "hit_rate": round(cache.stats.hit_rate, 3),
+                },
+            )
+
     # Check Jina
     try:
         if embeddings_client.api_key:
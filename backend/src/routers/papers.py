@@ -1,7 +1,8 @@
 """Papers management router."""
 
+import uuid
 from typing import Optional, Literal
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from fastapi import APIRouter, HTTPException, Query
 
 from src.schemas.papers import (
@@ -11,9 +12,29 @@ from src.schemas.papers import (
     DeletePaperResponse,
 )
 from src.dependencies import PaperRepoDep, ChunkRepoDep, DbSession
+from src.models.paper import Paper
+from src.repositories.paper_repository import PageCursor
 
 router = APIRouter()
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _encode_cursor(paper: Paper, sort_by: str) -> str:
+    """Build the next-page cursor from the last paper on a page."""
+    # Microseconds since the epoch keep the cursor URL-safe (no "+" or ":")
+    micros = (getattr(paper, sort_by) - _EPOCH) // timedelta(microseconds=1)
+    return f"{micros}_{paper.id}"
+
+
+def _decode_cursor(cursor: str) -> PageCursor:
+    """Parse a cursor from _encode_cursor, rejecting malformed ones with a 400."""
+    try:
+        micros, paper_id = cursor.split("_", 1)
+        return _EPOCH + timedelta(microseconds=int(micros)), uuid.UUID(paper_id)
+    except (ValueError, OverflowError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 
 @router.get("/papers", response_model=PaperListResponse)
 async def list_papers(
@@ -27,19 +48,24 @@ async def list_papers(
     end_date: Optional[datetime] = None,
     sort_by: Literal["created_at", "published_date", "updated_at"] = "created_at",
     sort_order: Literal["asc", "desc"] = "desc",
+    partial_match: bool = False,
+    cursor: Optional[str] = None,
 ) -> PaperListResponse:
     """
     Get paginated list of papers with optional filters.
 
     Supports filtering by:
     - Processing status (processed_only)
-    - Category (substring match, case-insensitive)
-    - Author (substring match, case-insensitive)
+    - Category (exact match, or case-insensitive substring with partial_match)
+    - Author (exact match, or case-insensitive substring with partial_match)
     - Publication date range (start_date, end_date)
 
     Results can be sorted by created_at, published_date, or updated_at.
     List response excludes raw_text for performance.
 
+    Pages can be fetched by offset, or by passing the previous response's
+    next_cursor as cursor, which stays fast deep into the list.
+
     Args:
         paper_repo: Injected paper repository
         offset: Number of papers to skip
@@ -51,6 +77,8 @@ async def list_papers(
         end_date: Filter papers published on or before this date
         sort_by: Field to sort by
         sort_order: Sort order (asc or desc)
+        partial_match: Match category and author by substring (slower, unindexed)
+        cursor: next_cursor from the previous page; offset is ignored when set
 
     Returns:
         PaperListResponse with paginated papers
@@ -65,11 +93,16 @@ async def list_papers(
         end_date=end_date,
         sort_by=sort_by,
         sort_order=sort_order,
+        partial_match=partial_match,
+        cursor=_decode_cursor(cursor) if cursor else None,
     )
 
     paper_items = [PaperListItem.model_validate(p, from_attributes=True) for p in papers]
+    next_cursor = _encode_cursor(papers[-1], sort_by) if len(papers) == limit else None
 
-    return PaperListResponse(total=total, offset=offset, limit=limit, papers=paper_items)
+    return PaperListResponse(
+        total=total, offset=offset, limit=limit, papers=paper_items, next_cursor=next_cursor
+    )
 
 
 @router.get("/papers/{arxiv_id}", response_model=PaperResponse)
@@ -129,6 +162,7 @@ async def delete_paper(
 
     await paper_repo.delete_by_arxiv_id(arxiv_id)
     await db.commit()
+    paper_repo.invalidate_count()
 
     return DeletePaperResponse(
         arxiv_id=arxiv_id,
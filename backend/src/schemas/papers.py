@@ -42,6 +42,8 @@ class PaperListResponse(BaseModel):
     offset: int
     limit: int
     papers: List[PaperListItem]
+    # Pass as cursor to fetch the next page; None on the last page
+    next_cursor: Optional[str] = None
 
 
 class DeletePaperResponse(BaseModel):
@@ -11,14 +11,12 @@ Graph flow:
     out_of_scope -> END
 """
 
+from functools import cache
+
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END, START
 
 from src.schemas.langgraph_state import AgentState
-from src.clients.base_llm_client import BaseLLMClient
-from src.clients.arxiv_client import ArxivClient
-from src.services.search_service import SearchService
-from src.services.ingest_service import IngestService
-from src.repositories.paper_repository import PaperRepository
 from .context import AgentContext
 from .nodes import (
     guardrail_node,
@@ -36,27 +34,41 @@ from .edges import (
 )
 
 
-def create_node_wrapper(node_func, context):
-    """Wrap async node functions with context binding."""
+def agent_run_config(context: AgentContext) -> RunnableConfig:
+    """Build the run config that hands a request's context to every node."""
+    return {"configurable": {"context": context}}
+
+
+def run_context(config: RunnableConfig) -> AgentContext:
+    """
+    Read the AgentContext stored in a run config by agent_run_config.
+
+    Args:
+        config: Run config passed to a node
 
-    async def wrapper(state):
-        return await node_func(state, context)
+    Returns:
+        AgentContext of the current run
+
+    Raises:
+        RuntimeError: If the graph was invoked without agent_run_config
+    """
+    context = config.get("configurable", {}).get("context")
+    if context is None:
+        raise RuntimeError("Agent graph run without an AgentContext; use agent_run_config()")
+    return context
+
+
+def create_node_wrapper(node_func):
+    """Wrap async node functions with the context of the current run."""
+
+    async def wrapper(state, config: RunnableConfig):
+        return await node_func(state, run_context(config))
 
     return wrapper
 
 
-def build_agent_graph(
-    llm_client: BaseLLMClient,
-    search_service: SearchService,
-    ingest_service: IngestService | None = None,
-    arxiv_client: ArxivClient | None = None,
-    paper_repository: PaperRepository | None = None,
-    guardrail_threshold: int = 75,
-    top_k: int = 3,
-    max_retrieval_attempts: int = 3,
-    max_iterations: int = 5,
-    temperature: float = 0.3,
-):
+@cache
+def build_agent_graph():
     """
     Build and compile the agent workflow graph with router architecture.
 
@@ -64,42 +76,22 @@ def build_agent_graph(
     which tools to call based on the query and context, rather than
     following a static DAG.
 
-    Args:
-        llm_client: LLM client for generating responses
-        search_service: Search service for document retrieval
-        guardrail_threshold: Minimum score for query to be in scope
-        top_k: Number of relevant chunks needed for generation
-        max_retrieval_attempts: Legacy parameter (kept for compatibility)
-        max_iterations: Maximum router iterations to prevent infinite loops
-        temperature: Temperature for answer generation
+    The graph holds no request state: nodes read their AgentContext from the
+    run config (see agent_run_config), so it is compiled once and shared.
 
     Returns:
         Compiled LangGraph workflow
     """
-    # Create context with tool registry
-    context = AgentContext(
-        llm_client=llm_client,
-        search_service=search_service,
-        ingest_service=ingest_service,
-        arxiv_client=arxiv_client,
-        paper_repository=paper_repository,
-        guardrail_threshold=guardrail_threshold,
-        top_k=top_k,
-        max_retrieval_attempts=max_retrieval_attempts,
-        max_iterations=max_iterations,
-        temperature=temperature,
-    )
-
     # Create workflow
     workflow = StateGraph(AgentState)
 
     # Add nodes (with context binding)
-    workflow.add_node("guardrail", create_node_wrapper(guardrail_node, context))
-    workflow.add_node("out_of_scope", create_node_wrapper(out_of_scope_node, context))
-    workflow.add_node("router", create_node_wrapper(router_node, context))
-    workflow.add_node("executor", create_node_wrapper(executor_node, context))
-    workflow.add_node("grade_documents", create_node_wrapper(grade_documents_node, context))
-    workflow.add_node("generate", create_node_wrapper(generate_answer_node, context))
+    workflow.add_node("guardrail", create_node_wrapper(guardrail_node))
+    workflow.add_node("out_of_scope", create_node_wrapper(out_of_scope_node))
+    workflow.add_node("router", create_node_wrapper(router_node))
+    workflow.add_node("executor", create_node_wrapper(executor_node))
+    workflow.add_node("grade_documents", create_node_wrapper(grade_documents_node))
+    workflow.add_node("generate", create_node_wrapper(generate_answer_node))
 
     # Add edges
     # START -> guardrail
@@ -23,7 +23,8 @@ from src.schemas.stream import (
 )
 from src.schemas.common import SourceInfo
 from src.utils.logger import get_logger
-from .graph_builder import build_agent_graph
+from .context import AgentContext
+from .graph_builder import agent_run_config, build_agent_graph
 
 log = get_logger(__name__)
 
@@ -70,7 +71,8 @@ class AgentService:
         max_iterations: int = 5,
         temperature: float = 0.3,
     ):
-        self.graph = build_agent_graph(
+        self.graph = build_agent_graph()
+        self.context = AgentContext(
             llm_client=llm_client,
             search_service=search_service,
             ingest_service=ingest_service,
@@ -162,7 +164,9 @@ class AgentService:
         final_state: dict = {}
         sources_emitted = False
 
-        async for event in self.graph.astream_events(initial_state, version="v2"):
+        async for event in self.graph.astream_events(
+            initial_state, config=agent_run_config(self.context), version="v2"
+        ):
             kind = event["event"]
 
             # Node start - emit status event
@@ -4,7 +4,7 @@ import tempfile
 import os
 from datetime import datetime
 from time import time
-from typing import List
+from typing import Dict, List, Set
 
 from src.schemas.ingest import IngestRequest, IngestResponse, PaperError, PaperResult
 from src.clients.arxiv_client import ArxivClient
@@ -78,21 +78,38 @@ class IngestService:
             papers_fetched = len(papers)
             log.info("arxiv search complete", papers_found=papers_fetched)
 
+            # Results can repeat a paper; process each ID once, since the batch
+            # lookup below wouldn't see a row created earlier in this loop
+            papers = list({p.arxiv_id: p for p in papers}.values())
+
+            # One lookup for the whole batch instead of one per paper
+            stored_ids = await self.paper_repository.exists_many([p.arxiv_id for p in papers])
+
             # Process each paper
-            for paper_meta in papers:
-                try:
-                    result = await self._process_single_paper(paper_meta, request.force_reprocess)
-                    if result:
-                        papers_processed += 1
-                        chunks_created += result.chunks_created
-                        paper_results.append(result)
-                except Exception as e:
-                    log.warning(
-                        "paper processing failed",
-                        arxiv_id=paper_meta.arxiv_id,
-                        error=str(e),
-                    )
-                    errors.append(PaperError(arxiv_id=paper_meta.arxiv_id, error=str(e)))
+            with tempfile.TemporaryDirectory() as temp_dir:
+                pdfs = await self._download_pdfs(
+                    papers, request.force_reprocess, stored_ids, temp_dir
+                )
+
+                for paper_meta in papers:
+                    try:
+                        result = await self._process_single_paper(
+                            paper_meta,
+                            request.force_reprocess,
+                            paper_meta.arxiv_id in stored_ids,
+                            pdfs.get(paper_meta.arxiv_id),
+                        )
+                        if result:
+                            papers_processed += 1
+                            chunks_created += result.chunks_created
+                            paper_results.append(result)
+                    except Exception as e:
+                        log.warning(
+                            "paper processing failed",
+                            arxiv_id=paper_meta.arxiv_id,
+                            error=str(e),
+                        )
+                        errors.append(PaperError(arxiv_id=paper_meta.arxiv_id, error=str(e)))
 
         except Exception as e:
             log.error("ingest failed", error=str(e))
@@ -125,39 +142,70 @@ class IngestService:
             papers=paper_results,
         )
 
-    async def _process_single_paper(self, paper_meta, force_reprocess: bool):
-        """Process a single paper: download, parse, chunk, and embed."""
+    async def _download_pdfs(
+        self, papers, force_reprocess: bool, stored_ids: Set[str], temp_dir: str
+    ) -> Dict[str, str | BaseException]:
+        """
+        Download the PDFs of every paper that will be processed, concurrently.
+
+        Args:
+            papers: Paper metadata from arXiv
+            force_reprocess: Re-process papers that are already stored
+            stored_ids: arXiv IDs already stored, from the batch lookup
+            temp_dir: Directory to save the PDFs in
+
+        Returns:
+            Saved path, or the download's exception, by arXiv ID
+        """
+        to_download = [p for p in papers if force_reprocess or p.arxiv_id not in stored_ids]
+        results = await self.arxiv_client.download_pdfs_bulk(
+            [(p.pdf_url, os.path.join(temp_dir, f"{p.arxiv_id}.pdf")) for p in to_download]
+        )
+        return {p.arxiv_id: result for p, result in zip(to_download, results)}
+
+    async def _process_single_paper(
+        self,
+        paper_meta,
+        force_reprocess: bool,
+        stored: bool,
+        pdf: str | BaseException | None,
+    ):
+        """
+        Process a single paper: parse, chunk, and embed its downloaded PDF.
+
+        Args:
+            paper_meta: Paper metadata from arXiv
+            force_reprocess: Re-process the paper if it is already stored
+            stored: Whether the paper was already stored, from the batch lookup
+            pdf: Path of the downloaded PDF, or the exception its download raised
+        """
         arxiv_id = paper_meta.arxiv_id
 
-        # Check if exists
-        existing = await self.paper_repository.get_by_arxiv_id(arxiv_id)
-        if existing and not force_reprocess:
+        if stored and not force_reprocess:
             log.debug("paper skipped (exists)", arxiv_id=arxiv_id)
             return None
 
+        # Only papers being re-processed need their row loaded
+        existing = await self.paper_repository.get_by_arxiv_id(arxiv_id) if stored else None
+
         log.info("processing paper", arxiv_id=arxiv_id, title=paper_meta.title[:80])
 
-        # Download PDF to temp directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            pdf_path = os.path.join(temp_dir, f"{arxiv_id}.pdf")
-
-            try:
-                await self.arxiv_client.download_pdf(pdf_url=paper_meta.pdf_url, save_path=pdf_path)
-                log.debug("pdf downloaded", arxiv_id=arxiv_id)
-            except Exception as e:
-                raise PDFProcessingError(arxiv_id=arxiv_id, stage="download", message=str(e))
-
-            # Parse PDF
-            try:
-                parsed = await self.pdf_parser.parse_pdf(pdf_path)
-                log.debug(
-                    "pdf parsed",
-                    arxiv_id=arxiv_id,
-                    text_len=len(parsed.raw_text),
-                    sections=len(parsed.sections),
-                )
-            except Exception as e:
-                raise PDFProcessingError(arxiv_id=arxiv_id, stage="parsing", message=str(e))
+        if not isinstance(pdf, str):
+            raise PDFProcessingError(
+                arxiv_id=arxiv_id, stage="download", message=str(pdf or "PDF not downloaded")
+            )
+
+        # Parse PDF
+        try:
+            parsed = await self.pdf_parser.parse_pdf(pdf)
+            log.debug(
+                "pdf parsed",
+                arxiv_id=arxiv_id,
+                text_len=len(parsed.raw_text),
+                sections=len(parsed.sections),
+            )
+        except Exception as e:
+            raise PDFProcessingError(arxiv_id=arxiv_id, stage="parsing", message=str(e))
 
         # Create or update paper record
         paper_data = {
@@ -231,7 +279,7 @@ class IngestService:
                 }
             )
 
-        await self.chunk_repository.create_bulk(chunks_data)
+        await self.chunk_repository.copy_bulk(chunks_data)
 
         log.info("paper processed", arxiv_id=arxiv_id, chunks=len(chunks_data))
 
@@ -267,21 +315,31 @@ class IngestService:
         try:
             papers = await self.arxiv_client.get_papers_by_ids(arxiv_ids)
             papers_fetched = len(papers)
-
-            for paper_meta in papers:
-                try:
-                    result = await self._process_single_paper(paper_meta, force_reprocess)
-                    if result:
-                        papers_processed += 1
-                        chunks_created += result.chunks_created
-                        paper_results.append(result)
-                except Exception as e:
-                    log.warning(
-                        "paper processing failed",
-                        arxiv_id=paper_meta.arxiv_id,
-                        error=str(e),
-                    )
-                    errors.append(PaperError(arxiv_id=paper_meta.arxiv_id, error=str(e)))
+            papers = list({p.arxiv_id: p for p in papers}.values())
+            stored_ids = await self.paper_repository.exists_many([p.arxiv_id for p in papers])
+
+            with tempfile.TemporaryDirectory() as temp_dir:
+                pdfs = await self._download_pdfs(papers, force_reprocess, stored_ids, temp_dir)
+
+                for paper_meta in papers:
+                    try:
+                        result = await self._process_single_paper(
+                            paper_meta,
+                            force_reprocess,
+                            paper_meta.arxiv_id in stored_ids,
+                            pdfs.get(paper_meta.arxiv_id),
+                        )
+                        if result:
+                            papers_processed += 1
+                            chunks_created += result.chunks_created
+                            paper_results.append(result)
+                    except Exception as e:
+                        log.warning(
+                            "paper processing failed",
+                            arxiv_id=paper_meta.arxiv_id,
+                            error=str(e),
+                        )
+                        errors.append(PaperError(arxiv_id=paper_meta.arxiv_id, error=str(e)))
 
         except Exception as e:
             log.error("ingest by ids failed", error=str(e))
@@ -335,6 +393,8 @@ class IngestService:
             category_filter=category,
             start_date=start_date,
             end_date=end_date,
+            # Names from the agent are often partial ("Hinton")
+            partial_match=True,
         )
 
         return [
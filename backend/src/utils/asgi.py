@@ -0,0 +1,11 @@
+"""Helpers for working with raw ASGI messages."""
+
+from typing import Iterable, Optional, Tuple
+
+
+def find_header(headers: Iterable[Tuple[bytes, bytes]], name: bytes) -> Optional[str]:
+    """Find a header in a raw ASGI header list; names must be lowercase."""
+    for key, value in headers:
+        if key == name:
+            return value.decode("latin-1")
+    return None
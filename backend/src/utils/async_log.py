@@ -0,0 +1,135 @@
+"""Deferred logging for hot request paths."""
+
+import asyncio
+import sys
+import time
+from typing import Any, Optional, Protocol, Tuple, Union
+
+import structlog
+
+from src.utils.logger import format_timestamp, get_logger
+
+log = get_logger(__name__)
+
+
+class LogFields(Protocol):
+    """Fixed-shape log data, turned into event fields only when written."""
+
+    def as_fields(self) -> dict:
+        """Return the key-value fields to log."""
+        ...
+
+
+# (logger, method name, event, fields, time.time() at emit, structlog context at emit)
+LogRecord = Tuple[Any, str, str, Union[dict, LogFields], float, dict]
+
+# Records held before new ones are dropped
+DEFAULT_QUEUE_SIZE = 10_000
+
+_queue: Optional[asyncio.Queue[LogRecord]] = None
+_worker: Optional[asyncio.Task] = None
+
+# Records dropped because the queue was full
+dropped = 0
+
+# Records lost because writing them raised
+failed = 0
+
+
+def _write(
+    logger: Any,
+    level: str,
+    event: str,
+    fields: Union[dict, LogFields],
+    created: Optional[float] = None,
+    context: Optional[dict] = None,
+) -> None:
+    """Make the log call for a record, stamped with when and where it was emitted."""
+    if not isinstance(fields, dict):
+        fields = fields.as_fields()
+    if created is not None:
+        # The worker runs later and outside the request's context, so restore
+        # the emitting request's context (its fields win) and emit time
+        fields = {**(context or {}), **fields, "timestamp": format_timestamp(created)}
+    getattr(logger, level)(event, **fields)
+
+
+def emit(logger: Any, level: str, event: str, fields: Union[dict, LogFields]) -> None:
+    """
+    Queue a log call for the background worker.
+
+    Rendering and writing happen in the worker, so the caller only pays for
+    a queue append plus capturing the time and the structlog context. When
+    the queue is full the record is dropped rather than blocking the request;
+    when no worker is running the call is made inline.
+
+    Args:
+        logger: Logger to call
+        level: Logger method name ("info", "warning", "error", ...)
+        event: Log event name
+        fields: Key-value fields for the event, or an object providing them
+    """
+    global dropped
+    if _queue is None:
+        _write(logger, level, event, fields)
+        return
+    try:
+        _queue.put_nowait(
+            (logger, level, event, fields, time.time(), structlog.contextvars.get_contextvars())
+        )
+    except asyncio.QueueFull:
+        dropped += 1
+
+
+async def _drain(queue: asyncio.Queue[LogRecord]) -> None:
+    """Write queued records until cancelled."""
+    global failed
+    while True:
+        record = await queue.get()
+        try:
+            _write(*record)
+        except Exception as e:
+            # The logger itself failed, so report on stderr rather than through it
+            failed += 1
+            sys.stderr.write(f"async_log: failed to write {record[2]!r}: {type(e).__name__}: {e}\n")
+        finally:
+            queue.task_done()
+
+
+def start_log_worker(max_size: int = DEFAULT_QUEUE_SIZE) -> None:
+    """
+    Start the background task that writes queued log records.
+
+    Must be called from the running event loop, typically at app startup.
+
+    Args:
+        max_size: Records held before new ones are dropped
+    """
+    global _queue, _worker
+    if _worker is not None:
+        return
+    _queue = asyncio.Queue(maxsize=max_size)
+    _worker = asyncio.create_task(_drain(_queue))
+
+
+async def stop_log_worker() -> None:
+    """Write any queued records, then stop the worker."""
+    global _queue, _worker
+    if _queue is None or _worker is None:
+        return
+
+    queue, worker = _queue, _worker
+    # Later emit() calls log inline
+    _queue, _worker = None, None
+
+    await queue.join()
+    worker.cancel()
+    try:
+        await worker
+    except asyncio.CancelledError:
+        pass
+
+    if dropped:
+        log.warning("log records dropped", count=dropped)
+    if failed:
+        log.warning("log records failed to write", count=failed)
@@ -0,0 +1,39 @@
+"""Short-lived cache for expensive row counts."""
+
+import time
+from typing import Optional
+
+
+class CountCache:
+    """
+    A single count reused for a fixed number of seconds.
+
+    Each worker process holds its own copy, so a count is approximate: writes
+    made through another worker only show up once this copy expires.
+    """
+
+    def __init__(self, ttl: float):
+        """
+        Initialize count cache.
+
+        Args:
+            ttl: Seconds a stored count is reused
+        """
+        self.ttl = ttl
+        self._expires_at = 0.0
+        self._count: Optional[int] = None
+
+    def get(self) -> Optional[int]:
+        """Return the stored count, or None if it is missing or expired."""
+        if self._count is None or self._expires_at <= time.monotonic():
+            return None
+        return self._count
+
+    def set(self, count: int) -> None:
+        """Store a freshly computed count."""
+        self._count = count
+        self._expires_at = time.monotonic() + self.ttl
+
+    def invalidate(self) -> None:
+        """Forget the stored count; call only once the write that changed it is committed."""
+        self._count = None
@@ -0,0 +1,234 @@
+"""Exact-match and semantic caches for LLM responses."""
+
+import hashlib
+import json
+import math
+import operator
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol, Tuple
+
+from src.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+class CacheBackend(Protocol):
+    """Key/value store used by LLMResponseCache."""
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached value, or None on a miss."""
+        ...
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """Store a value, expiring after ttl seconds if given."""
+        ...
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize memory backend.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[str, Optional[float]]] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for an LLM cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LLMResponseCache:
+    """Caches LLM responses keyed by provider, model, prompt and sampling settings."""
+
+    def __init__(self, backend: CacheBackend, ttl: Optional[float] = 3600.0):
+        """
+        Initialize response cache.
+
+        Args:
+            backend: Storage backend
+            ttl: Seconds an entry stays valid (None keeps entries until evicted)
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        messages: List[Any],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Build a stable cache key for an LLM request.
+
+        Every argument that can change the model's output belongs in the key.
+
+        Args:
+            provider: LLM provider name
+            model: Model name
+            messages: Chat messages sent to the model
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            response_format: Structured output response_format, if any
+
+        Returns:
+            SHA-256 hex digest of the request
+        """
+        payload = json.dumps(
+            {
+                "provider": provider,
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "response_format": response_format,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """Look up a cached response, recording the hit or miss."""
+        value = await self.backend.get(key)
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        log.debug("llm cache lookup", hit=value is not None, hits=self.stats.hits)
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a response."""
+        await self.backend.set(key, value, self.ttl)
+
+
+# (scope key, unit-length prompt embedding) awaiting the response to store
+SemanticSlot = Tuple[str, List[float]]
+
+
+class SemanticCache:
+    """
+    Serves responses for paraphrased prompts by embedding similarity.
+
+    Only the last message is compared; everything before it (system prompt,
+    history) plus provider, model and temperature must match exactly, so a
+    hit never crosses prompt templates or conversations. Entries are scanned
+    linearly, which stays cheap for a few hundred entries.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Awaitable[List[float]]],
+        threshold: float = 0.92,
+        max_entries: int = 512,
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            embed: Async function returning an embedding for a text
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Entries kept before the oldest is evicted
+        """
+        self.embed = embed
+        self.threshold = threshold
+        self._entries: deque[tuple[str, List[float], str]] = deque(maxlen=max_entries)
+        self.stats = CacheStats()
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> List[float]:
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return [x / norm for x in vector]
+
+    async def lookup(
+        self,
+        provider: str,
+        model: str,
+        messages: List[Any],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Tuple[Optional[str], Optional[SemanticSlot]]:
+        """
+        Find a cached response for a semantically similar prompt.
+
+        Args:
+            provider: LLM provider name
+            model: Model name
+            messages: Chat messages sent to the model
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            (cached response or None, slot to pass to store() on a miss)
+        """
+        if not messages:
+            return None, None
+
+        scope = LLMResponseCache.make_key(provider, model, messages[:-1], temperature, max_tokens)
+        try:
+            embedding = self._normalize(await self.embed(str(messages[-1].get("content", ""))))
+        except Exception as e:
+            log.warning("semantic cache embedding failed", error=str(e))
+            return None, None
+
+        best_score, best_response = 0.0, None
+        for entry_scope, entry_embedding, response in self._entries:
+            if entry_scope != scope:
+                continue
+            score = sum(map(operator.mul, embedding, entry_embedding))
+            if score > best_score:
+                best_score, best_response = score, response
+
+        if best_response is not None and best_score >= self.threshold:
+            self.stats.hits += 1
+            log.debug("semantic cache hit", score=round(best_score, 4))
+            return best_response, None
+
+        self.stats.misses += 1
+        return None, (scope, embedding)
+
+    def store(self, slot: SemanticSlot, response: str) -> None:
+        """Cache a response for the prompt looked up with slot."""
+        scope, embedding = slot
+        self._entries.append((scope, embedding, response))
@@ -3,8 +3,10 @@
 import logging
 import sys
 from contextvars import ContextVar
+from datetime import datetime, timezone
 from typing import Any
 
+import orjson
 import structlog
 from structlog.types import Processor
 
@@ -13,6 +15,28 @@ request_id_ctx: ContextVar[str | None] = ContextVar("request_id", default=None)
 
 _configured = False
 
+# Characters kept by truncate() unless the caller asks for more
+TRUNCATE_LIMIT = 1000
+
+# strftime format of the UTC timestamp on every log entry
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_timestamper = structlog.processors.TimeStamper(fmt=TIMESTAMP_FORMAT)
+
+
+def format_timestamp(epoch: float) -> str:
+    """Render a time.time() value the way log entries are stamped."""
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime(TIMESTAMP_FORMAT)
+
+
+def add_timestamp(
+    logger: logging.Logger, method_name: str, event_dict: dict[str, Any]
+) -> dict[str, Any]:
+    """Stamp the event with the current time, unless it was stamped when queued."""
+    if "timestamp" in event_dict:
+        return event_dict
+    return _timestamper(logger, method_name, event_dict)
+
 
 def add_request_id(
     logger: logging.Logger, method_name: str, event_dict: dict[str, Any]
@@ -23,13 +47,15 @@ def add_request_id(
     return event_dict
 
 
-def configure_logging(log_level: str = "INFO", debug: bool = False) -> None:
+def configure_logging(log_level: str = "INFO", debug: bool = False, json: bool = False) -> None:
     """
     Configure structlog. Call once at startup.
 
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         debug: Enable colored output for development
+        json: Emit one JSON object per line (serialized with orjson) instead
+            of key-value console output
     """
     global _configured
     if _configured:
@@ -39,19 +65,35 @@ def configure_logging(log_level: str = "INFO", debug: bool = False) -> None:
     shared_processors: list[Processor] = [
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
-        structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S"),
+        add_timestamp,
         add_request_id,
     ]
 
-    # Dev: colored key-value output
+    renderer: Processor
+    logger_factory: Any
+    if json:
+        # orjson renders straight to bytes, so write them without re-encoding
+        renderer = structlog.processors.JSONRenderer(serializer=orjson.dumps)
+        shared_processors.append(structlog.processors.format_exc_info)
+        logger_factory = structlog.BytesLoggerFactory(file=sys.stdout.buffer)
+    else:
+        # Dev: colored key-value output
+        # Rich tracebacks (with locals) only in debug; plain ones otherwise
+        renderer = structlog.dev.ConsoleRenderer(
+            colors=debug,
+            exception_formatter=(
+                structlog.dev.default_exception_formatter
+                if debug
+                else structlog.dev.plain_traceback
+            ),
+        )
+        logger_factory = structlog.PrintLoggerFactory(file=sys.stdout)
+
     structlog.configure(
-        processors=[
-            *shared_processors,
-            structlog.dev.ConsoleRenderer(colors=debug),
-        ],
+        processors=[*shared_processors, renderer],
         wrapper_class=structlog.make_filtering_bound_logger(getattr(logging, log_level.upper())),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(file=sys.stdout),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
@@ -96,8 +138,14 @@ def clear_request_id() -> None:
     request_id_ctx.set(None)
 
 
-def truncate(text: str, max_len: int = 1000) -> str:
+def truncate(text: str, max_len: int = TRUNCATE_LIMIT) -> str:
     """Truncate text for logging, adding ellipsis if needed."""
     if len(text) <= max_len:
         return text
     return text[:max_len] + "..."
+
+
+def truncate_bytes(data: bytes | bytearray, max_len: int = TRUNCATE_LIMIT) -> str:
+    """Decode UTF-8 bytes for logging, decoding only the prefix truncate() keeps."""
+    # A character is at most 4 bytes; the extra byte makes a cut body end in "..."
+    return truncate(data[: max_len * 4 + 1].decode("utf-8", errors="replace"), max_len)
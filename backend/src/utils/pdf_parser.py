@@ -33,8 +33,7 @@ class PDFParser:
             ParsedDocument with text, sections, and metadata
         """
         # Run blocking operation in thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._parse_pdf_sync, pdf_path)
+        return await asyncio.to_thread(self._parse_pdf_sync, pdf_path)
 
     def _parse_pdf_sync(self, pdf_path: str) -> ParsedDocument:
         """
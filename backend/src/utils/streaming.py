@@ -0,0 +1,68 @@
+"""Helpers for relaying streamed LLM output."""
+
+import asyncio
+from typing import AsyncIterator, List, Optional
+
+# Characters after which buffered text is flushed even if more is waiting
+STREAM_FLUSH_CHARS = 64
+
+_END = object()
+
+
+async def coalesce_stream(
+    chunks: AsyncIterator[str], flush_chars: int = STREAM_FLUSH_CHARS
+) -> AsyncIterator[str]:
+    """
+    Merge text chunks that arrive back to back into fewer, larger chunks.
+
+    A background task reads the source into a queue. Each step waits for the
+    next chunk, then drains whatever else has already arrived (up to
+    flush_chars) without waiting, so a lone token is passed on immediately
+    while bursts are joined into a single yield.
+
+    Args:
+        chunks: Source of text chunks
+        flush_chars: Flush once this many characters are buffered
+
+    Yields:
+        Joined text chunks, in order
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump() -> None:
+        try:
+            async for chunk in chunks:
+                queue.put_nowait(chunk)
+        except Exception as e:
+            queue.put_nowait(e)
+        finally:
+            queue.put_nowait(_END)
+
+    reader = asyncio.create_task(pump())
+    try:
+        done = False
+        error: Optional[Exception] = None
+        while not done:
+            buffer: List[str] = []
+            size = 0
+            item = await queue.get()
+            while True:
+                if item is _END:
+                    done = True
+                    break
+                if isinstance(item, Exception):
+                    # Pass on the text read before the failure, then raise
+                    error = item
+                    done = True
+                    break
+                buffer.append(item)
+                size += len(item)
+                if size >= flush_chars or queue.empty():
+                    break
+                item = queue.get_nowait()
+            if buffer:
+                yield "".join(buffer)
+        if error is not None:
+            raise error
+    finally:
+        reader.cancel()
@@ -0,0 +1,169 @@
+"""HNSW index tuning helpers for pgvector."""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from src.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Build parameters used by idx_chunks_embedding
+HNSW_M = 24
+HNSW_EF_CONSTRUCTION = 128
+
+# Query-time candidate list size; pgvector defaults to 40
+DEFAULT_EF_SEARCH = 100
+
+# (max vector count, m, ef_construction, ef_search), smallest tier first
+_HNSW_TIERS = (
+    (100_000, 16, 64, 40),
+    (1_000_000, HNSW_M, HNSW_EF_CONSTRUCTION, DEFAULT_EF_SEARCH),
+)
+_HNSW_LARGEST_TIER = (32, 200, 200)
+
+
+def configure_hnsw_params(vector_count: int) -> dict[str, int]:
+    """
+    Recommend HNSW parameters for a corpus size.
+
+    Larger corpora need a denser graph (m), a wider build-time candidate list
+    (ef_construction) and a wider query-time candidate list (ef_search) to hold
+    recall. Apply ef_search per transaction with `SET LOCAL hnsw.ef_search = <n>`.
+
+    Args:
+        vector_count: Number of vectors in the index
+
+    Returns:
+        Dict with m, ef_construction and ef_search
+    """
+    for max_count, m, ef_construction, ef_search in _HNSW_TIERS:
+        if vector_count < max_count:
+            return {"m": m, "ef_construction": ef_construction, "ef_search": ef_search}
+
+    m, ef_construction, ef_search = _HNSW_LARGEST_TIER
+    return {"m": m, "ef_construction": ef_construction, "ef_search": ef_search}
+
+
+async def set_ef_search(session: AsyncSession, ef_search: int = DEFAULT_EF_SEARCH) -> None:
+    """
+    Set hnsw.ef_search for the current transaction only.
+
+    Equivalent to `SET LOCAL hnsw.ef_search = <n>`; set_config is used because
+    SET does not accept bind parameters. Must run inside the transaction that
+    issues the ANN query.
+
+    Args:
+        session: Database session with an open transaction
+        ef_search: Query-time candidate list size
+    """
+    await session.execute(
+        text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+        {"ef_search": str(ef_search)},
+    )
+
+
+# Embedding HNSW indexes, created after bulk loads (see deferred_embedding_indexes)
+EMBEDDING_INDEXES = {
+    "idx_chunks_embedding": (
+        "USING hnsw (embedding halfvec_cosine_ops) "
+        f"WITH (m = {HNSW_M}, ef_construction = {HNSW_EF_CONSTRUCTION})"
+    ),
+    "idx_chunks_embedding_bq": (
+        "USING hnsw ((binary_quantize(embedding)::bit(1024)) bit_hamming_ops) "
+        f"WITH (m = {HNSW_M}, ef_construction = {HNSW_EF_CONSTRUCTION})"
+    ),
+}
+
+# Session settings for HNSW builds; the graph build is much faster when it fits in memory
+INDEX_BUILD_SETTINGS = (
+    "SET maintenance_work_mem = '2GB'",
+    "SET max_parallel_maintenance_workers = 7",
+)
+
+
+async def _chunk_partitions(conn: AsyncConnection) -> list[str]:
+    """List partitions of the chunks table (empty when it is not partitioned)."""
+    result = await conn.execute(
+        text(
+            "SELECT inhrelid::regclass::text FROM pg_inherits "
+            "WHERE inhparent = 'chunks'::regclass ORDER BY 1"
+        )
+    )
+    return list(result.scalars().all())
+
+
+async def drop_embedding_indexes(engine: AsyncEngine) -> None:
+    """Drop the chunk embedding HNSW indexes ahead of a bulk load."""
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        # Partitioned indexes cannot be dropped concurrently
+        concurrently = "" if await _chunk_partitions(conn) else "CONCURRENTLY "
+        for name in EMBEDDING_INDEXES:
+            await conn.execute(text(f"DROP INDEX {concurrently}IF EXISTS {name}"))
+            log.info("embedding index dropped", index=name)
+
+
+async def build_embedding_indexes(engine: AsyncEngine) -> None:
+    """
+    Build the chunk embedding HNSW indexes over the rows already loaded.
+
+    Building once over the full table is several times faster than
+    maintaining the graph row by row during the load. Existing indexes are
+    left untouched; use `REINDEX INDEX CONCURRENTLY` to rebuild them.
+
+    On a partitioned chunks table, each partition's index is built
+    concurrently and then attached to the parent index.
+    """
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for statement in INDEX_BUILD_SETTINGS:
+            await conn.execute(text(statement))
+        partitions = await _chunk_partitions(conn)
+        for name, definition in EMBEDDING_INDEXES.items():
+            log.info("building embedding index", index=name, partitions=len(partitions))
+            if not partitions:
+                await conn.execute(
+                    text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON chunks {definition}")
+                )
+                continue
+
+            exists = await conn.execute(text("SELECT to_regclass(:name)"), {"name": name})
+            if exists.scalar() is not None:
+                continue
+
+            # CONCURRENTLY is not supported on the parent; create it empty and
+            # invalid, then attach concurrently built partition indexes
+            await conn.execute(text(f"CREATE INDEX {name} ON ONLY chunks {definition}"))
+            suffix = name.removeprefix("idx_chunks_")
+            for partition in partitions:
+                child = f"idx_{partition}_{suffix}"
+                await conn.execute(
+                    text(
+                        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {child} "
+                        f"ON {partition} {definition}"
+                    )
+                )
+                await conn.execute(text(f"ALTER INDEX {name} ATTACH PARTITION {child}"))
+        log.info("embedding indexes built", count=len(EMBEDDING_INDEXES))
+
+
+@asynccontextmanager
+async def deferred_embedding_indexes(engine: AsyncEngine) -> AsyncIterator[None]:
+    """
+    Drop embedding indexes for the duration of a bulk load and rebuild them after.
+
+    Vector search falls back to sequential scans while the indexes are absent,
+    so use this for offline backfills rather than live ingestion.
+
+    Usage:
+        async with deferred_embedding_indexes(engine):
+            await chunk_repository.copy_bulk(rows)
+    """
+    await drop_embedding_indexes(engine)
+    try:
+        yield
+    finally:
+        await build_embedding_indexes(engine)
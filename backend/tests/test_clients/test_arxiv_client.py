@@ -0,0 +1,123 @@
+"""Tests for ArxivClient API queries and PDF downloads."""
+
+import httpx
+import pytest
+
+from src.clients.arxiv_client import ArxivClient
+
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>arXiv Query</title>
+  <entry>
+    <id>http://arxiv.org/abs/2301.00001v2</id>
+    <updated>2023-01-05T10:00:00Z</updated>
+    <published>2023-01-02T10:00:00Z</published>
+    <title>Attention Is
+      Still All You Need</title>
+    <summary>An abstract.</summary>
+    <author><name>Ada Lovelace</name></author>
+    <author><name>Alan Turing</name></author>
+    <link href="http://arxiv.org/abs/2301.00001v2" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/2301.00001v2" rel="related"/>
+    <category term="cs.CL" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/2212.09999v1</id>
+    <updated>2022-12-20T10:00:00Z</updated>
+    <published>2022-12-20T10:00:00Z</published>
+    <title>Older Paper</title>
+    <summary>Another abstract.</summary>
+    <author><name>Grace Hopper</name></author>
+    <category term="cs.CL" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+</feed>
+"""
+
+
+def pdf_handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/api/query":
+        return httpx.Response(200, content=FEED)
+    if request.url.path.endswith("missing.pdf"):
+        return httpx.Response(404)
+    return httpx.Response(200, content=b"%PDF-" + request.url.path.encode())
+
+
+@pytest.fixture
+async def client():
+    arxiv_client = ArxivClient(rate_limit_delay=0.0, max_concurrent_downloads=2)
+    arxiv_client.http_client = httpx.AsyncClient(transport=httpx.MockTransport(pdf_handler))
+    yield arxiv_client
+    await arxiv_client.close()
+
+
+class TestSearchPapers:
+    """Tests for Atom feed queries."""
+
+    async def test_parses_feed_entries(self, client):
+        papers = await client.search_papers("attention", max_results=5)
+
+        assert [p.arxiv_id for p in papers] == ["2301.00001", "2212.09999"]
+        paper = papers[0]
+        assert paper.title == "Attention Is Still All You Need"
+        assert paper.authors == ["Ada Lovelace", "Alan Turing"]
+        assert paper.categories == ["cs.CL", "cs.LG"]
+        assert paper.pdf_url == "http://arxiv.org/pdf/2301.00001v2"
+        assert paper.published_date.tzinfo is not None
+        assert papers[1].pdf_url is None
+
+    async def test_old_style_ids_keep_only_the_number(self, client):
+        old_style = FEED.replace(b"2212.09999v1", b"hep-th/9901001v3")
+
+        client.http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=old_style))
+        )
+        papers = await client.search_papers("attention")
+
+        assert [p.arxiv_id for p in papers] == ["2301.00001", "9901001"]
+
+    async def test_filters_by_date(self, client):
+        papers = await client.search_papers("attention", start_date="2023-01-01")
+
+        assert [p.arxiv_id for p in papers] == ["2301.00001"]
+
+    async def test_get_papers_by_ids_requests_all_ids(self, client):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=FEED)
+
+        client.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        papers = await client.get_papers_by_ids(["2301.00001", "2212.09999"])
+
+        assert len(papers) == 2
+        assert requests[0].url.params["id_list"] == "2301.00001,2212.09999"
+        assert requests[0].url.params["max_results"] == "2"
+
+
+class TestDownloadPdfsBulk:
+    """Tests for concurrent PDF downloads."""
+
+    async def test_downloads_all_in_order(self, client, tmp_path):
+        downloads = [
+            (f"https://arxiv.org/pdf/{i}.pdf", str(tmp_path / f"{i}.pdf")) for i in range(3)
+        ]
+
+        results = await client.download_pdfs_bulk(downloads)
+
+        assert results == [path for _, path in downloads]
+        assert (tmp_path / "1.pdf").read_bytes() == b"%PDF-/pdf/1.pdf"
+
+    async def test_failures_are_returned_not_raised(self, client, tmp_path):
+        downloads = [
+            ("https://arxiv.org/pdf/ok.pdf", str(tmp_path / "ok.pdf")),
+            ("https://arxiv.org/pdf/missing.pdf", str(tmp_path / "missing.pdf")),
+        ]
+
+        results = await client.download_pdfs_bulk(downloads)
+
+        assert results[0] == str(tmp_path / "ok.pdf")
+        assert isinstance(results[1], httpx.HTTPStatusError)
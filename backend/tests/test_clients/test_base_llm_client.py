@@ -0,0 +1,69 @@
+"""Tests for BaseLLMClient batch generation."""
+
+import asyncio
+
+import pytest
+
+from src.clients.base_llm_client import BaseLLMClient
+
+
+class DelayedClient(BaseLLMClient):
+    """Returns each prompt's content after the delay given in it."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def provider_name(self) -> str:
+        return "fake"
+
+    @property
+    def model(self) -> str:
+        return "fake-model"
+
+    async def generate_completion(
+        self, messages, model=None, temperature=0.3, max_tokens=1000, stream=False
+    ):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(messages[0]["delay"])
+        self.in_flight -= 1
+        return messages[0]["content"]
+
+    async def generate_structured(self, messages, response_format, model=None, temperature=None):
+        raise NotImplementedError
+
+    async def _create_completion(self, messages, model, temperature, max_tokens):
+        raise NotImplementedError
+
+    async def _create_structured(self, messages, model, response_format, temperature):
+        raise NotImplementedError
+
+
+def prompt(content: str, delay: float) -> list[dict]:
+    return [{"role": "user", "content": content, "delay": delay}]
+
+
+class TestGenerateCompletionsBatch:
+    """Tests for as-completed fan-out."""
+
+    async def test_yields_in_completion_order(self):
+        client = DelayedClient()
+        batch = [prompt("slow", 0.03), prompt("fast", 0.0), prompt("medium", 0.01)]
+
+        results = [item async for item in client.generate_completions_batch(batch)]
+
+        assert results == [(1, "fast"), (2, "medium"), (0, "slow")]
+
+    @pytest.mark.parametrize("concurrency", [1, 2])
+    async def test_respects_concurrency_limit(self, concurrency):
+        client = DelayedClient()
+        batch = [prompt(str(i), 0.005) for i in range(5)]
+
+        results = [
+            item async for item in client.generate_completions_batch(batch, concurrency=concurrency)
+        ]
+
+        assert sorted(results) == [(i, str(i)) for i in range(5)]
+        assert client.max_in_flight == concurrency
@@ -0,0 +1,176 @@
+"""Tests for OpenAIClient response caching."""
+
+import asyncio
+import gc
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pydantic import BaseModel
+
+from src.clients.openai_client import OpenAIClient
+from src.utils.llm_cache import LLMResponseCache, MemoryCacheBackend
+
+MESSAGES = [{"role": "user", "content": "What is attention?"}]
+
+
+class Verdict(BaseModel):
+    relevant: bool
+    reason: str
+
+
+def completion(content: str) -> Mock:
+    response = Mock()
+    response.choices = [Mock(message=Mock(content=content))]
+    response.usage = None
+    return response
+
+
+@pytest.fixture
+def client():
+    llm_client = OpenAIClient(api_key="sk-test", cache=LLMResponseCache(MemoryCacheBackend()))
+    llm_client.client = Mock()
+    llm_client.client.chat.completions.create = AsyncMock(return_value=completion("answer"))
+    return llm_client
+
+
+class TestCompletionCache:
+    """Tests for deterministic completion caching."""
+
+    async def test_temperature_zero_is_served_from_cache(self, client):
+        first = await client.generate_completion(MESSAGES, temperature=0)
+        second = await client.generate_completion(MESSAGES, temperature=0)
+
+        assert first == second == "answer"
+        client.client.chat.completions.create.assert_awaited_once()
+
+    async def test_sampled_requests_are_not_cached(self, client):
+        await client.generate_completion(MESSAGES, temperature=0.7)
+        await client.generate_completion(MESSAGES, temperature=0.7)
+
+        assert client.client.chat.completions.create.await_count == 2
+
+    async def test_max_tokens_is_part_of_the_key(self, client):
+        await client.generate_completion(MESSAGES, temperature=0, max_tokens=10)
+        await client.generate_completion(MESSAGES, temperature=0, max_tokens=500)
+
+        assert client.client.chat.completions.create.await_count == 2
+
+
+class TestSingleFlight:
+    """Tests for sharing identical in-flight requests."""
+
+    async def test_concurrent_identical_requests_share_one_call(self):
+        llm_client = OpenAIClient(api_key="sk-test")
+        llm_client.client = Mock()
+        release = asyncio.Event()
+
+        async def create(**kwargs):
+            await release.wait()
+            return completion("answer")
+
+        llm_client.client.chat.completions.create = AsyncMock(side_effect=create)
+
+        requests = [
+            asyncio.create_task(llm_client.generate_completion(MESSAGES, temperature=0))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*requests) == ["answer"] * 3
+        llm_client.client.chat.completions.create.assert_awaited_once()
+        assert llm_client._inflight == {}
+
+    async def test_failure_after_callers_cancel_is_retrieved(self):
+        llm_client = OpenAIClient(api_key="sk-test")
+        llm_client.client = Mock()
+        release = asyncio.Event()
+
+        async def create(**kwargs):
+            await release.wait()
+            raise RuntimeError("upstream error")
+
+        llm_client.client.chat.completions.create = AsyncMock(side_effect=create)
+        unretrieved = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda _, context: unretrieved.append(context))
+
+        request = asyncio.create_task(llm_client.generate_completion(MESSAGES, temperature=0))
+        await asyncio.sleep(0)
+        (task,) = llm_client._inflight.values()
+        request.cancel()
+        release.set()
+        await asyncio.wait([request, task])
+        # Only the garbage collector reports an exception nobody read
+        del request, task
+        gc.collect()
+
+        assert llm_client._inflight == {}
+        assert unretrieved == []
+
+    async def test_different_max_tokens_do_not_share_a_call(self):
+        llm_client = OpenAIClient(api_key="sk-test")
+        llm_client.client = Mock()
+        release = asyncio.Event()
+
+        async def create(**kwargs):
+            await release.wait()
+            return completion(f"answer {kwargs['max_tokens']}")
+
+        llm_client.client.chat.completions.create = AsyncMock(side_effect=create)
+
+        requests = [
+            asyncio.create_task(
+                llm_client.generate_completion(MESSAGES, temperature=0, max_tokens=max_tokens)
+            )
+            for max_tokens in (10, 500)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*requests) == ["answer 10", "answer 500"]
+        assert llm_client.client.chat.completions.create.await_count == 2
+
+
+class TestStructuredOutput:
+    """Tests for structured output generation."""
+
+    async def test_sends_strict_json_schema_and_validates_locally(self, client):
+        client.client.chat.completions.create.return_value = completion(
+            '{"relevant": true, "reason": "on topic"}'
+        )
+
+        result = await client.generate_structured(MESSAGES, Verdict)
+
+        assert result == Verdict(relevant=True, reason="on topic")
+        response_format = client.client.chat.completions.create.call_args.kwargs["response_format"]
+        assert response_format["type"] == "json_schema"
+        assert response_format["json_schema"]["name"] == "Verdict"
+        assert response_format["json_schema"]["strict"] is True
+
+    async def test_structured_response_is_cached(self, client):
+        client.client.chat.completions.create.return_value = completion(
+            '{"relevant": false, "reason": "off topic"}'
+        )
+
+        first = await client.generate_structured(MESSAGES, Verdict, temperature=0)
+        second = await client.generate_structured(MESSAGES, Verdict, temperature=0)
+
+        assert first == second
+        client.client.chat.completions.create.assert_awaited_once()
+
+    async def test_sampled_structured_response_is_not_cached(self, client):
+        client.client.chat.completions.create.return_value = completion(
+            '{"relevant": false, "reason": "off topic"}'
+        )
+
+        await client.generate_structured(MESSAGES, Verdict)
+        await client.generate_structured(MESSAGES, Verdict)
+
+        assert client.client.chat.completions.create.await_count == 2
+
+    async def test_empty_content_raises(self, client):
+        client.client.chat.completions.create.return_value = completion("")
+
+        with pytest.raises(ValueError):
+            await client.generate_structured(MESSAGES, Verdict)
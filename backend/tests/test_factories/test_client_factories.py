@@ -0,0 +1,103 @@
+"""Tests for LLM client factories."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.config import Settings
+from src.exceptions import ConfigurationError, InvalidProviderError
+from src.factories import client_factories
+from src.factories.client_factories import (
+    get_llm_client,
+    init_llm_clients,
+    warm_up_llm_clients,
+)
+
+
+@pytest.fixture
+def settings():
+    test_settings = Settings(openai_api_key="sk-test", zai_api_key="zai-test")
+    with patch.object(client_factories, "settings", test_settings):
+        client_factories._create_llm_client.cache_clear()
+        yield test_settings
+        client_factories._create_llm_client.cache_clear()
+
+
+class TestGetLlmClient:
+    """Tests for cached LLM client creation."""
+
+    def test_reuses_client_for_same_provider_and_model(self, settings):
+        model = settings.get_default_model("openai")
+
+        assert get_llm_client("openai", model) is get_llm_client("openai", model)
+
+    def test_defaults_share_the_explicit_client(self, settings):
+        provider = settings.default_llm_provider
+        model = settings.get_default_model(provider)
+
+        assert get_llm_client() is get_llm_client(provider, model)
+
+    def test_providers_get_separate_clients(self, settings):
+        openai = get_llm_client("openai")
+        zai = get_llm_client("zai")
+
+        assert openai is not zai
+        assert openai.provider_name == "openai"
+        assert zai.provider_name == "zai"
+
+    def test_deprecated_openai_client_shares_cached_client(self, settings):
+        with pytest.warns(DeprecationWarning):
+            client = client_factories.get_openai_client()
+
+        assert client is get_llm_client("openai")
+
+    def test_invalid_provider_raises(self, settings):
+        with pytest.raises(InvalidProviderError):
+            get_llm_client("unknown")
+
+    def test_missing_api_key_raises(self, settings):
+        settings.zai_api_key = None
+
+        with pytest.raises(ConfigurationError) as exc_info:
+            get_llm_client("zai")
+
+        assert exc_info.value.details == {"required_env_var": "ZAI_API_KEY"}
+
+
+class TestInitLlmClients:
+    """Tests for eager client construction at startup."""
+
+    def test_creates_client_per_allowed_model(self, settings):
+        clients = init_llm_clients()
+
+        expected = [
+            (provider, model)
+            for provider in ("openai", "zai")
+            for model in settings.get_allowed_models(provider)
+        ]
+        assert [(c.provider_name, c.model) for c in clients] == expected
+        assert clients[0] is get_llm_client("openai", clients[0].model)
+
+    def test_skips_provider_without_key(self, settings):
+        settings.zai_api_key = None
+
+        clients = init_llm_clients()
+
+        assert {c.provider_name for c in clients} == {"openai"}
+
+
+class TestWarmUpLlmClients:
+    """Tests for startup connection warm-up."""
+
+    async def test_failures_do_not_raise(self, settings):
+        with (
+            patch(
+                "src.clients.openai_client.OpenAIClient.warm_up",
+                side_effect=ConnectionError("down"),
+            ) as openai_warm_up,
+            patch("src.clients.zai_client.ZAIClient.warm_up") as zai_warm_up,
+        ):
+            await warm_up_llm_clients()
+
+        openai_warm_up.assert_awaited_once()
+        zai_warm_up.assert_awaited_once()
@@ -0,0 +1,134 @@
+"""Tests for the request logging middleware."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.middleware import logging as logging_middleware
+from src.middleware.logging import LoggingMiddleware, RequestLog, ResponseLog
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(LoggingMiddleware)
+
+    @app.get("/item")
+    async def item(request: Request):
+        return {"request_id": request.state.request_id}
+
+    @app.post("/echo")
+    async def echo(body: dict):
+        return body
+
+    @app.get("/events")
+    async def events():
+        async def stream():
+            for i in range(3):
+                yield f"data: {i}\n\n"
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    return TestClient(app)
+
+
+class TestLoggingMiddleware:
+    """Tests for request IDs and body capture."""
+
+    def test_request_id_header_matches_request_state(self, client):
+        response = client.get("/item")
+
+        assert response.headers["x-request-id"] == response.json()["request_id"]
+
+    def test_reuses_incoming_request_id(self, client):
+        response = client.get("/item", headers={"X-Request-ID": "trace-42"})
+
+        assert response.json()["request_id"] == "trace-42"
+        assert response.headers["x-request-id"] == "trace-42"
+
+    def test_replaces_malformed_request_id(self, client):
+        response = client.get("/item", headers={"X-Request-ID": "bad id\nlog line"})
+
+        assert response.json()["request_id"].startswith("req_")
+
+    def test_captured_request_body_still_reaches_handler(self, client):
+        with patch.object(logging_middleware, "LOG_REQUEST_BODY", True):
+            response = client.post("/echo", json={"query": "transformers"})
+
+        assert response.json() == {"query": "transformers"}
+
+    def test_streaming_response_passes_through(self, client):
+        with patch.object(logging_middleware, "LOG_RESPONSE_BODY", True):
+            response = client.get("/events")
+
+        assert response.text == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
+        assert response.headers["x-request-id"].startswith("req_")
+
+
+class TestCaptureRequestBody:
+    """Tests for buffering request bodies for the log."""
+
+    @staticmethod
+    def scope(headers: list[tuple[bytes, bytes]]) -> dict:
+        return {"type": "http", "headers": [(b"content-type", b"application/json"), *headers]}
+
+    @staticmethod
+    def receiver(chunks: list[bytes]):
+        messages = [
+            {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+            for i, chunk in enumerate(chunks)
+        ]
+
+        async def receive():
+            return messages.pop(0)
+
+        return receive, messages
+
+    async def test_malformed_content_length_is_ignored(self):
+        req_data = RequestLog(method="POST", path="/echo", request_id="r")
+        receive, _ = self.receiver([b'{"a": 1}'])
+
+        replay = await LoggingMiddleware._capture_request_body(
+            self.scope([(b"content-length", b"ten")]), receive, req_data
+        )
+
+        assert req_data.body == '{"a": 1}'
+        assert (await replay())["body"] == b'{"a": 1}'
+
+    async def test_chunked_body_stops_buffering_at_cap(self):
+        chunk = b"x" * (logging_middleware.MAX_REQUEST_CAPTURE_BYTES // 2 + 1)
+        chunks = [chunk, chunk, b"tail"]
+        req_data = RequestLog(method="POST", path="/echo", request_id="r")
+        receive, pending = self.receiver(chunks)
+
+        replay = await LoggingMiddleware._capture_request_body(self.scope([]), receive, req_data)
+
+        assert req_data.body is not None and req_data.body.startswith("<elided")
+        assert len(pending) == 1
+        assert [(await replay())["body"] for _ in chunks] == chunks
+
+
+class TestLogData:
+    """Tests for the slotted request/response log fields."""
+
+    def test_unset_fields_are_omitted(self):
+        resp = ResponseLog("GET", "/item", "req_1", status=200, duration_ms=1.5)
+
+        assert resp.as_fields() == {
+            "method": "GET",
+            "path": "/item",
+            "request_id": "req_1",
+            "status": 200,
+            "duration_ms": 1.5,
+        }
+
+    def test_set_fields_are_included(self):
+        resp = ResponseLog("GET", "/item", "req_1", streaming=True, body="{}", body_size=2)
+
+        fields = resp.as_fields()
+        assert fields["streaming"] is True
+        assert fields["body"] == "{}"
+        assert fields["body_size"] == 2
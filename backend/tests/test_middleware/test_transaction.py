@@ -0,0 +1,53 @@
+"""Tests for the database transaction middleware."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.database import DB_SESSION_SCOPE_KEY
+from src.middleware.logging import LoggingMiddleware
+from src.middleware.transaction import TransactionMiddleware
+
+
+@pytest.fixture
+def db():
+    return AsyncMock()
+
+
+@pytest.fixture(params=["standalone", "logging"])
+def client(request, db):
+    app = FastAPI()
+    if request.param == "standalone":
+        app.add_middleware(TransactionMiddleware)
+    else:
+        app.add_middleware(LoggingMiddleware, manage_transactions=True)
+
+    @app.get("/ok")
+    async def ok(request: Request):
+        request.scope[DB_SESSION_SCOPE_KEY] = db
+        return {}
+
+    @app.get("/fail")
+    async def fail(request: Request):
+        request.scope[DB_SESSION_SCOPE_KEY] = db
+        raise RuntimeError("boom")
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+class TestTransactionMiddleware:
+    """Tests for commit and rollback around handlers."""
+
+    def test_commits_on_success(self, client, db):
+        assert client.get("/ok").status_code == 200
+
+        db.commit.assert_awaited_once()
+        db.rollback.assert_not_awaited()
+
+    def test_rolls_back_on_exception(self, client, db):
+        assert client.get("/fail").status_code == 500
+
+        db.rollback.assert_awaited_once()
+        db.commit.assert_not_awaited()
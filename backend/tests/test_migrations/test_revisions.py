@@ -0,0 +1,36 @@
+"""Tests for the Alembic revision history."""
+
+import ast
+from collections import Counter
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+VERSIONS_DIR = BACKEND_DIR / "alembic" / "versions"
+
+
+def declared_revisions() -> list[str]:
+    """Read the revision id assigned in each migration file."""
+    revisions = []
+    for path in sorted(VERSIONS_DIR.glob("*.py")):
+        for node in ast.parse(path.read_text()).body:
+            if isinstance(node, ast.AnnAssign) and getattr(node.target, "id", None) == "revision":
+                revisions.append(ast.literal_eval(node.value))
+    return revisions
+
+
+class TestRevisionHistory:
+    """Guards against diverging copies of the same revision."""
+
+    def test_revision_ids_are_unique(self):
+        duplicates = [rev for rev, n in Counter(declared_revisions()).items() if n > 1]
+
+        assert duplicates == []
+
+    def test_history_is_linear(self):
+        script = ScriptDirectory.from_config(Config(str(BACKEND_DIR / "alembic.ini")))
+
+        assert len(script.get_heads()) == 1
+        assert len(list(script.walk_revisions())) == len(declared_revisions())
@@ -0,0 +1,77 @@
+"""Tests for AgentExecutionRepository single-statement writes."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy import inspect
+
+from src.repositories.agent_execution_repository import AgentExecutionRepository
+
+
+def make_session(result: MagicMock) -> AsyncMock:
+    session = AsyncMock()
+    session.execute.return_value = result
+    session.expunge = MagicMock()
+    return session
+
+
+class TestSaveState:
+    """Tests for inserting execution states."""
+
+    async def test_insert_returns_execution_without_refresh(self):
+        execution = MagicMock(id=uuid.uuid4())
+        result = MagicMock()
+        result.scalar_one.return_value = execution
+        session = make_session(result)
+
+        saved = await AgentExecutionRepository(session).save_state("s1", {"step": 1})
+
+        assert saved is execution
+        session.expunge.assert_called_once_with(execution)
+        session.refresh.assert_not_called()
+
+
+class TestDelete:
+    """Tests for deleting executions by ID."""
+
+    async def test_deletes_without_loading_row(self):
+        session = make_session(MagicMock(rowcount=1))
+
+        assert await AgentExecutionRepository(session).delete(uuid.uuid4()) is True
+        session.execute.assert_awaited_once()
+        session.commit.assert_awaited_once()
+
+    async def test_missing_execution_skips_commit(self):
+        session = make_session(MagicMock(rowcount=0))
+
+        assert await AgentExecutionRepository(session).delete(uuid.uuid4()) is False
+        session.commit.assert_not_called()
+
+
+class TestUpdateStatus:
+    """Tests for status updates through UPDATE ... RETURNING."""
+
+    async def test_returns_detached_execution(self):
+        execution_id = uuid.uuid4()
+        row = MagicMock()
+        row._mapping = {"id": execution_id, "session_id": "s1", "status": "paused"}
+        result = MagicMock()
+        result.one_or_none.return_value = row
+        session = make_session(result)
+
+        updated = await AgentExecutionRepository(session).update_status(execution_id, "paused")
+
+        assert updated is not None
+        assert (updated.id, updated.status) == (execution_id, "paused")
+        assert inspect(updated).detached
+        session.expunge.assert_not_called()
+        session.execute.assert_awaited_once()
+        session.refresh.assert_not_called()
+
+    async def test_missing_execution_returns_none(self):
+        result = MagicMock()
+        result.one_or_none.return_value = None
+        session = make_session(result)
+
+        assert await AgentExecutionRepository(session).update_status(uuid.uuid4(), "failed") is None
+        session.commit.assert_not_called()
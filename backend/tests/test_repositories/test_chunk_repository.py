@@ -0,0 +1,132 @@
+"""Tests for ChunkRepository bulk loading helpers."""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+from pgvector import HalfVector
+
+from src.repositories.chunk_repository import COPY_COLUMNS, COPY_THRESHOLD, ChunkRepository
+
+
+def make_chunk(index: int, **overrides) -> dict:
+    data = {
+        "paper_id": "00000000-0000-0000-0000-000000000001",
+        "arxiv_id": "2401.00001",
+        "chunk_text": f'Chunk "{index}", with comma\nand newline',
+        "chunk_index": index,
+        "section_name": "Intro",
+        "page_number": 1,
+        "word_count": 5,
+        "embedding": [0.5, -1.25],
+    }
+    data.update(overrides)
+    return data
+
+
+class TestCreateBulk:
+    """Tests for multi-row INSERT ... RETURNING."""
+
+    async def test_returns_inserted_chunks_without_refresh(self):
+        chunks = [MagicMock(), MagicMock()]
+        result = MagicMock()
+        result.all.return_value = chunks
+        session = AsyncMock()
+        session.scalars.return_value = result
+        session.expunge = MagicMock()
+
+        created = await ChunkRepository(session).create_bulk([make_chunk(0), make_chunk(1)])
+
+        assert created == chunks
+        session.scalars.assert_awaited_once()
+        session.refresh.assert_not_called()
+
+    async def test_large_batches_use_copy(self, monkeypatch):
+        chunks_data = [make_chunk(i) for i in range(COPY_THRESHOLD)]
+        result = MagicMock()
+        loaded = MagicMock()
+        result.all.return_value = [loaded]
+        session = AsyncMock()
+        session.scalars.return_value = result
+        session.expunge = MagicMock()
+        repository = ChunkRepository(session)
+        copy_records = AsyncMock()
+        monkeypatch.setattr(repository, "_copy_records", copy_records)
+
+        created = await repository.create_bulk(chunks_data)
+
+        copy_records.assert_awaited_once_with(chunks_data)
+        assert created == [loaded]
+        session.expunge.assert_called_once_with(loaded)
+        session.commit.assert_awaited_once()
+
+    async def test_copy_starts_the_session_transaction_first(self):
+        conn = AsyncMock()
+        driver_conn = conn.get_raw_connection.return_value.driver_connection
+        session = AsyncMock()
+        session.connection.return_value = conn
+        calls = MagicMock()
+        calls.attach_mock(conn.exec_driver_sql, "exec_driver_sql")
+        calls.attach_mock(driver_conn.copy_records_to_table, "copy")
+        calls.attach_mock(session.commit, "commit")
+
+        await ChunkRepository(session).copy_bulk([make_chunk(0)])
+
+        assert [name for name, _, _ in calls.mock_calls] == ["exec_driver_sql", "copy", "commit"]
+
+    async def test_empty_input_skips_insert(self):
+        session = AsyncMock()
+
+        assert await ChunkRepository(session).create_bulk([]) == []
+        session.scalars.assert_not_called()
+
+
+class TestCopyRecords:
+    """Tests for binary COPY record building."""
+
+    def test_record_matches_copy_columns(self):
+        record = ChunkRepository._to_record(make_chunk(0))
+
+        assert len(record) == len(COPY_COLUMNS)
+        assert record[COPY_COLUMNS.index("chunk_text")] == 'Chunk "0", with comma\nand newline'
+        assert record[COPY_COLUMNS.index("embedding")] == [0.5, -1.25]
+
+    def test_id_left_to_database(self):
+        assert "id" not in COPY_COLUMNS
+
+    def test_nullable_values_stay_none(self):
+        chunk = make_chunk(0, section_name=None, page_number=None, word_count=None)
+        record = ChunkRepository._to_record(chunk)
+
+        assert record[COPY_COLUMNS.index("page_number")] is None
+        assert record[COPY_COLUMNS.index("section_name")] is None
+
+
+class TestGetEmbeddings:
+    """Tests for loading embeddings into a packed matrix."""
+
+    async def test_rows_are_packed_as_float32(self):
+        ids = [uuid.uuid4(), uuid.uuid4()]
+        result = MagicMock()
+        result.all.return_value = [
+            SimpleNamespace(id=ids[0], embedding=HalfVector([0.5, -1.25, 2.0])),
+            SimpleNamespace(id=ids[1], embedding=HalfVector([1.0, 0.0, -0.5])),
+        ]
+        session = AsyncMock()
+        session.execute.return_value = result
+
+        chunk_ids, matrix = await ChunkRepository(session).get_embeddings(ids)
+
+        assert chunk_ids == [str(chunk_id) for chunk_id in ids]
+        assert matrix.dtype == np.float32
+        np.testing.assert_array_equal(matrix, [[0.5, -1.25, 2.0], [1.0, 0.0, -0.5]])
+
+    async def test_no_ids_skips_query(self):
+        session = AsyncMock()
+
+        chunk_ids, matrix = await ChunkRepository(session).get_embeddings([])
+
+        assert chunk_ids == []
+        assert matrix.shape == (0, 0)
+        session.execute.assert_not_called()
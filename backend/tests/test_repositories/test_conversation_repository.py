@@ -0,0 +1,67 @@
+"""Tests for ConversationRepository batched turn writes."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from src.repositories.conversation_repository import ConversationRepository
+from src.schemas.conversation import TurnData
+
+TURNS = [
+    TurnData(user_query=f"q{i}", agent_response=f"a{i}", provider="openai", model="m")
+    for i in range(3)
+]
+
+
+def make_session() -> AsyncMock:
+    session = AsyncMock()
+    session.expire_all = MagicMock()
+    return session
+
+
+def inserted_rows(session: AsyncMock) -> list[dict]:
+    return [row for call in session.execute.await_args_list[1:] for row in call.args[1]]
+
+
+class TestSaveTurns:
+    """Tests for lock-free numbering of batched turns."""
+
+    async def test_numbers_turns_after_latest(self):
+        conversation_id = uuid.uuid4()
+        session = make_session()
+        session.scalar.side_effect = [conversation_id, 4]
+
+        saved = await ConversationRepository(session).save_turns("s1", TURNS, batch_size=2)
+
+        assert saved == 3
+        rows = inserted_rows(session)
+        assert [row["turn_number"] for row in rows] == [5, 6, 7]
+        assert {row["conversation_id"] for row in rows} == {conversation_id}
+        session.commit.assert_awaited_once()
+
+    async def test_conflict_renumbers_and_retries(self):
+        conversation_id = uuid.uuid4()
+        session = make_session()
+        session.scalar.side_effect = [conversation_id, None, conversation_id, 0]
+        conflict = IntegrityError("INSERT", None, Exception("duplicate key"))
+        session.execute.side_effect = [None, conflict, None, None]
+
+        saved = await ConversationRepository(session).save_turns("s1", TURNS)
+
+        assert saved == 3
+        session.rollback.assert_awaited_once()
+        retried = session.execute.await_args_list[3].args[1]
+        assert [row["turn_number"] for row in retried] == [1, 2, 3]
+
+    async def test_gives_up_after_max_retries(self):
+        session = make_session()
+        session.scalar.return_value = None
+        conflict = IntegrityError("INSERT", None, Exception("duplicate key"))
+        session.execute.side_effect = [None, conflict] * 3
+
+        with pytest.raises(IntegrityError):
+            await ConversationRepository(session).save_turns("s1", TURNS)
+
+        session.commit.assert_not_called()
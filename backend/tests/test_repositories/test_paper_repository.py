@@ -0,0 +1,112 @@
+"""Tests for PaperRepository listing."""
+
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import inspect
+
+from src.repositories.paper_repository import PaperRepository
+from src.utils.count_cache import CountCache
+
+
+@pytest.fixture
+def session():
+    session = AsyncMock()
+    session.scalar.return_value = 42
+    session.execute.return_value = MagicMock()
+    return session
+
+
+@pytest.fixture
+def count_cache():
+    return CountCache(ttl=30.0)
+
+
+class TestGetAll:
+    """Tests for counting and pagination in get_all."""
+
+    async def test_unfiltered_count_is_cached(self, session, count_cache):
+        repository = PaperRepository(session, count_cache=count_cache)
+
+        await repository.get_all()
+        _, total = await repository.get_all(offset=20)
+
+        assert total == 42
+        assert session.scalar.await_count == 1
+
+    async def test_invalidate_count_recounts(self, session, count_cache):
+        repository = PaperRepository(session, count_cache=count_cache)
+
+        await repository.get_all()
+        repository.invalidate_count()
+        await repository.get_all()
+
+        assert session.scalar.await_count == 2
+
+    async def test_delete_leaves_count_until_invalidated(self, session, count_cache):
+        repository = PaperRepository(session, count_cache=count_cache)
+        count_cache.set(42)
+        session.execute.return_value = MagicMock(rowcount=1)
+
+        assert await repository.delete_by_arxiv_id("2401.00001")
+        assert count_cache.get() == 42
+
+    async def test_filtered_count_is_not_cached(self, session, count_cache):
+        repository = PaperRepository(session, count_cache=count_cache)
+
+        await repository.get_all(category_filter="cs.LG")
+        await repository.get_all(category_filter="cs.LG")
+
+        assert session.scalar.await_count == 2
+
+    async def test_cursor_replaces_offset(self, session):
+        cursor = (datetime(2024, 1, 1, tzinfo=timezone.utc), uuid.uuid4())
+
+        await PaperRepository(session).get_all(offset=40, cursor=cursor)
+
+        sql = str(session.execute.await_args.args[0])
+        assert "OFFSET" not in sql
+        assert "(papers.created_at, papers.id) <" in sql
+
+
+class TestUpdate:
+    """Tests for UPDATE ... RETURNING."""
+
+    async def test_returns_detached_paper_after_commit(self, session):
+        paper_id = uuid.uuid4()
+        row = MagicMock()
+        row._mapping = {"id": paper_id, "arxiv_id": "2401.00001", "title": "New"}
+        session.execute.return_value.one_or_none.return_value = row
+
+        updated = await PaperRepository(session).update(str(paper_id), {"title": "New"})
+
+        assert updated is not None
+        assert (updated.id, updated.title) == (paper_id, "New")
+        assert inspect(updated).detached
+        session.execute.assert_awaited_once()
+        session.commit.assert_awaited_once()
+
+    async def test_missing_paper_returns_none(self, session):
+        session.execute.return_value.one_or_none.return_value = None
+
+        assert await PaperRepository(session).update(str(uuid.uuid4()), {"title": "New"}) is None
+
+
+class TestExistsMany:
+    """Tests for batch existence checks."""
+
+    async def test_returns_stored_subset(self, session):
+        result = MagicMock()
+        result.all.return_value = ["2401.00001"]
+        session.scalars.return_value = result
+
+        stored = await PaperRepository(session).exists_many(["2401.00001", "2401.00002"])
+
+        assert stored == {"2401.00001"}
+        session.scalars.assert_awaited_once()
+
+    async def test_empty_input_skips_query(self, session):
+        assert await PaperRepository(session).exists_many([]) == set()
+        session.scalars.assert_not_called()
@@ -0,0 +1,50 @@
+"""Tests for the shared agent graph."""
+
+from typing import TypedDict
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+
+from src.services.agent_service.graph_builder import (
+    agent_run_config,
+    build_agent_graph,
+    create_node_wrapper,
+)
+
+
+class CounterState(TypedDict):
+    value: object
+
+
+async def record_context(state, context):
+    return {"value": context}
+
+
+class TestAgentGraph:
+    """Tests for compiling the graph once and passing context per run."""
+
+    def test_graph_is_compiled_once(self):
+        assert build_agent_graph() is build_agent_graph()
+
+    async def test_nodes_receive_context_from_run_config(self):
+        workflow = StateGraph(CounterState)
+        workflow.add_node("node", create_node_wrapper(record_context))
+        workflow.add_edge(START, "node")
+        workflow.add_edge("node", END)
+        graph = workflow.compile()
+
+        first = await graph.ainvoke({"value": None}, config=agent_run_config("first"))
+        second = await graph.ainvoke({"value": None}, config=agent_run_config("second"))
+
+        assert first["value"] == "first"
+        assert second["value"] == "second"
+
+    async def test_missing_context_raises_clear_error(self):
+        workflow = StateGraph(CounterState)
+        workflow.add_node("node", create_node_wrapper(record_context))
+        workflow.add_edge(START, "node")
+        workflow.add_edge("node", END)
+        graph = workflow.compile()
+
+        with pytest.raises(RuntimeError, match="agent_run_config"):
+            await graph.ainvoke({"value": None})
@@ -0,0 +1,71 @@
+"""Tests for IngestService batch PDF downloads."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+
+from src.schemas.ingest import IngestRequest
+from src.services.ingest_service import IngestService
+
+
+def paper(arxiv_id: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        arxiv_id=arxiv_id, title=f"Paper {arxiv_id}", pdf_url=f"https://arxiv.org/pdf/{arxiv_id}"
+    )
+
+
+def make_service(papers, stored_ids=()) -> IngestService:
+    arxiv_client = MagicMock()
+    arxiv_client.search_papers = AsyncMock(return_value=papers)
+    arxiv_client.download_pdfs_bulk = AsyncMock(
+        side_effect=lambda downloads: [
+            httpx.ConnectError("refused") if "broken" in url else path for url, path in downloads
+        ]
+    )
+    paper_repository = MagicMock()
+    paper_repository.exists_many = AsyncMock(return_value=set(stored_ids))
+    pdf_parser = MagicMock()
+    pdf_parser.parse_pdf = AsyncMock(side_effect=RuntimeError("parser reached"))
+    return IngestService(
+        arxiv_client=arxiv_client,
+        pdf_parser=pdf_parser,
+        embeddings_client=MagicMock(),
+        chunking_service=MagicMock(),
+        paper_repository=paper_repository,
+        chunk_repository=MagicMock(),
+    )
+
+
+class TestIngestDownloads:
+    """Tests for prefetching a batch's PDFs."""
+
+    async def test_batch_is_downloaded_in_one_call(self):
+        service = make_service([paper("2401.00001"), paper("2401.00002"), paper("2401.00003")])
+
+        await service.ingest_papers(IngestRequest(query="attention"))
+
+        service.arxiv_client.download_pdfs_bulk.assert_awaited_once()
+        (downloads,) = service.arxiv_client.download_pdfs_bulk.await_args.args
+        assert [url for url, _ in downloads] == [
+            "https://arxiv.org/pdf/2401.00001",
+            "https://arxiv.org/pdf/2401.00002",
+            "https://arxiv.org/pdf/2401.00003",
+        ]
+
+    async def test_stored_papers_are_not_downloaded(self):
+        service = make_service([paper("2401.00001"), paper("2401.00002")], {"2401.00001"})
+
+        await service.ingest_papers(IngestRequest(query="attention"))
+
+        (downloads,) = service.arxiv_client.download_pdfs_bulk.await_args.args
+        assert [url for url, _ in downloads] == ["https://arxiv.org/pdf/2401.00002"]
+
+    async def test_failed_download_is_reported_per_paper(self):
+        service = make_service([paper("broken"), paper("2401.00002")])
+
+        response = await service.ingest_papers(IngestRequest(query="attention"))
+
+        errors = {error.arxiv_id: error.error for error in response.errors}
+        assert "download" in errors["broken"]
+        assert "parser reached" in errors["2401.00002"]
@@ -0,0 +1,79 @@
+"""Tests for deferred logging."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import structlog
+
+from src.utils import async_log
+from src.utils.async_log import emit, start_log_worker, stop_log_worker
+
+
+@pytest.fixture
+def logger():
+    return MagicMock()
+
+
+class TestEmit:
+    """Tests for queueing log calls to the background worker."""
+
+    def test_logs_inline_without_worker(self, logger):
+        emit(logger, "info", "request", {"path": "/"})
+
+        logger.info.assert_called_once_with("request", path="/")
+
+    def test_converts_log_fields_objects(self, logger):
+        fields = MagicMock()
+        fields.as_fields.return_value = {"status": 200}
+
+        emit(logger, "info", "response", fields)
+
+        logger.info.assert_called_once_with("response", status=200)
+
+    async def test_worker_writes_queued_records(self, logger):
+        start_log_worker()
+        emit(logger, "warning", "response", {"status": 404})
+        logger.warning.assert_not_called()
+
+        await stop_log_worker()
+
+        logger.warning.assert_called_once()
+        assert logger.warning.call_args.args == ("response",)
+        assert logger.warning.call_args.kwargs["status"] == 404
+
+    async def test_drops_records_when_full(self, logger, monkeypatch):
+        monkeypatch.setattr(async_log, "dropped", 0)
+        start_log_worker(max_size=1)
+        emit(logger, "info", "first", {})
+        emit(logger, "info", "second", {})
+
+        await stop_log_worker()
+
+        assert async_log.dropped == 1
+        logger.info.assert_called_once()
+        assert logger.info.call_args.args == ("first",)
+
+    async def test_counts_and_reports_write_failures(self, logger, monkeypatch, capsys):
+        monkeypatch.setattr(async_log, "failed", 0)
+        logger.info.side_effect = [ValueError("bad field"), None]
+        start_log_worker()
+        emit(logger, "info", "broken", {})
+        emit(logger, "info", "fine", {})
+
+        await stop_log_worker()
+
+        assert async_log.failed == 1
+        assert "'broken'" in capsys.readouterr().err
+        assert logger.info.call_count == 2
+
+    async def test_records_keep_emit_time_and_context(self, logger, monkeypatch):
+        monkeypatch.setattr(async_log, "time", MagicMock(time=lambda: 0.0))
+        start_log_worker()
+        with structlog.contextvars.bound_contextvars(user="u1", status=500):
+            emit(logger, "info", "response", {"status": 200})
+
+        await stop_log_worker()
+
+        logger.info.assert_called_once_with(
+            "response", user="u1", status=200, timestamp="1970-01-01 00:00:00"
+        )
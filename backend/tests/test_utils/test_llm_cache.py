@@ -0,0 +1,133 @@
+"""Tests for the LLM response cache."""
+
+import time
+
+import pytest
+
+from src.utils.llm_cache import LLMResponseCache, MemoryCacheBackend, SemanticCache
+
+
+class TestMemoryCacheBackend:
+    """Tests for the in-process LRU backend."""
+
+    async def test_evicts_least_recently_used(self):
+        backend = MemoryCacheBackend(max_entries=2)
+        await backend.set("a", "1")
+        await backend.set("b", "2")
+        await backend.get("a")
+        await backend.set("c", "3")
+
+        assert await backend.get("a") == "1"
+        assert await backend.get("b") is None
+        assert await backend.get("c") == "3"
+
+    async def test_expired_entries_miss(self, monkeypatch):
+        backend = MemoryCacheBackend()
+        await backend.set("a", "1", ttl=10)
+
+        now = time.monotonic()
+        monkeypatch.setattr("src.utils.llm_cache.time.monotonic", lambda: now + 11)
+
+        assert await backend.get("a") is None
+
+
+class TestLLMResponseCache:
+    """Tests for key building and hit/miss accounting."""
+
+    def test_key_ignores_dict_ordering(self):
+        first = LLMResponseCache.make_key("openai", "m", [{"role": "user", "content": "hi"}], 0)
+        second = LLMResponseCache.make_key("openai", "m", [{"content": "hi", "role": "user"}], 0)
+
+        assert first == second
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"provider": "zai"},
+            {"model": "other"},
+            {"temperature": 0.5},
+            {"max_tokens": 10},
+            {"response_format": {"type": "json_schema"}},
+        ],
+    )
+    def test_key_depends_on_request(self, change):
+        request = {
+            "provider": "openai",
+            "model": "m",
+            "messages": [{"role": "user", "content": "hi"}],
+            "temperature": 0,
+        }
+
+        assert LLMResponseCache.make_key(**request) != LLMResponseCache.make_key(
+            **{**request, **change}
+        )
+
+    async def test_counts_hits_and_misses(self):
+        cache = LLMResponseCache(MemoryCacheBackend())
+
+        assert await cache.get("k") is None
+        await cache.set("k", "v")
+        assert await cache.get("k") == "v"
+
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+        assert cache.stats.hit_rate == 0.5
+
+
+EMBEDDINGS = {
+    "What is attention?": [1.0, 0.0, 0.0],
+    "Explain attention": [0.98, 0.2, 0.0],
+    "How do GANs work?": [0.0, 1.0, 0.0],
+}
+
+
+async def fake_embed(text: str) -> list[float]:
+    return EMBEDDINGS[text]
+
+
+def prompt(question: str, system: str = "You are helpful.") -> list[dict]:
+    return [{"role": "system", "content": system}, {"role": "user", "content": question}]
+
+
+class TestSemanticCache:
+    """Tests for similarity-based lookups."""
+
+    async def store(self, cache: SemanticCache, question: str, response: str) -> None:
+        _, slot = await cache.lookup("openai", "m", prompt(question), 0.3)
+        cache.store(slot, response)
+
+    async def test_paraphrase_hits(self):
+        cache = SemanticCache(fake_embed, threshold=0.9)
+        await self.store(cache, "What is attention?", "cached answer")
+
+        response, slot = await cache.lookup("openai", "m", prompt("Explain attention"), 0.3)
+
+        assert response == "cached answer"
+        assert slot is None
+        assert cache.stats.hits == 1
+
+    async def test_unrelated_prompt_misses(self):
+        cache = SemanticCache(fake_embed, threshold=0.9)
+        await self.store(cache, "What is attention?", "cached answer")
+
+        response, slot = await cache.lookup("openai", "m", prompt("How do GANs work?"), 0.3)
+
+        assert response is None
+        assert slot is not None
+
+    async def test_different_context_never_matches(self):
+        cache = SemanticCache(fake_embed, threshold=0.9)
+        await self.store(cache, "What is attention?", "cached answer")
+
+        response, _ = await cache.lookup(
+            "openai", "m", prompt("What is attention?", system="Rewrite the query."), 0.3
+        )
+
+        assert response is None
+
+    async def test_embedding_failure_skips_cache(self):
+        async def failing_embed(text: str) -> list[float]:
+            raise ConnectionError("down")
+
+        cache = SemanticCache(failing_embed)
+
+        assert await cache.lookup("openai", "m", prompt("What is attention?")) == (None, None)
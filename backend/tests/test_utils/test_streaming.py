@@ -0,0 +1,58 @@
+"""Tests for streamed output coalescing."""
+
+import asyncio
+
+import pytest
+
+from src.utils.streaming import coalesce_stream
+
+
+async def burst(*chunks: str):
+    for chunk in chunks:
+        yield chunk
+
+
+async def collect(chunks, **kwargs) -> list[str]:
+    return [text async for text in coalesce_stream(chunks, **kwargs)]
+
+
+class TestCoalesceStream:
+    """Tests for merging back-to-back chunks."""
+
+    async def test_burst_is_joined(self):
+        assert "".join(await collect(burst("a", "b", "c"))) == "abc"
+        assert len(await collect(burst("a", "b", "c"))) < 3
+
+    async def test_flushes_at_size_limit(self):
+        result = await collect(burst("aaaa", "bbbb", "cccc"), flush_chars=4)
+
+        assert result == ["aaaa", "bbbb", "cccc"]
+
+    async def test_slow_chunks_are_not_delayed(self):
+        async def slow():
+            yield "first"
+            await asyncio.sleep(0.01)
+            yield "second"
+
+        assert await collect(slow()) == ["first", "second"]
+
+    async def test_source_errors_propagate(self):
+        async def failing():
+            yield "partial"
+            raise RuntimeError("stream broke")
+
+        with pytest.raises(RuntimeError, match="stream broke"):
+            await collect(failing())
+
+    async def test_buffered_text_is_yielded_before_the_error(self):
+        async def failing():
+            yield "one"
+            yield "two"
+            raise RuntimeError("stream broke")
+
+        received = []
+        with pytest.raises(RuntimeError, match="stream broke"):
+            async for text in coalesce_stream(failing()):
+                received.append(text)
+
+        assert "".join(received) == "onetwo"
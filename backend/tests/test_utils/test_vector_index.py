@@ -0,0 +1,22 @@
+"""Tests for HNSW tuning helpers."""
+
+from src.utils.vector_index import configure_hnsw_params
+
+
+class TestConfigureHnswParams:
+    """Tests for corpus-size tiered HNSW parameters."""
+
+    def test_small_corpus_uses_pgvector_defaults(self):
+        assert configure_hnsw_params(10_000) == {"m": 16, "ef_construction": 64, "ef_search": 40}
+
+    def test_medium_corpus_uses_index_defaults(self):
+        params = configure_hnsw_params(250_000)
+        assert params == {"m": 24, "ef_construction": 128, "ef_search": 100}
+
+    def test_tier_boundary_moves_to_next_tier(self):
+        assert configure_hnsw_params(100_000)["m"] == 24
+
+    def test_large_corpus_widens_search(self):
+        params = configure_hnsw_params(5_000_000)
+        assert params["m"] == 32
+        assert params["ef_search"] >= params["m"]